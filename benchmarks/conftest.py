@@ -0,0 +1,47 @@
+import math
+from collections.abc import Callable, Generator
+
+import numpy as np
+import pytest
+
+from pyautd3 import AUTD3, Controller, Silencer
+from pyautd3.driver.link import Link
+from pyautd3.link.audit import Audit
+from pyautd3.link.nop import Nop
+
+LINKS: dict[str, Callable[[], Link]] = {"nop": Nop, "audit": Audit}
+NUM_DEVICES = [1, 4, 9]
+
+
+def devices(n: int) -> list[AUTD3]:
+    cols = math.ceil(math.sqrt(n))
+    return [AUTD3(pos=[(i % cols) * AUTD3.DEVICE_WIDTH, (i // cols) * AUTD3.DEVICE_HEIGHT, 0.0], rot=[1.0, 0.0, 0.0, 0.0]) for i in range(n)]
+
+
+def focus_points(autd: Controller, n: int) -> np.ndarray:
+    theta = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+    return autd.center() + np.stack([30.0 * np.cos(theta), 30.0 * np.sin(theta), np.full(n, 150.0)], axis=1)
+
+
+@pytest.fixture(params=list(LINKS))
+def link(request: pytest.FixtureRequest) -> Callable[[], Link]:
+    return LINKS[request.param]
+
+
+@pytest.fixture(params=NUM_DEVICES, ids=lambda n: f"dev{n}")
+def num_devices(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture
+def autd(link: Callable[[], Link], num_devices: int) -> Generator[Controller]:
+    with Controller.open(devices(num_devices), link()) as autd:
+        autd.send(Silencer.disable())
+        yield autd
+
+
+@pytest.fixture
+def audit(num_devices: int) -> Generator[Controller[Audit]]:
+    with Controller.open(devices(num_devices), Audit()) as autd:
+        autd.send(Silencer.disable())
+        yield autd
@@ -0,0 +1,81 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyautd3 import Controller, Drive, Intensity, Phase, Segment, rad
+from pyautd3.driver.datagram import Datagram
+from pyautd3.driver.geometry import Device, Transducer
+from pyautd3.driver.link import Link
+from pyautd3.gain import Bessel, BesselOption, Custom, Focus, FocusOption, Group, Null, Plane, PlaneOption, Uniform
+from pyautd3.link.audit import Audit
+from pyautd3.modulation import Static
+
+from .conftest import devices
+
+GAINS: dict[str, Callable[[Controller], Datagram]] = {
+    "null": lambda _: Null(),
+    "uniform": lambda _: Uniform(intensity=Intensity(0xFF), phase=Phase(0)),
+    "focus": lambda autd: Focus(pos=autd.center() + np.array([0.0, 0.0, 150.0]), option=FocusOption()),
+    "bessel": lambda autd: Bessel(apex=autd.center(), direction=[0.0, 0.0, 1.0], theta=0.1 * rad, option=BesselOption()),
+    "plane": lambda _: Plane(direction=[0.0, 0.0, 1.0], option=PlaneOption()),
+    "custom": lambda _: Custom(lambda _dev: lambda tr: Drive(phase=Phase(tr.idx()), intensity=Intensity.MAX)),
+    "custom_from_arrays": lambda autd: Custom.from_arrays(
+        np.arange(autd.num_transducers()) % 0x100,
+        np.full(autd.num_transducers(), 0xFF),
+    ),
+    "group": lambda autd: Group(
+        key_map=lambda dev: lambda tr: "null" if tr.position()[0] < dev.center()[0] else "focus",
+        gain_map={"null": Null(), "focus": Focus(pos=autd.center() + np.array([0.0, 0.0, 150.0]), option=FocusOption())},
+    ),
+}
+
+
+@pytest.mark.parametrize("num", [1, 4, 9, 16], ids=lambda n: f"dev{n}")
+def test_open(benchmark: BenchmarkFixture, link: Callable[[], Link], num: int):
+    def open_close() -> None:
+        Controller.open(devices(num), link()).close()
+
+    benchmark(open_close)
+
+
+def test_send_static(benchmark: BenchmarkFixture, autd: Controller):
+    benchmark(autd.send, Static())
+
+
+@pytest.mark.parametrize("name", list(GAINS))
+def test_send_gain(benchmark: BenchmarkFixture, autd: Controller, name: str):
+    g = GAINS[name](autd)
+    benchmark(autd.send, g)
+
+
+@pytest.mark.parametrize("name", ["focus", "custom_from_arrays", "group"])
+def test_send_prepared_gain(benchmark: BenchmarkFixture, autd: Controller, name: str):
+    d = autd.prepare(GAINS[name](autd))
+    benchmark(autd.send, d)
+
+
+def test_drives_readback(benchmark: BenchmarkFixture, audit: Controller[Audit]):
+    audit.send(GAINS["focus"](audit))
+
+    def readback() -> None:
+        for dev in audit.geometry():
+            audit.link().drives_at(dev.idx(), Segment.S0, 0)
+
+    benchmark(readback)
+
+
+def test_modulation_readback(benchmark: BenchmarkFixture, audit: Controller[Audit]):
+    def readback() -> None:
+        for dev in audit.geometry():
+            audit.link().modulation_buffer(dev.idx(), Segment.S0)
+
+    benchmark(readback)
+
+
+def test_geometry_iteration(benchmark: BenchmarkFixture, audit: Controller[Audit]):
+    def iterate(dev: Device) -> list[Transducer]:
+        return list(dev)
+
+    benchmark(lambda: [iterate(dev) for dev in audit.geometry()])
@@ -0,0 +1,24 @@
+from collections.abc import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyautd3 import Controller
+from pyautd3.gain.holo import GS, GSPAT, Greedy, GreedyOption, GSOption, GSPATOption, Naive, NaiveOption, Pa
+from pyautd3.gain.holo.holo import Holo
+
+from .conftest import focus_points
+
+SOLVERS: dict[str, Callable[[list], Holo]] = {
+    "gs": lambda foci: GS(foci=foci, option=GSOption()),
+    "gspat": lambda foci: GSPAT(foci=foci, option=GSPATOption()),
+    "naive": lambda foci: Naive(foci=foci, option=NaiveOption()),
+    "greedy": lambda foci: Greedy(foci=foci, option=GreedyOption()),
+}
+
+
+@pytest.mark.parametrize("num_foci", [2, 8, 32], ids=lambda n: f"foci{n}")
+@pytest.mark.parametrize("solver", list(SOLVERS))
+def test_send_holo(benchmark: BenchmarkFixture, autd: Controller, solver: str, num_foci: int):
+    g = SOLVERS[solver]([(p, 5e3 * Pa) for p in focus_points(autd, num_foci)])
+    benchmark(autd.send, g)
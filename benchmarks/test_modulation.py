@@ -0,0 +1,27 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyautd3 import Controller, Hz, SamplingConfig
+from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.modulation import Custom, Fourier, FourierOption, Sine, SineOption, Square, SquareOption, Static
+
+MODULATIONS: dict[str, Callable[[], Modulation]] = {
+    "static": Static,
+    "sine": lambda: Sine(freq=150 * Hz, option=SineOption()),
+    "sine_nearest": lambda: Sine(freq=150.0 * Hz, option=SineOption()).into_nearest(),
+    "square": lambda: Square(freq=150 * Hz, option=SquareOption()),
+    "fourier": lambda: Fourier(
+        components=[Sine(freq=f * Hz, option=SineOption()) for f in (100, 150, 200)],
+        option=FourierOption(),
+    ),
+    "custom": lambda: Custom(buffer=np.arange(4000) % 0x100, sampling_config=SamplingConfig.FREQ_4K),
+}
+
+
+@pytest.mark.parametrize("name", list(MODULATIONS))
+def test_send_modulation(benchmark: BenchmarkFixture, autd: Controller, name: str):
+    m = MODULATIONS[name]()
+    benchmark(autd.send, m)
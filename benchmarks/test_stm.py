@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyautd3 import Controller, FociSTM, GainSTM, GainSTMOption, Hz, SamplingConfig
+from pyautd3.driver.datagram.stm.control_point import ControlPoints
+from pyautd3.gain import Focus, FocusOption
+
+from .conftest import focus_points
+
+
+@pytest.mark.parametrize("size", [100, 1000, 8000], ids=lambda n: f"len{n}")
+def test_foci_stm(benchmark: BenchmarkFixture, autd: Controller, size: int):
+    stm = FociSTM(foci=list(focus_points(autd, size)), config=1.0 * Hz)
+    benchmark(autd.send, stm)
+
+
+@pytest.mark.parametrize("n", [1, 4, 8], ids=lambda n: f"n{n}")
+@pytest.mark.parametrize("size", [100, 1000, 8000], ids=lambda n: f"len{n}")
+def test_foci_stm_control_points(benchmark: BenchmarkFixture, autd: Controller, size: int, n: int):
+    points = focus_points(autd, size)
+    stm = FociSTM(foci=[ControlPoints(points=[p] * n) for p in points], config=1.0 * Hz)
+    benchmark(autd.send, stm)
+
+
+@pytest.mark.parametrize("n", [1, 4, 8], ids=lambda n: f"n{n}")
+@pytest.mark.parametrize("size", [100, 1000, 8000], ids=lambda n: f"len{n}")
+def test_foci_stm_from_array(benchmark: BenchmarkFixture, autd: Controller, size: int, n: int):
+    points = np.repeat(focus_points(autd, size)[:, np.newaxis, :], n, axis=1)
+    benchmark(lambda: autd.send(FociSTM.from_array(points, 1.0 * Hz)))
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000], ids=lambda n: f"len{n}")
+def test_gain_stm(benchmark: BenchmarkFixture, autd: Controller, size: int):
+    stm = GainSTM(gains=[Focus(pos=p, option=FocusOption()) for p in focus_points(autd, size)], config=SamplingConfig(0xFFFF), option=GainSTMOption())
+    benchmark(autd.send, stm)
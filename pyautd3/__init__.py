@@ -24,7 +24,7 @@ from .driver.datagram import (
     WithFiniteLoop,
     WithSegment,
 )
-from .driver.datagram.stm import ControlPoint, ControlPoints
+from .driver.datagram.stm import ControlPoint, ControlPoints, StmStreamer
 from .driver.firmware.fpga import Drive, Intensity, Phase, PulseWidth, SamplingConfig, transition_mode
 from .driver.geometry import Device, EulerAngles, Geometry, Transducer
 from .ethercat import DcSysTime
@@ -85,6 +85,7 @@ __all__ = [
     "Square",
     "SquareOption",
     "Static",
+    "StmStreamer",
     "SwapSegmentFociSTM",
     "SwapSegmentGain",
     "SwapSegmentGainSTM",
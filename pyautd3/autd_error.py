@@ -13,6 +13,9 @@ class AUTDError(Exception):
     def __repr__(self: Self) -> str:
         return self.msg
 
+    def __reduce__(self: Self) -> tuple:
+        return (type(self).__new__, (type(self),), self.__dict__)
+
 
 class UnknownGroupKeyError(AUTDError):
     def __init__(self: Self) -> None:
@@ -1,3 +1,22 @@
 from .controller import Controller, SenderOption
+from .controller_group import ControllerGroup
+from .monitor import FPGAMonitor
+from .process import ControllerProcess
+from .profiler import SendProfile, SendProfiler, SendStats
+from .realtime import OverrunPolicy, RunStats
+from .stream import DatagramStream, StreamStats
 
-__all__ = ["Controller", "SenderOption"]
+__all__ = [
+    "Controller",
+    "ControllerGroup",
+    "ControllerProcess",
+    "DatagramStream",
+    "FPGAMonitor",
+    "OverrunPolicy",
+    "RunStats",
+    "SendProfile",
+    "SendProfiler",
+    "SendStats",
+    "SenderOption",
+    "StreamStats",
+]
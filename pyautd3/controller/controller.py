@@ -1,27 +1,45 @@
+import contextlib
 import ctypes
-from collections.abc import Iterable
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
 from types import TracebackType
-from typing import Self, TypeVar
+from typing import TYPE_CHECKING, Self, TypeVar
 
 import numpy as np
 
-from pyautd3.autd_error import InvalidDatagramTypeError
+from pyautd3.autd_error import AUTDError, InvalidDatagramTypeError
 from pyautd3.controller.environment import Environment
+from pyautd3.controller.profiler import SendProfile, SendProfiler
+from pyautd3.controller.realtime import DEFAULT_CAPACITY, OverrunPolicy, RunStats, _run_at
+from pyautd3.controller.stream import DatagramStream
 from pyautd3.driver.autd3_device import AUTD3
+from pyautd3.driver.common.freq import Freq
 from pyautd3.driver.datagram import Datagram
+from pyautd3.driver.datagram.datagram import CompiledDatagram
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.modulation import Modulation
 from pyautd3.driver.firmware.fpga import FPGAState
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.driver.firmware_version import FirmwareInfo
 from pyautd3.driver.geometry import Geometry
 from pyautd3.driver.link import Link
 from pyautd3.native_methods.autd3capi import ControllerPtr, SenderPtr
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi import SenderOption as SenderOption_
-from pyautd3.native_methods.autd3capi_driver import GeometryPtr
+from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
 from pyautd3.native_methods.structs import Point3, Quaternion
 from pyautd3.native_methods.utils import _validate_ptr, _validate_status
 from pyautd3.utils import Duration
 from pyautd3.utils.duration import into_option_duration
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from pyautd3.controller.monitor import FPGAMonitor
+    from pyautd3.controller.shadow import _AuditShadow
+
 L = TypeVar("L", bound=Link)
 
 DEFAULT_TIMEOUT = Duration.from_millis(200)
@@ -53,29 +71,152 @@ class SenderOption:
         )
 
 
+def _datagram_name(d: Datagram | tuple[Datagram, Datagram]) -> str:
+    return "+".join(type(x).__name__ for x in d) if isinstance(d, tuple) else type(d).__name__
+
+
+def _report_failure(profiler: Callable[[SendProfile], None], profile: SendProfile) -> None:
+    with contextlib.suppress(Exception):
+        profiler(profile)
+
+
+def _closed_error() -> AUTDError:
+    return AUTDError("Controller is closed")
+
+
+class _SendWorker:
+    _lock: threading.RLock
+    _executor_lock: threading.Lock
+    _executor: "ThreadPoolExecutor | None"
+    _closed: bool
+    _released: bool
+
+    def __init__(self: Self) -> None:
+        self._lock = threading.RLock()
+        self._executor_lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+        self._released = False
+
+    @property
+    def lock(self: Self) -> threading.RLock:
+        return self._lock
+
+    @property
+    def closed(self: Self) -> bool:
+        return self._closed
+
+    def ensure_alive(self: Self) -> None:
+        if self._released:
+            raise _closed_error()
+
+    def release(self: Self) -> None:
+        self._released = True
+
+    def submit(self: Self, fn: Callable[[], None]) -> "Future[None]":
+        with self._executor_lock:
+            if self._closed:
+                raise _closed_error()
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autd3-sender")
+            return self._executor.submit(fn)
+
+    def shutdown(self: Self) -> None:
+        with self._executor_lock:
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
 class Sender:
     _ptr: SenderPtr
     _geometry: Geometry
+    _worker: _SendWorker
+    _profiler: Callable[[SendProfile], None] | None
 
-    def __init__(self: Self, ptr: SenderPtr, geometry: Geometry) -> None:
+    def __init__(
+        self: Self,
+        ptr: SenderPtr,
+        geometry: Geometry,
+        worker: _SendWorker | None = None,
+        profiler: Callable[[SendProfile], None] | None = None,
+    ) -> None:
         self._ptr = ptr
         self._geometry = geometry
+        self._worker = worker or _SendWorker()
+        self._profiler = profiler
 
-    def send(
-        self: Self,
-        d: Datagram | tuple[Datagram, Datagram],
-    ) -> None:
+    def _datagram_ptr(self: Self, d: Datagram | tuple[Datagram, Datagram]) -> DatagramPtr:
         match d:
             case Datagram():
-                result = Base().sender_send(self._ptr, d._datagram_ptr(self._geometry))
+                return d._datagram_ptr(self._geometry)
             case tuple() if len(d) == 2 and all(isinstance(x, Datagram) for x in d):  # noqa: PLR2004
                 d1, d2 = d
-                d_tuple = Base().datagram_tuple(d1._datagram_ptr(self._geometry), d2._datagram_ptr(self._geometry))
-                result = Base().sender_send(self._ptr, d_tuple)
+                return Base().datagram_tuple(d1._datagram_ptr(self._geometry), d2._datagram_ptr(self._geometry))
             case _:
                 raise InvalidDatagramTypeError
+
+    def send(
+        self: Self,
+        d: Datagram | tuple[Datagram, Datagram],
+    ) -> None:
+        self._send(d, None, 0)
+
+    def _send(self: Self, d: Datagram | tuple[Datagram, Datagram], ptr: DatagramPtr | None, build_ns: int) -> None:
+        if self._profiler is not None:
+            self._send_profiled(d, ptr, build_ns, self._profiler)
+            return
+        with self._worker.lock:
+            self._worker.ensure_alive()
+            result = Base().sender_send(self._ptr, self._datagram_ptr(d) if ptr is None else ptr)
         _validate_status(result)
 
+    def _send_profiled(
+        self: Self,
+        d: Datagram | tuple[Datagram, Datagram],
+        ptr: DatagramPtr | None,
+        build_ns: int,
+        profiler: Callable[[SendProfile], None],
+    ) -> None:
+        start = built = sent = 0
+        try:
+            with self._worker.lock:
+                start = time.perf_counter_ns()
+                self._worker.ensure_alive()
+                if ptr is None:
+                    ptr = self._datagram_ptr(d)
+                built = time.perf_counter_ns()
+                result = Base().sender_send(self._ptr, ptr)
+                sent = time.perf_counter_ns()
+            _validate_status(result)
+        except BaseException as e:
+            _report_failure(
+                profiler, SendProfile(_datagram_name(d), build_ns + (built or time.perf_counter_ns()) - start, sent - built if sent else 0, e)
+            )
+            raise
+        profiler(SendProfile(_datagram_name(d), build_ns + built - start, sent - built, None))
+
+    def send_async(
+        self: Self,
+        d: Datagram | tuple[Datagram, Datagram],
+    ) -> "Future[None]":
+        if self._worker.closed:
+            raise _closed_error()
+        with self._worker.lock:
+            start = time.perf_counter_ns()
+            try:
+                ptr = self._datagram_ptr(d)
+            except BaseException as e:
+                if self._profiler is not None:
+                    _report_failure(self._profiler, SendProfile(_datagram_name(d), time.perf_counter_ns() - start, 0, e))
+                raise
+            build_ns = time.perf_counter_ns() - start
+        return self._worker.submit(lambda: self._send(d, ptr, build_ns))
+
 
 class Controller[L: Link](Geometry):
     _ptr: ControllerPtr
@@ -83,6 +224,10 @@ class Controller[L: Link](Geometry):
     _disposed: bool
     _default_sender_option: SenderOption
     _environment: Environment
+    _worker: _SendWorker
+    _profiler: Callable[[SendProfile], None] | None
+    _monitors: "set[FPGAMonitor]"
+    _shadow: "_AuditShadow | None"
 
     def __init__(self: Self, geometry: GeometryPtr, ptr: ControllerPtr, link: L, default_sender_option: SenderOption) -> None:
         super().__init__(geometry)
@@ -92,6 +237,10 @@ class Controller[L: Link](Geometry):
         self._disposed = False
         self._default_sender_option = default_sender_option
         self._environment = Environment(Base().environment(self._ptr))
+        self._worker = _SendWorker()
+        self._profiler = None
+        self._monitors = set()
+        self._shadow = None
 
     def link(self: Self) -> L:
         return self._link
@@ -120,6 +269,9 @@ class Controller[L: Link](Geometry):
     def environment(self: Self) -> Environment:
         return self._environment
 
+    def _stamp(self: Self) -> tuple[int, ...]:
+        return (self._version, self._environment._version)
+
     @staticmethod
     def open(devices: Iterable[AUTD3], link: L) -> "Controller[L]":
         return Controller.open_with_option(devices, link, SenderOption())
@@ -147,9 +299,10 @@ class Controller[L: Link](Geometry):
         return Controller(geometry, ptr, link, option)
 
     def firmware_version(self: Self) -> list[FirmwareInfo]:
-        handle = _validate_ptr(
-            Base().controller_firmware_version_list_pointer(self._ptr),
-        )
+        with self._worker.lock:
+            handle = _validate_ptr(
+                Base().controller_firmware_version_list_pointer(self._ptr),
+            )
 
         def get_firmware_info(i: int) -> FirmwareInfo:
             sb = bytes(bytearray(256))
@@ -165,23 +318,34 @@ class Controller[L: Link](Geometry):
         if self._disposed:
             return
         self._disposed = True
-        r = Base().controller_close(self._ptr)
-        self._ptr.value = None
+        for monitor in list(self._monitors):
+            monitor.stop()
+        self._worker.shutdown()
+        with self._worker.lock:
+            if self._shadow is not None:
+                self._shadow.close()
+                self._shadow = None
+            r = Base().controller_close(self._ptr)
+            self._ptr.value = None
+            self._worker.release()
         _validate_status(r)
 
-    def fpga_state(self: Self) -> list[FPGAState | None]:
-        handle = _validate_ptr(Base().controller_fpga_state(self._ptr))
-
-        def get_fpga_state(i: int) -> FPGAState | None:
-            state = int(Base().controller_fpga_state_get(handle, i))
-            return None if state == -1 else FPGAState(state)
-
-        res = list(map(get_fpga_state, range(self.num_devices())))
+    def _fpga_state_raw(self: Self) -> np.ndarray:
+        with self._worker.lock:
+            self._worker.ensure_alive()
+            handle = _validate_ptr(Base().controller_fpga_state(self._ptr))
+        get = Base().controller_fpga_state_get
+        res = np.fromiter((get(handle, i) for i in range(len(self._devices))), dtype=np.int16, count=len(self._devices))
         Base().controller_fpga_state_delete(handle)
         return res
 
+    def fpga_state(self: Self) -> list[FPGAState | None]:
+        return [None if state == -1 else FPGAState(state) for state in self._fpga_state_raw().tolist()]
+
     def sender(self: Self, option: SenderOption) -> Sender:
-        return Sender(Base().sender(self._ptr, option._inner()), self.geometry())
+        if self._disposed:
+            raise _closed_error()
+        return Sender(Base().sender(self._ptr, option._inner()), self.geometry(), self._worker, self._profiler)
 
     def send(
         self: Self,
@@ -189,6 +353,81 @@ class Controller[L: Link](Geometry):
     ) -> None:
         self.sender(self._default_sender_option).send(d)
 
+    def send_async(
+        self: Self,
+        d: Datagram | tuple[Datagram, Datagram],
+    ) -> "Future[None]":
+        return self.sender(self._default_sender_option).send_async(d)
+
+    def run_at(
+        self: Self,
+        rate: float | Freq[int] | Freq[float],
+        fn: Callable[[float], Datagram | tuple[Datagram, Datagram] | None],
+        *,
+        duration: Duration | None = None,
+        iterations: int | None = None,
+        policy: OverrunPolicy = OverrunPolicy.Skip,
+        spin: Duration | None = None,
+        stop: threading.Event | None = None,
+        option: SenderOption | None = None,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> RunStats:
+        return _run_at(
+            self.sender(option or self._default_sender_option),
+            rate,
+            fn,
+            duration=duration,
+            iterations=iterations,
+            policy=policy,
+            spin=spin,
+            stop=stop,
+            capacity=capacity,
+        )
+
+    def stream(self: Self, option: SenderOption | None = None) -> DatagramStream:
+        return DatagramStream(self.sender(option or self._default_sender_option))
+
+    def set_profiler(self: Self, profiler: Callable[[SendProfile], None] | None) -> None:
+        self._profiler = profiler
+
+    @contextmanager
+    def profile(self: Self) -> Generator[SendProfiler]:
+        previous = self._profiler
+        profiler = SendProfiler()
+        self._profiler = profiler
+        try:
+            yield profiler
+        finally:
+            self._profiler = previous
+
+    def _audit_shadow(self: Self) -> "_AuditShadow":
+        self._worker.ensure_alive()
+        if self._shadow is None:
+            from pyautd3.controller.shadow import _AuditShadow  # noqa: PLC0415
+
+            self._shadow = _AuditShadow()
+        return self._shadow
+
+    def _solve_drives(self: Self, gain: Gain) -> np.ndarray:
+        with self._worker.lock:
+            intensity, phase = self._audit_shadow().drives(gain, self, self._environment.sound_speed)
+        drives = np.empty((len(intensity), 2), dtype=np.uint8)
+        drives[:, 0] = phase
+        drives[:, 1] = intensity
+        drives.flags.writeable = False
+        return drives
+
+    def calc_modulation(self: Self, m: Modulation) -> tuple[np.ndarray, SamplingConfig]:
+        materialized = m._materialized()
+        if materialized is not None:
+            return materialized
+        with self._worker.lock:
+            buffer = self._audit_shadow().modulation(m)
+        return m._memoize(buffer, m.sampling_config())
+
+    def prepare(self: Self, d: Datagram) -> CompiledDatagram:
+        return d.compile(self.geometry())
+
     @property
     def default_sender_option(self: Self) -> SenderOption:
         return self._default_sender_option
@@ -196,4 +435,5 @@ class Controller[L: Link](Geometry):
     @default_sender_option.setter
     def default_sender_option(self: Self, option: SenderOption) -> None:
         self._default_sender_option = option
-        Base().set_default_sender_option(self._ptr, option._inner())
+        with self._worker.lock:
+            Base().set_default_sender_option(self._ptr, option._inner())
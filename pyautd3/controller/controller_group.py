@@ -0,0 +1,233 @@
+import copy
+import itertools
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from pyautd3.controller.controller import Controller
+from pyautd3.controller.shadow import _AuditShadow
+from pyautd3.driver.datagram.datagram import Datagram
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.stm.gain import GainSTM
+from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
+from pyautd3.driver.datagram.with_segment import WithSegment
+from pyautd3.driver.firmware.fpga.transition_mode import SysTime
+from pyautd3.driver.geometry import Device
+from pyautd3.ethercat.dc_sys_time import DcSysTime
+from pyautd3.gain.custom import Custom
+from pyautd3.gain.group import Group
+from pyautd3.gain.holo.holo import Holo
+from pyautd3.native_methods.autd3 import Segment
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from pyautd3.driver.link import Link
+
+
+_GLOBAL_GAINS: tuple[type[Gain], ...] = (Custom, Group, Holo)
+
+
+class ControllerGroup:
+    _controllers: list[Controller]
+    _device_offsets: list[int]
+    _split_gains: bool
+    _stamp_cache: tuple | None
+    _ranges: list[tuple[int, int]]
+    _positions: np.ndarray | None
+    _directions: np.ndarray | None
+    _device_indices: np.ndarray | None
+    _shadow: _AuditShadow
+    _executor: "ThreadPoolExecutor | None"
+    _executor_lock: threading.Lock
+
+    def __init__(self: Self, controllers: Iterable[Controller], *, split_gains: bool = True) -> None:
+        self._controllers = list(controllers)
+        if not self._controllers:
+            msg = "ControllerGroup requires at least one controller"
+            raise ValueError(msg)
+        self._device_offsets = np.cumsum([0, *(c.num_devices() for c in self._controllers)]).tolist()
+        self._split_gains = split_gains
+        self._stamp_cache = None
+        self._ranges = []
+        self._positions = None
+        self._directions = None
+        self._device_indices = None
+        self._shadow = _AuditShadow()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._shadow.close()
+        for c in self._controllers:
+            c.close()
+
+    def controllers(self: Self) -> list[Controller]:
+        return self._controllers
+
+    def __len__(self: Self) -> int:
+        return len(self._controllers)
+
+    def _stamp(self: Self) -> tuple[int, ...]:
+        return tuple(v for c in self._controllers for v in c._stamp())
+
+    def _refresh(self: Self) -> None:
+        stamp = self._stamp()
+        if stamp != self._stamp_cache:
+            counts = np.cumsum([0, *(c.num_transducers() for c in self._controllers)]).tolist()
+            self._ranges = list(itertools.pairwise(counts))
+            self._positions = None
+            self._directions = None
+            self._device_indices = None
+            self._stamp_cache = stamp
+
+    def num_devices(self: Self) -> int:
+        return self._device_offsets[-1]
+
+    def num_transducers(self: Self) -> int:
+        return sum(c.num_transducers() for c in self._controllers)
+
+    def locate(self: Self, idx: int) -> tuple[int, int]:
+        idx = range(self.num_devices())[idx]
+        shard = int(np.searchsorted(self._device_offsets, idx, side="right")) - 1
+        return shard, idx - self._device_offsets[shard]
+
+    def __getitem__(self: Self, key: int) -> Device:
+        shard, idx = self.locate(key)
+        return self._controllers[shard][idx]
+
+    def __iter__(self: Self) -> Iterator[Device]:
+        return (dev for c in self._controllers for dev in c)
+
+    def transducer_ranges(self: Self) -> list[tuple[int, int]]:
+        self._refresh()
+        return self._ranges
+
+    def center(self: Self) -> np.ndarray:
+        return np.mean([dev.center() for dev in self], axis=0)
+
+    def positions(self: Self) -> np.ndarray:
+        self._refresh()
+        if self._positions is None:
+            positions = np.concatenate([c.positions() for c in self._controllers])
+            positions.setflags(write=False)
+            self._positions = positions
+        return self._positions
+
+    def directions(self: Self) -> np.ndarray:
+        self._refresh()
+        if self._directions is None:
+            directions = np.concatenate([c.directions() for c in self._controllers])
+            directions.setflags(write=False)
+            self._directions = directions
+        return self._directions
+
+    def device_indices(self: Self) -> np.ndarray:
+        self._refresh()
+        if self._device_indices is None:
+            device_indices = np.concatenate(
+                [c.device_indices() + offset for c, offset in zip(self._controllers, self._device_offsets, strict=False)],
+            ).astype(np.uint16)
+            device_indices.setflags(write=False)
+            self._device_indices = device_indices
+        return self._device_indices
+
+    def _split_gain(self: Self, gain: Gain) -> list[Gain]:
+        if isinstance(gain, Custom) and gain._drives is not None:
+            drives = gain._drives
+            if len(drives) != self.num_transducers():
+                msg = f"The number of drives ({len(drives)}) does not match the number of transducers ({self.num_transducers()})"
+                raise ValueError(msg)
+        else:
+            sound_speeds = {c.environment.sound_speed for c in self._controllers}
+            if len(sound_speeds) != 1:
+                msg = f"All controllers must share the same sound speed to split a gain, but got {sorted(sound_speeds)}"
+                raise ValueError(msg)
+            intensity, phase = self._shadow.drives(gain, self, sound_speeds.pop())  # type: ignore[bad-argument-type]
+            drives = np.empty((len(intensity), 2), dtype=np.uint8)
+            drives[:, 0] = phase
+            drives[:, 1] = intensity
+        return [Custom.__private_new__(drives[begin:end]) for begin, end in self.transducer_ranges()]
+
+    def _split(self: Self, d: Datagram | tuple[Datagram, Datagram]) -> list[Datagram | tuple[Datagram, Datagram]]:
+        res: list[Datagram | tuple[Datagram, Datagram]] = []
+        match d:
+            case (first, second):
+                res.extend(zip(self._split_datagram(first), self._split_datagram(second), strict=True))
+            case _:
+                res.extend(self._split_datagram(d))
+        return res
+
+    def _split_datagram(self: Self, d: Datagram) -> list[Datagram]:
+        n = len(self._controllers)
+        res: list[Datagram] = []
+        match d:
+            case Gain() if self._split_gains and isinstance(d, _GLOBAL_GAINS):
+                res.extend(self._split_gain(d))
+            case GainSTM() if self._split_gains and any(isinstance(g, _GLOBAL_GAINS) for g in d.gains):
+                shards = list(zip(*(self._split_gain(g) for g in d.gains), strict=True))
+                res.extend(GainSTM.__private_new__(gains, d.config, d.option) for gains in shards)
+            case WithSegment() | WithFiniteLoop():
+                inners = self._split_datagram(d.inner)
+                if all(inner is d.inner for inner in inners):
+                    return [d] * n
+                for inner in inners:
+                    clone = copy.copy(d)
+                    clone.inner = inner
+                    res.append(clone)
+            case _:
+                return [d] * n
+        return res
+
+    def _submit(self: Self, fn: Callable[[], None]) -> "Future[None]":
+        with self._executor_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+                self._executor = ThreadPoolExecutor(max_workers=len(self._controllers), thread_name_prefix="autd3-group")
+            return self._executor.submit(fn)
+
+    def send(self: Self, d: Datagram | tuple[Datagram, Datagram]) -> None:
+        shards = self._split(d)
+        if len(self._controllers) == 1:
+            self._controllers[0].send(shards[0])
+            return
+        futures = [self._submit(lambda c=c, s=s: c.send(s)) for c, s in zip(self._controllers, shards, strict=True)]
+        errors = [e for f in futures if (e := f.exception()) is not None]
+        if errors:
+            raise errors[0]
+
+    def send_at(
+        self: Self,
+        d: Datagram,
+        segment: Segment,
+        *,
+        loop_count: int = 1,
+        lead: Duration | None = None,
+    ) -> DcSysTime:
+        start = DcSysTime.now() + (lead or Duration.from_millis(50))
+        self.send(WithFiniteLoop(inner=d, segment=segment, transition_mode=SysTime(start), loop_count=loop_count))  # type: ignore[bad-argument-type]
+        return start
+
+    def links(self: Self) -> list["Link"]:
+        return [c.link() for c in self._controllers]
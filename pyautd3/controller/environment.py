@@ -6,9 +6,11 @@ from pyautd3.native_methods.autd3capi_driver import EnvironmentPtr
 
 class Environment:
     _ptr: EnvironmentPtr
+    _version: int
 
     def __init__(self: Self, ptr: EnvironmentPtr) -> None:
         self._ptr = ptr
+        self._version = 0
 
     @property
     def sound_speed(self: Self) -> float:
@@ -17,6 +19,7 @@ class Environment:
     @sound_speed.setter
     def sound_speed(self: Self, sound_speed: float) -> None:
         Base().environment_set_sound_speed(self._ptr, sound_speed)
+        self._version += 1
 
     def set_sound_speed_from_temp(
         self: Self,
@@ -26,6 +29,7 @@ class Environment:
         m: float = 28.9647e-3,
     ) -> None:
         Base().environment_set_sound_speed_from_temp(self._ptr, temp, k, r, m)
+        self._version += 1
 
     def wavelength(self: Self) -> float:
         return float(Base().environment_wavelength(self._ptr))
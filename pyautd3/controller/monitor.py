@@ -0,0 +1,199 @@
+import threading
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from pyautd3.driver.datagram.reads_fpga_state import ReadsFPGAState
+from pyautd3.driver.firmware.fpga import FPGAState
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from pyautd3.controller.controller import Controller
+
+THERMAL_ASSERT_BIT: int = 1 << 0
+MOD_SEGMENT_BIT: int = 1 << 1
+STM_GAIN_SEGMENT_BIT: int = 1 << 2
+GAIN_MODE_BIT: int = 1 << 3
+
+_SEGMENT_BITS: int = MOD_SEGMENT_BIT | STM_GAIN_SEGMENT_BIT | GAIN_MODE_BIT
+_ALL_BITS: int = 0xFF
+_NONE: int = -1
+
+type FPGAStateCallback = Callable[[int, FPGAState | None, FPGAState | None], None]
+
+
+def _is_thermal_assert(state: int) -> bool:
+    return state != _NONE and (state & THERMAL_ASSERT_BIT) != 0
+
+
+class FPGAMonitor:
+    _controller: "Controller"
+    _interval: Duration
+    _enable: bool
+    _timestamps: np.ndarray
+    _states: np.ndarray
+    _count: int
+    _latest: np.ndarray | None
+    _latest_ns: int
+    _callbacks: list[tuple[Callable[[int, int], bool], FPGAStateCallback]]
+    _errors: int
+    _last_error: BaseException | None
+    _lock: threading.Lock
+    _stop: threading.Event
+    _thread: threading.Thread | None
+
+    def __init__(
+        self: Self,
+        controller: "Controller",
+        *,
+        interval: Duration | None = None,
+        capacity: int = 1024,
+        enable: bool = True,
+    ) -> None:
+        if capacity <= 0:
+            msg = "capacity must be greater than 0"
+            raise ValueError(msg)
+        self._controller = controller
+        self._interval = interval or Duration.from_millis(100)
+        self._enable = enable
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._states = np.full((capacity, controller.num_devices()), _NONE, dtype=np.int16)
+        self._count = 0
+        self._latest = None
+        self._latest_ns = 0
+        self._callbacks = []
+        self._errors = 0
+        self._last_error = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self: Self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _add_callback(self: Self, pred: Callable[[int, int], bool], f: FPGAStateCallback) -> None:
+        self._callbacks = [*self._callbacks, (pred, f)]
+
+    def on_change(self: Self, f: FPGAStateCallback, *, mask: int = _ALL_BITS) -> None:
+        self._add_callback(lambda prev, cur: _NONE in (prev, cur) or ((prev ^ cur) & mask) != 0, f)
+
+    def on_thermal_assert(self: Self, f: FPGAStateCallback) -> None:
+        self._add_callback(lambda prev, cur: _is_thermal_assert(cur) and not _is_thermal_assert(prev), f)
+
+    def on_thermal_deassert(self: Self, f: FPGAStateCallback) -> None:
+        self._add_callback(lambda prev, cur: _is_thermal_assert(prev) and not _is_thermal_assert(cur), f)
+
+    def on_segment_change(self: Self, f: FPGAStateCallback) -> None:
+        self._add_callback(lambda prev, cur: _NONE not in (prev, cur) and ((prev ^ cur) & _SEGMENT_BITS) != 0, f)
+
+    def start(self: Self) -> None:
+        if self._thread is not None:
+            return
+        if self._enable:
+            self._controller.send(ReadsFPGAState.from_mask(np.ones(self._controller.num_devices(), dtype=np.bool_)))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="autd3-fpga-monitor", daemon=True)
+        self._controller._monitors.add(self)
+        self._thread.start()
+
+    def stop(self: Self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+        self._controller._monitors.discard(self)
+
+    def is_running(self: Self) -> bool:
+        return self._thread is not None
+
+    def _run(self: Self) -> None:
+        interval_s = self._interval.as_nanos() / 1e9
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except BaseException as e:  # noqa: BLE001
+                self._errors += 1
+                self._last_error = e
+            self._stop.wait(interval_s)
+
+    def poll(self: Self) -> np.ndarray | None:
+        try:
+            states = self._controller._fpga_state_raw()
+        except BaseException as e:  # noqa: BLE001
+            self._errors += 1
+            self._last_error = e
+            return None
+        now = time.time_ns()
+        states.flags.writeable = False
+        previous = self._latest
+        with self._lock:
+            row = self._count % len(self._timestamps)
+            self._timestamps[row] = now
+            self._states[row] = states
+            self._count += 1
+        self._latest = states
+        self._latest_ns = now
+        if previous is not None:
+            self._dispatch(previous, states)
+        return states
+
+    def _dispatch(self: Self, previous: np.ndarray, current: np.ndarray) -> None:
+        changed = np.flatnonzero(previous != current)
+        for dev_idx in changed.tolist():
+            prev = int(previous[dev_idx])
+            cur = int(current[dev_idx])
+            prev_state = None if prev == _NONE else FPGAState(prev)
+            cur_state = None if cur == _NONE else FPGAState(cur)
+            for pred, f in self._callbacks:
+                if pred(prev, cur):
+                    f(dev_idx, prev_state, cur_state)
+
+    def latest(self: Self) -> list[FPGAState | None] | None:
+        states = self._latest
+        if states is None:
+            return None
+        return [None if s == _NONE else FPGAState(s) for s in states.tolist()]
+
+    def latest_raw(self: Self) -> np.ndarray | None:
+        return self._latest
+
+    def latest_timestamp_ns(self: Self) -> int:
+        return self._latest_ns
+
+    def history(self: Self) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            capacity = len(self._timestamps)
+            if self._count <= capacity:
+                return self._timestamps[: self._count].copy(), self._states[: self._count].copy()
+            order = np.roll(np.arange(capacity), -(self._count % capacity))
+            return self._timestamps[order], self._states[order]
+
+    def __len__(self: Self) -> int:
+        return min(self._count, len(self._timestamps))
+
+    @property
+    def polls(self: Self) -> int:
+        return self._count
+
+    @property
+    def errors(self: Self) -> int:
+        return self._errors
+
+    @property
+    def last_error(self: Self) -> BaseException | None:
+        return self._last_error
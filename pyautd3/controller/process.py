@@ -0,0 +1,341 @@
+import contextlib
+import multiprocessing
+import pickle
+import time
+from collections.abc import Callable, Iterable
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pyautd3.autd_error import AUTDError
+from pyautd3.controller.controller import Controller, SenderOption
+from pyautd3.controller.profiler import SendProfile, SendStats
+from pyautd3.driver.autd3_device import AUTD3
+from pyautd3.driver.common.freq import Freq
+from pyautd3.driver.datagram import Datagram
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
+from pyautd3.driver.utils import _validate_u8_array
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from pyautd3.driver.link import Link
+
+_HEADER_SIZE: int = 64
+_ALIGN: int = 64
+
+
+def _build(kind: str, view: Callable[[int, tuple[int, ...], str], np.ndarray], meta: tuple) -> Datagram | tuple[Datagram, Datagram]:
+    from pyautd3.driver.datagram.stm.foci import FociSTM  # noqa: PLC0415
+    from pyautd3.gain.custom import Custom as GainCustom  # noqa: PLC0415
+    from pyautd3.modulation.custom import Custom as ModulationCustom  # noqa: PLC0415
+
+    match kind:
+        case "drives":
+            (n,) = meta
+            return GainCustom.__private_new__(view(0, (n, 2), "u1").copy())
+        case "foci":
+            shape, intensity_offset, config = meta
+            points = view(0, shape, "<f4")
+            intensity = None if intensity_offset is None else view(intensity_offset, (shape[0],), "u1")
+            return FociSTM.from_array(points, config, intensity)
+        case "modulation":
+            n, config = meta
+            return ModulationCustom(view(0, (n,), "u1"), config)
+        case "datagram":
+            (d,) = meta
+            return d
+        case _:
+            raise ValueError(kind)
+
+
+def _host_main(
+    conn: Connection,
+    shm_name: str,
+    devices: list[AUTD3],
+    link_factory: "Callable[[], Link]",
+    option: SenderOption,
+) -> None:
+    shm = SharedMemory(name=shm_name)
+    try:
+        released = np.ndarray((1,), dtype=np.uint64, buffer=shm.buf)
+        try:
+            controller = Controller.open_with_option(devices, link_factory(), option)
+        except BaseException as e:  # noqa: BLE001
+            conn.send(("error", e))
+            return
+        with controller:
+            conn.send(("ready", controller.num_devices(), controller.num_transducers()))
+            while True:
+                msg = conn.recv()
+                if msg is None:
+                    break
+                seq, kind, offset, meta = msg
+                result: Any = None
+                build_ns = send_ns = 0
+                error: BaseException | None = None
+                start = time.perf_counter_ns()
+                try:
+                    if kind == "call":
+                        released[0] = seq
+                        result = meta[0](controller)
+                    else:
+                        d = _build(kind, lambda off, shape, dtype: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset + off), meta)  # noqa: B023
+                        released[0] = seq
+                        built = time.perf_counter_ns()
+                        build_ns = built - start
+                        controller.send(d)
+                        send_ns = time.perf_counter_ns() - built
+                except BaseException as e:  # noqa: BLE001
+                    released[0] = seq
+                    error = e
+                    build_ns = build_ns or time.perf_counter_ns() - start
+                try:
+                    conn.send((seq, SendProfile(kind, build_ns, send_ns, error), result))
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    conn.send((seq, SendProfile(kind, build_ns, send_ns, AUTDError(f"{type(error or e).__name__}: {error or e}")), None))
+    finally:
+        shm.close()
+
+
+class ControllerProcess:
+    _process: "BaseProcess"
+    _conn: Connection
+    _shm: SharedMemory
+    _released: np.ndarray
+    _slots: int
+    _slot_size: int
+    _seq: int
+    _acked: int
+    _stats: SendStats
+    _errors: list[BaseException]
+    _results: dict[int, Any]
+    _num_devices: int
+    _num_transducers: int
+    _closed: bool
+
+    def __init__(
+        self: Self,
+        devices: Iterable[AUTD3],
+        link_factory: "Callable[[], Link]",
+        *,
+        option: SenderOption | None = None,
+        slots: int = 8,
+        slot_size: int = 1 << 20,
+        timeout: Duration | None = None,
+    ) -> None:
+        if slots <= 0 or slot_size <= 0:
+            msg = "slots and slot_size must be greater than 0"
+            raise ValueError(msg)
+        self._slots = slots
+        self._slot_size = -(-slot_size // _ALIGN) * _ALIGN
+        self._seq = 0
+        self._acked = 0
+        self._stats = SendStats()
+        self._errors = []
+        self._results = {}
+        self._closed = True
+        self._shm = SharedMemory(create=True, size=_HEADER_SIZE + self._slots * self._slot_size)
+        self._released = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf)
+        self._released[0] = 0
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_host_main,
+            args=(child, self._shm.name, list(devices), link_factory, option or SenderOption()),
+            name="autd3-controller-host",
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+        timeout_s = (timeout or Duration.from_secs(30)).as_nanos() / 1e9
+        if not self._conn.poll(timeout_s):
+            self._shutdown()
+            msg = "Controller host process did not start in time"
+            raise AUTDError(msg)
+        match self._conn.recv():
+            case ("ready", num_devices, num_transducers):
+                self._num_devices = num_devices
+                self._num_transducers = num_transducers
+                self._closed = False
+            case ("error", e):
+                self._shutdown()
+                raise e
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __del__(self: Self) -> None:
+        if hasattr(self, "_process"):
+            self.close()
+
+    def num_devices(self: Self) -> int:
+        return self._num_devices
+
+    def num_transducers(self: Self) -> int:
+        return self._num_transducers
+
+    def is_alive(self: Self) -> bool:
+        return not self._closed and self._process.is_alive()
+
+    @property
+    def stats(self: Self) -> SendStats:
+        self._drain()
+        return self._stats
+
+    @property
+    def pending(self: Self) -> int:
+        self._drain()
+        return self._seq - self._acked
+
+    def _receive(self: Self) -> None:
+        seq, profile, result = self._conn.recv()
+        self._acked = seq
+        if profile.datagram == "call":
+            self._results[seq] = (result, profile.error)
+            return
+        if profile.error is not None:
+            self._errors.append(profile.error)
+        self._stats._add(profile)
+
+    def _drain(self: Self) -> None:
+        while not self._closed and self._conn.poll():
+            self._receive()
+
+    def _check_alive(self: Self) -> None:
+        if self._closed:
+            msg = "Controller host process is closed"
+            raise AUTDError(msg)
+        if not self._process.is_alive():
+            self._closed = True
+            msg = f"Controller host process exited with code {self._process.exitcode}"
+            raise AUTDError(msg)
+
+    def _acquire(self: Self, nbytes: int) -> tuple[int, int]:
+        self._check_alive()
+        if nbytes > self._slot_size:
+            msg = f"Payload ({nbytes} bytes) exceeds slot_size ({self._slot_size} bytes)"
+            raise ValueError(msg)
+        seq = self._seq + 1
+        while int(self._released[0]) < seq - self._slots:
+            if self._conn.poll(0.001):
+                self._receive()
+            self._check_alive()
+        self._seq = seq
+        return seq, _HEADER_SIZE + (seq % self._slots) * self._slot_size
+
+    def _post(self: Self, kind: str, arrays: list[np.ndarray], meta: Callable[[list[int]], tuple]) -> int:
+        offsets = []
+        nbytes = 0
+        for arr in arrays:
+            offsets.append(nbytes)
+            nbytes += -(-arr.nbytes // _ALIGN) * _ALIGN
+        seq, base = self._acquire(nbytes)
+        for arr, off in zip(arrays, offsets, strict=True):
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=base + off)[...] = arr
+        return self._dispatch(seq, kind, base, meta(offsets))
+
+    def _dispatch(self: Self, seq: int, kind: str, offset: int, meta: tuple) -> int:
+        try:
+            self._conn.send((seq, kind, offset, meta))
+        except BaseException:
+            self._seq = seq - 1
+            raise
+        self._drain()
+        return seq
+
+    def send(self: Self, d: Datagram | tuple[Datagram, Datagram]) -> int:
+        seq, _ = self._acquire(0)
+        return self._dispatch(seq, "datagram", 0, (d,))
+
+    def send_drives(self: Self, phase: ArrayLike, intensity: ArrayLike) -> int:
+        phase_ = _validate_u8_array(phase).ravel()
+        intensity_ = _validate_u8_array(intensity).ravel()
+        if phase_.shape != intensity_.shape or len(phase_) != self._num_transducers:
+            msg = f"phase and intensity must have {self._num_transducers} elements"
+            raise ValueError(msg)
+        drives = np.empty((len(phase_), 2), dtype=np.uint8)
+        drives[:, 0] = phase_
+        drives[:, 1] = intensity_
+        return self._post("drives", [drives], lambda _: (len(drives),))
+
+    def send_foci(
+        self: Self,
+        points: ArrayLike,
+        config: SamplingConfig | Freq[float] | Duration,
+        intensity: ArrayLike | None = None,
+    ) -> int:
+        points_ = np.ascontiguousarray(points, dtype="<f4")
+        if points_.ndim == 2:  # noqa: PLR2004
+            points_ = points_[:, np.newaxis, :]
+        config_ = SamplingConfig(config)
+        if intensity is None:
+            return self._post("foci", [points_], lambda _: (points_.shape, None, config_))
+        intensity_ = np.broadcast_to(_validate_u8_array(intensity).ravel(), (points_.shape[0],))
+        return self._post("foci", [points_, intensity_], lambda offsets: (points_.shape, offsets[1], config_))
+
+    def send_modulation(self: Self, buffer: ArrayLike, config: SamplingConfig | Freq[int] | Freq[float] | Duration) -> int:
+        buffer_ = _validate_u8_array(buffer).ravel()
+        config_ = SamplingConfig(config)
+        return self._post("modulation", [buffer_], lambda _: (len(buffer_), config_))
+
+    def call[T](self: Self, f: Callable[[Controller], T]) -> T:
+        seq, _ = self._acquire(0)
+        try:
+            self._wait_acked(self._dispatch(seq, "call", 0, (f,)), None)
+            result, error = self._results[seq]
+        finally:
+            self._results.pop(seq, None)
+        if error is not None:
+            raise error
+        return result
+
+    def wait(self: Self, seq: int | None = None, timeout: Duration | None = None) -> None:
+        self._wait_acked(self._seq if seq is None else seq, timeout)
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def _wait_acked(self: Self, target: int, timeout: Duration | None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout.as_nanos() / 1e9
+        while self._acked < target:
+            self._check_alive()
+            remaining = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+            if remaining <= 0:
+                raise TimeoutError
+            if self._conn.poll(remaining):
+                self._receive()
+
+    def close(self: Self) -> None:
+        if not self._closed:
+            self._closed = True
+            with contextlib.suppress(OSError):
+                self._conn.send(None)
+        self._shutdown()
+
+    def _shutdown(self: Self) -> None:
+        self._closed = True
+        if self._process.pid is not None:
+            self._process.join(timeout=5.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        self._conn.close()
+        self._released = np.empty(0, dtype=np.uint64)
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
@@ -0,0 +1,91 @@
+import threading
+from typing import Self
+
+
+class SendProfile:
+    datagram: str
+    build_ns: int
+    send_ns: int
+    error: BaseException | None
+
+    def __init__(self: Self, datagram: str, build_ns: int, send_ns: int, error: BaseException | None) -> None:
+        self.datagram = datagram
+        self.build_ns = build_ns
+        self.send_ns = send_ns
+        self.error = error
+
+    def total_ns(self: Self) -> int:
+        return self.build_ns + self.send_ns
+
+    def is_ok(self: Self) -> bool:
+        return self.error is None
+
+    def __repr__(self: Self) -> str:
+        return f"SendProfile(datagram={self.datagram}, build_ns={self.build_ns}, send_ns={self.send_ns}, error={self.error!r})"
+
+
+class SendStats:
+    count: int
+    errors: int
+    build_ns: int
+    send_ns: int
+    max_build_ns: int
+    max_send_ns: int
+
+    def __init__(self: Self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.build_ns = 0
+        self.send_ns = 0
+        self.max_build_ns = 0
+        self.max_send_ns = 0
+
+    def _add(self: Self, profile: SendProfile) -> None:
+        self.count += 1
+        self.errors += profile.error is not None
+        self.build_ns += profile.build_ns
+        self.send_ns += profile.send_ns
+        self.max_build_ns = max(self.max_build_ns, profile.build_ns)
+        self.max_send_ns = max(self.max_send_ns, profile.send_ns)
+
+    def mean_build_ns(self: Self) -> float:
+        return self.build_ns / self.count if self.count else 0.0
+
+    def mean_send_ns(self: Self) -> float:
+        return self.send_ns / self.count if self.count else 0.0
+
+
+class SendProfiler:
+    _lock: threading.Lock
+    _total: SendStats
+    _by_datagram: dict[str, SendStats]
+    _last: SendProfile | None
+
+    def __init__(self: Self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self: Self, profile: SendProfile) -> None:
+        with self._lock:
+            self._total._add(profile)
+            stats = self._by_datagram.get(profile.datagram)
+            if stats is None:
+                stats = SendStats()
+                self._by_datagram[profile.datagram] = stats
+            stats._add(profile)
+            self._last = profile
+
+    def reset(self: Self) -> None:
+        with self._lock:
+            self._total = SendStats()
+            self._by_datagram = {}
+            self._last = None
+
+    def total(self: Self) -> SendStats:
+        return self._total
+
+    def by_datagram(self: Self) -> dict[str, SendStats]:
+        return dict(self._by_datagram)
+
+    def last(self: Self) -> SendProfile | None:
+        return self._last
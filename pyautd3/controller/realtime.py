@@ -0,0 +1,155 @@
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from pyautd3.driver.common.freq import Freq
+from pyautd3.driver.datagram.datagram import Datagram
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from pyautd3.controller.controller import Sender
+
+DEFAULT_SPIN = Duration.from_micros(500)
+DEFAULT_CAPACITY: int = 1 << 16
+
+
+class OverrunPolicy(Enum):
+    Skip = 0
+    CatchUp = 1
+
+
+class _SampleRing:
+    _values: np.ndarray
+    _count: int
+    _max: int
+
+    def __init__(self: Self, capacity: int) -> None:
+        self._values = np.zeros(capacity, dtype=np.int64)
+        self._count = 0
+        self._max = 0
+
+    def push(self: Self, value: int) -> None:
+        self._values[self._count % len(self._values)] = value
+        self._count += 1
+        self._max = max(self._max, value)
+
+    def values(self: Self) -> np.ndarray:
+        capacity = len(self._values)
+        if self._count <= capacity:
+            return self._values[: self._count].copy()
+        return np.roll(self._values, -(self._count % capacity))
+
+
+class RunStats:
+    period_ns: int
+    iterations: int
+    overruns: int
+    skipped: int
+    elapsed_ns: int
+    latency_ns: np.ndarray
+    jitter_ns: np.ndarray
+    max_latency_ns: int
+    max_jitter_ns: int
+
+    def __init__(
+        self: Self,
+        period_ns: int,
+        latency: _SampleRing,
+        jitter: _SampleRing,
+        *,
+        overruns: int,
+        skipped: int,
+        elapsed_ns: int,
+    ) -> None:
+        self.period_ns = period_ns
+        self.iterations = latency._count
+        self.overruns = overruns
+        self.skipped = skipped
+        self.elapsed_ns = elapsed_ns
+        self.latency_ns = latency.values()
+        self.jitter_ns = jitter.values()
+        self.max_latency_ns = latency._max
+        self.max_jitter_ns = jitter._max
+
+    def rate_hz(self: Self) -> float:
+        return self.iterations * 1e9 / self.elapsed_ns if self.elapsed_ns else 0.0
+
+    def latency_percentiles(self: Self, q: tuple[float, ...] = (50.0, 90.0, 99.0, 99.9)) -> dict[float, float]:
+        return _percentiles(self.latency_ns, q)
+
+    def jitter_percentiles(self: Self, q: tuple[float, ...] = (50.0, 90.0, 99.0, 99.9)) -> dict[float, float]:
+        return _percentiles(np.abs(self.jitter_ns), q)
+
+    def __repr__(self: Self) -> str:
+        return (
+            f"RunStats(iterations={self.iterations}, overruns={self.overruns}, skipped={self.skipped}, "
+            f"rate_hz={self.rate_hz():.1f}, latency_ns={self.latency_percentiles()}, jitter_ns={self.jitter_percentiles()})"
+        )
+
+
+def _percentiles(values: np.ndarray, q: tuple[float, ...]) -> dict[float, float]:
+    if len(values) == 0:
+        return dict.fromkeys(q, 0.0)
+    return dict(zip(q, np.percentile(values, q).tolist(), strict=True))
+
+
+def _sleep_until(deadline_ns: int, spin_ns: int) -> None:
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining > spin_ns:
+        time.sleep((remaining - spin_ns) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+
+def _run_at(
+    sender: "Sender",
+    rate: float | Freq[int] | Freq[float],
+    fn: Callable[[float], Datagram | tuple[Datagram, Datagram] | None],
+    *,
+    duration: Duration | None,
+    iterations: int | None,
+    policy: OverrunPolicy,
+    spin: Duration | None,
+    stop: threading.Event | None,
+    capacity: int = DEFAULT_CAPACITY,
+) -> RunStats:
+    if capacity <= 0:
+        msg = "capacity must be greater than 0"
+        raise ValueError(msg)
+    rate_hz = float(rate.hz() if isinstance(rate, Freq) else rate)
+    if rate_hz <= 0:
+        msg = "rate must be greater than 0"
+        raise ValueError(msg)
+    period_ns = round(1e9 / rate_hz)
+    spin_ns = (spin or DEFAULT_SPIN).as_nanos()
+    latency = _SampleRing(capacity)
+    jitter = _SampleRing(capacity)
+    overruns = skipped = 0
+    start = time.perf_counter_ns()
+    end = None if duration is None else start + duration.as_nanos()
+    k = 0
+    deadline = start
+    while (iterations is None or latency._count < iterations) and (end is None or deadline < end) and (stop is None or not stop.is_set()):
+        _sleep_until(deadline, spin_ns)
+        woke = time.perf_counter_ns()
+        d = fn((deadline - start) / 1e9)
+        if d is None:
+            break
+        sender.send(d)
+        done = time.perf_counter_ns()
+        jitter.push(woke - deadline)
+        latency.push(done - deadline)
+        k += 1
+        deadline = start + k * period_ns
+        if done > deadline:
+            overruns += 1
+            if policy == OverrunPolicy.Skip:
+                next_k = -(-(done - start) // period_ns)
+                skipped += next_k - k
+                k = next_k
+                deadline = start + k * period_ns
+    return RunStats(period_ns, latency, jitter, overruns=overruns, skipped=skipped, elapsed_ns=time.perf_counter_ns() - start)
@@ -0,0 +1,60 @@
+import threading
+from typing import Self
+
+import numpy as np
+
+from pyautd3.controller.controller import Controller
+from pyautd3.driver.autd3_device import AUTD3
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.datagram.silencer import Silencer
+from pyautd3.driver.geometry import Geometry
+from pyautd3.link.audit import Audit
+from pyautd3.native_methods.autd3 import Segment
+
+
+class _AuditShadow:
+    _controller: Controller[Audit] | None
+    _key: tuple | None
+    _lock: threading.Lock
+
+    def __init__(self: Self) -> None:
+        self._controller = None
+        self._key = None
+        self._lock = threading.Lock()
+
+    def _sync(self: Self, geometry: Geometry | None, sound_speed: float | None) -> Controller[Audit]:
+        key = (None, None, sound_speed) if geometry is None else (id(geometry), geometry._stamp(), sound_speed)
+        if self._controller is None or self._key != key:
+            self._close()
+            devices = [AUTD3()] if geometry is None else [AUTD3(pos=dev.positions()[0], rot=dev.rotation()) for dev in geometry]
+            controller = Controller.open(devices, Audit())
+            if sound_speed is not None:
+                controller.environment.sound_speed = sound_speed
+            controller.send(Silencer.disable())
+            self._controller = controller
+            self._key = key
+        return self._controller
+
+    def drives(self: Self, gain: Gain, geometry: Geometry, sound_speed: float) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            controller = self._sync(geometry, sound_speed)
+            controller.send(gain)
+            intensity, phase = controller.link().drives(Segment.S0, range(controller.num_devices()))
+            return intensity.ravel(), phase.ravel()
+
+    def modulation(self: Self, modulation: Modulation) -> np.ndarray:
+        with self._lock:
+            controller = self._sync(None, None)
+            controller.send(modulation)
+            return controller.link().modulation_buffer(0, Segment.S0)
+
+    def _close(self: Self) -> None:
+        if self._controller is not None:
+            self._controller.close()
+        self._controller = None
+        self._key = None
+
+    def close(self: Self) -> None:
+        with self._lock:
+            self._close()
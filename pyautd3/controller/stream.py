@@ -0,0 +1,165 @@
+import threading
+import time
+from collections.abc import Hashable
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from pyautd3.driver.datagram.datagram import CompiledDatagram, Datagram
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.datagram.stm.foci import FociSTM
+from pyautd3.driver.datagram.stm.gain import GainSTM
+from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
+from pyautd3.driver.datagram.with_segment import WithSegment
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from pyautd3.controller.controller import Sender
+
+
+def _kind(d: Datagram | tuple[Datagram, Datagram]) -> Hashable:
+    match d:
+        case tuple():
+            return tuple(_kind(x) for x in d)
+        case CompiledDatagram() | WithSegment() | WithFiniteLoop():
+            return _kind(d.inner)
+        case Gain():
+            return "gain"
+        case Modulation():
+            return "modulation"
+        case FociSTM() | GainSTM():
+            return "stm"
+        case _:
+            return type(d)
+
+
+class StreamStats:
+    puts: int
+    sent: int
+    dropped: int
+    errors: int
+    last_latency_ns: int
+    max_latency_ns: int
+    total_latency_ns: int
+
+    def __init__(self: Self) -> None:
+        self.puts = 0
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_latency_ns = 0
+        self.max_latency_ns = 0
+        self.total_latency_ns = 0
+
+    def mean_latency_ns(self: Self) -> float:
+        return self.total_latency_ns / self.sent if self.sent else 0.0
+
+    def __repr__(self: Self) -> str:
+        return (
+            f"StreamStats(puts={self.puts}, sent={self.sent}, dropped={self.dropped}, errors={self.errors}, "
+            f"last_latency_ns={self.last_latency_ns}, max_latency_ns={self.max_latency_ns})"
+        )
+
+
+class DatagramStream:
+    _sender: "Sender"
+    _pending: dict[Hashable, tuple[Datagram | tuple[Datagram, Datagram], int]]
+    _in_flight: bool
+    _closed: bool
+    _stats: StreamStats
+    _error: BaseException | None
+    _cond: threading.Condition
+    _thread: threading.Thread
+
+    def __init__(self: Self, sender: "Sender") -> None:
+        self._sender = sender
+        self._pending = {}
+        self._in_flight = False
+        self._closed = False
+        self._stats = StreamStats()
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autd3-stream", daemon=True)
+        self._thread.start()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def put(self: Self, d: Datagram | tuple[Datagram, Datagram], *, key: Hashable | None = None) -> None:
+        kind = _kind(d) if key is None else key
+        now = time.perf_counter_ns()
+        with self._cond:
+            if self._closed:
+                msg = "stream is closed"
+                raise RuntimeError(msg)
+            self._stats.puts += 1
+            if kind in self._pending:
+                self._stats.dropped += 1
+            self._pending[kind] = (d, now)
+            self._cond.notify_all()
+
+    def _run(self: Self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._in_flight = True
+            for d, put_ns in batch:
+                try:
+                    self._sender.send(d)
+                except BaseException as e:  # noqa: BLE001
+                    with self._cond:
+                        self._stats.errors += 1
+                        self._error = e
+                    continue
+                latency_ns = time.perf_counter_ns() - put_ns
+                with self._cond:
+                    self._stats.sent += 1
+                    self._stats.last_latency_ns = latency_ns
+                    self._stats.max_latency_ns = max(self._stats.max_latency_ns, latency_ns)
+                    self._stats.total_latency_ns += latency_ns
+            with self._cond:
+                self._in_flight = False
+                self._cond.notify_all()
+
+    def flush(self: Self, timeout: Duration | None = None) -> None:
+        with self._cond:
+            done = self._cond.wait_for(
+                lambda: not self._pending and not self._in_flight,
+                None if timeout is None else timeout.as_nanos() / 1e9,
+            )
+            error, self._error = self._error, None
+        if not done:
+            raise TimeoutError
+        if error is not None:
+            raise error
+
+    def close(self: Self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def is_closed(self: Self) -> bool:
+        return self._closed
+
+    def stats(self: Self) -> StreamStats:
+        return self._stats
@@ -20,6 +20,9 @@ class Angle:
     def radian(self: Self) -> float:
         return self._value
 
+    def __reduce__(self: Self) -> tuple:
+        return (Angle.__private_new__, (self._value,))
+
     def _inner(self: Self) -> Angle_:
         return Angle_(self._value)
 
@@ -18,6 +18,9 @@ class Freq[T: (int, float)]:
     def hz(self: Self) -> T:
         return self._freq
 
+    def __reduce__(self: Self) -> tuple:
+        return (Freq.__private_new__, (self._freq,))
+
     def __eq__(self: Self, value: object) -> bool:
         return isinstance(value, Freq) and self._freq == value._freq
 
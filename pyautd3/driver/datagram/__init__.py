@@ -1,4 +1,4 @@
-from pyautd3.driver.datagram.datagram import Datagram
+from pyautd3.driver.datagram.datagram import CompiledDatagram, Datagram
 
 from .clear import Clear
 from .debug import GPIOOutputs, GPIOOutputType
@@ -17,6 +17,7 @@ from .with_segment import WithSegment
 
 __all__ = [
     "Clear",
+    "CompiledDatagram",
     "Datagram",
     "FixedCompletionTime",
     "FixedUpdateRate",
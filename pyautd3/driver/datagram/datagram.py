@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
 from typing import Self
 
 from pyautd3.driver.geometry import Geometry
@@ -9,3 +10,46 @@ class Datagram(metaclass=ABCMeta):
     @abstractmethod
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         pass
+
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        return lambda: self._datagram_ptr(geometry)
+
+    def compile(self: Self, geometry: Geometry) -> "CompiledDatagram":
+        return CompiledDatagram(self, geometry)
+
+
+class CompiledDatagram(Datagram):
+    _inner: Datagram
+    _geometry: Geometry
+    _stamp: tuple[int, ...]
+    _factory: Callable[[], DatagramPtr]
+
+    def __init__(self: Self, inner: Datagram, geometry: Geometry) -> None:
+        super().__init__()
+        self._inner = inner
+        self._geometry = geometry
+        self._recompile()
+
+    def _recompile(self: Self) -> None:
+        self._stamp = self._geometry._stamp()
+        self._factory = self._inner._compile(self._geometry)
+
+    @property
+    def inner(self: Self) -> Datagram:
+        return self._inner
+
+    def is_valid(self: Self) -> bool:
+        return self._stamp == self._geometry._stamp()
+
+    def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        if geometry is not self._geometry:
+            self._geometry = geometry
+            self._recompile()
+        elif not self.is_valid():
+            self._recompile()
+        return self._factory()
+
+    def compile(self: Self, geometry: Geometry) -> "CompiledDatagram":
+        if geometry is not self._geometry:
+            return self._inner.compile(geometry)
+        return self
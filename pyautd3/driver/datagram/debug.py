@@ -8,31 +8,31 @@ from pyautd3.ethercat.dc_sys_time import DcSysTime
 from pyautd3.native_methods.autd3 import GPIOOut
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr, GPIOOutputTypeWrap
-from pyautd3.native_methods.utils import ConstantADT
+from pyautd3.native_methods.utils import ConstantADT, LazyConstant
 
 
 class GPIOOutputType(metaclass=ConstantADT):
     def __new__(cls: type["GPIOOutputType"]) -> Self:
         raise NotImplementedError
 
-    BaseSignal: GPIOOutputTypeWrap = Base().gpio_output_type_base_signal()
-    Thermo: GPIOOutputTypeWrap = Base().gpio_output_type_thermo()
-    ForceFan: GPIOOutputTypeWrap = Base().gpio_output_type_force_fan()
-    Sync: GPIOOutputTypeWrap = Base().gpio_output_type_sync()
-    ModSegment: GPIOOutputTypeWrap = Base().gpio_output_type_mod_segment()
-    SyncDiff: GPIOOutputTypeWrap = Base().gpio_output_type_sync_diff()
+    BaseSignal = LazyConstant(Base().gpio_output_type_base_signal)
+    Thermo = LazyConstant(Base().gpio_output_type_thermo)
+    ForceFan = LazyConstant(Base().gpio_output_type_force_fan)
+    Sync = LazyConstant(Base().gpio_output_type_sync)
+    ModSegment = LazyConstant(Base().gpio_output_type_mod_segment)
+    SyncDiff = LazyConstant(Base().gpio_output_type_sync_diff)
 
     @staticmethod
     def ModIdx(idx: int) -> GPIOOutputTypeWrap:  # noqa: N802
         return Base().gpio_output_type_mod_idx(idx)
 
-    StmSegment: GPIOOutputTypeWrap = Base().gpio_output_type_stm_segment()
+    StmSegment = LazyConstant(Base().gpio_output_type_stm_segment)
 
     @staticmethod
     def StmIdx(idx: int) -> GPIOOutputTypeWrap:  # noqa: N802
         return Base().gpio_output_type_stm_idx(idx)
 
-    IsStmMode: GPIOOutputTypeWrap = Base().gpio_output_type_is_stm_mode()
+    IsStmMode = LazyConstant(Base().gpio_output_type_is_stm_mode)
 
     @staticmethod
     def PwmOut(tr: Transducer) -> GPIOOutputTypeWrap:  # noqa: N802
@@ -48,11 +48,18 @@ class GPIOOutputType(metaclass=ConstantADT):
 
 
 class GPIOOutputs(Datagram):
+    _f: Callable[[Device, GPIOOut], GPIOOutputTypeWrap | None]
+
     def __init__(self: Self, f: Callable[[Device, GPIOOut], GPIOOutputTypeWrap | None]) -> None:
         super().__init__()
+        self._f = f
+
+    def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        f = self._f
+        none = Base().gpio_output_type_none()
 
-        def f_native(_context: ctypes.c_void_p, geometry_ptr: GeometryPtr, dev_idx: int, gpio: GPIOOut, res) -> None:  # noqa: ANN001
-            res[0] = f(Device(dev_idx, geometry_ptr), gpio) or Base().gpio_output_type_none()
+        def f_native(_context: ctypes.c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int, gpio: GPIOOut, res) -> None:  # noqa: ANN001
+            res[0] = f(geometry[dev_idx], gpio) or none
 
         self._f_native = ctypes.CFUNCTYPE(
             None,
@@ -62,6 +69,4 @@ class GPIOOutputs(Datagram):
             ctypes.c_uint8,
             ctypes.POINTER(GPIOOutputTypeWrap),
         )(f_native)
-
-    def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return Base().datagram_gpio_outputs(self._f_native, ctypes.c_void_p(None), geometry._geometry_ptr)  # type: ignore[bad-argument-type]
@@ -0,0 +1,56 @@
+import ctypes
+from abc import abstractmethod
+from collections.abc import Callable
+from typing import Self
+
+from numpy.typing import ArrayLike
+
+from pyautd3.driver.datagram.datagram import Datagram
+from pyautd3.driver.geometry import Device, Geometry
+from pyautd3.driver.utils import _validate_bool_array
+from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
+
+
+class _DeviceMaskDatagram(Datagram):
+    _f: Callable[[Device], bool] | None
+    _mask: list[bool] | None
+
+    def __init__(self: Self, f: Callable[[Device], bool]) -> None:
+        super().__init__()
+        self._f = f
+        self._mask = None
+
+    @classmethod
+    def __private_new__(cls: type[Self], mask: list[bool]) -> Self:
+        ins = super().__new__(cls)
+        Datagram.__init__(ins)
+        ins._f = None
+        ins._mask = mask
+        return ins
+
+    @classmethod
+    def from_mask(cls: type[Self], mask: ArrayLike) -> Self:
+        return cls.__private_new__(_validate_bool_array(mask).ravel().tolist())
+
+    @abstractmethod
+    def _native(self: Self) -> Callable[..., DatagramPtr]:
+        pass
+
+    def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        f = self._f
+        mask = self._mask
+        if mask is None:
+
+            def f_native(_context: ctypes.c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int) -> bool:
+                return f(geometry[dev_idx])  # type: ignore[misc]
+
+        else:
+            if len(mask) != geometry.num_devices():
+                msg = f"The length of mask ({len(mask)}) does not match the number of devices ({geometry.num_devices()})"
+                raise ValueError(msg)
+
+            def f_native(_context: ctypes.c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int) -> bool:
+                return mask[dev_idx]
+
+        self._f_native = ctypes.CFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, GeometryPtr, ctypes.c_uint16)(f_native)
+        return self._native()(self._f_native, ctypes.c_void_p(None), geometry._geometry_ptr)
@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
 from typing import Self
 
 from pyautd3.driver.datagram.datagram import Datagram
@@ -20,12 +21,22 @@ class Gain(
     def _raw_ptr(self: Self, geometry: Geometry) -> GainPtr:
         return self._gain_ptr(geometry)
 
+    def _compile_raw(self: Self, geometry: Geometry) -> Callable[[], GainPtr]:
+        return self._compile_gain(geometry)
+
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return Base().gain_into_datagram(self._gain_ptr(geometry))
 
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        gain = self._compile_gain(geometry)
+        return lambda: Base().gain_into_datagram(gain())
+
     def _into_segment(self: Self, ptr: GainPtr, segment: Segment, transition_mode: TransitionModeWrap) -> DatagramPtr:
         return Base().gain_into_datagram_with_segment(ptr, segment, transition_mode)
 
     @abstractmethod
     def _gain_ptr(self: Self, geometry: Geometry) -> GainPtr:
         pass
+
+    def _compile_gain(self: Self, geometry: Geometry) -> Callable[[], GainPtr]:
+        return lambda: self._gain_ptr(geometry)
@@ -1,5 +1,5 @@
 import ctypes
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Self, TypeVar
 
 import numpy as np
@@ -14,6 +14,10 @@ K = TypeVar("K")
 
 
 class Group[K](Datagram):
+    _key_map: Callable[[Device], K | None] | None
+    _labels: list[K | None] | None
+    _data_map: dict[K, Datagram | tuple[Datagram, Datagram]]
+
     def __init__(
         self: Self,
         key_map: Callable[[Device], K | None],
@@ -22,8 +26,22 @@ class Group[K](Datagram):
         super().__init__()
 
         self._key_map = key_map
+        self._labels = None
         self._data_map = data_map
 
+    @classmethod
+    def __private_new__(cls: type["Group[K]"], labels: list[K | None], data_map: dict[K, Datagram | tuple[Datagram, Datagram]]) -> "Group[K]":
+        ins = super().__new__(cls)
+        Datagram.__init__(ins)
+        ins._key_map = None
+        ins._labels = labels
+        ins._data_map = data_map
+        return ins
+
+    @staticmethod
+    def from_labels(labels: Sequence[K | None] | np.ndarray, data_map: dict[K, Datagram | tuple[Datagram, Datagram]]) -> "Group[K]":
+        return Group.__private_new__(labels.tolist() if isinstance(labels, np.ndarray) else list(labels), data_map)
+
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         keymap: dict[K, int] = {}
         datagrams: np.ndarray = np.ndarray(len(self._data_map), dtype=DatagramPtr)
@@ -45,10 +63,22 @@ class Group[K](Datagram):
                     raise InvalidDatagramTypeError
             keymap[key] = k
 
-        def f_native(_context: ctypes.c_void_p, geometry_ptr: GeometryPtr, dev_idx: int) -> int:
-            dev = Device(dev_idx, geometry_ptr)
-            key = self._key_map(dev)
-            return keymap[key] if key is not None else -1
+        key_map = self._key_map
+        labels = self._labels
+        if labels is None:
+
+            def f_native(_context: ctypes.c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int) -> int:
+                key = key_map(geometry[dev_idx])  # type: ignore[misc]
+                return keymap[key] if key is not None else -1
+
+        else:
+            if len(labels) != geometry.num_devices():
+                msg = f"The number of labels ({len(labels)}) does not match the number of devices ({geometry.num_devices()})"
+                raise ValueError(msg)
+
+            def f_native(_context: ctypes.c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int) -> int:
+                key = labels[dev_idx]
+                return keymap[key] if key is not None else -1
 
         self.f_native_ = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_void_p, GeometryPtr, ctypes.c_uint16)(f_native)
 
@@ -1,6 +1,9 @@
+import ctypes
 from abc import ABCMeta, abstractmethod
 from typing import Self, TypeVar
 
+import numpy as np
+
 from pyautd3.driver.datagram.datagram import Datagram
 from pyautd3.driver.datagram.with_finite_loop import DatagramL
 from pyautd3.driver.datagram.with_segment import DatagramS
@@ -19,14 +22,42 @@ class Modulation(
     Datagram,
     metaclass=ABCMeta,
 ):
+    _calc: tuple[object, np.ndarray, SamplingConfig] | None = None
+
     def __init__(self: Self) -> None:
         super().__init__()
 
+    def _params(self: Self) -> object | None:
+        return None
+
+    def _materialized(self: Self) -> tuple[np.ndarray, SamplingConfig] | None:
+        if self._calc is None:
+            return None
+        key = self._params()
+        if key is None or key != self._calc[0]:
+            self._calc = None
+            return None
+        return self._calc[1], self._calc[2]
+
+    def _memoize(self: Self, buffer: np.ndarray, config: SamplingConfig) -> tuple[np.ndarray, SamplingConfig]:
+        buffer.flags.writeable = False
+        key = self._params()
+        if key is not None:
+            self._calc = (key, buffer, config)
+        return buffer, config
+
+    def _ptr(self: Self) -> ModulationPtr:
+        materialized = self._materialized()
+        if materialized is None:
+            return self._modulation_ptr()
+        buffer, config = materialized
+        return Base().modulation_custom(buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)), len(buffer), config._inner)
+
     def _raw_ptr(self: Self, _: Geometry) -> ModulationPtr:
-        return self._modulation_ptr()
+        return self._ptr()
 
     def _datagram_ptr(self: Self, _: Geometry) -> DatagramPtr:
-        return Base().modulation_into_datagram(self._modulation_ptr())
+        return Base().modulation_into_datagram(self._ptr())
 
     def _into_segment(
         self: Self,
@@ -59,4 +90,7 @@ class Modulation(
         pass
 
     def sampling_config(self: Self) -> SamplingConfig:
+        materialized = self._materialized()
+        if materialized is not None:
+            return materialized[1]
         return SamplingConfig(Base().modulation_sampling_config(self._modulation_ptr()))
@@ -3,10 +3,13 @@ from ctypes import CFUNCTYPE, c_bool, c_uint8, c_uint16, c_void_p
 from threading import Lock
 from typing import Self
 
+from numpy.typing import ArrayLike
+
 from pyautd3.driver.datagram.datagram import Datagram
 from pyautd3.driver.geometry import Geometry
 from pyautd3.driver.geometry.device import Device
 from pyautd3.driver.geometry.transducer import Transducer
+from pyautd3.driver.utils import _transducer_offsets, _validate_bool_array
 from pyautd3.native_methods.autd3 import Segment
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
@@ -14,26 +17,58 @@ from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
 
 class OutputMask(Datagram):
     _segment: Segment
-    _cache: dict[int, Callable[[Transducer], bool]]
+    _cache: dict[int, tuple[Callable[[Transducer], bool], object]]
     _lock: Lock
+    _values: list[bool] | None
+    _offsets: list[int]
 
     def __init__(self: Self, f: Callable[[Device], Callable[[Transducer], bool]], segment: Segment = Segment.S0) -> None:
         super().__init__()
         self._segment = segment
         self._cache = {}
         self._lock = Lock()
+        self._values = None
+        self._offsets = []
 
-        def f_native(_context: c_void_p, geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int) -> int:
-            if dev_idx not in self._cache:
+        def f_native(_context: c_void_p, geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int) -> bool:
+            cached = self._cache.get(dev_idx)
+            if cached is None:
                 with self._lock:
-                    self._cache[dev_idx] = f(Device(dev_idx, geometry_ptr))
-            return self._cache[dev_idx](Transducer(tr_idx, dev_idx, Base().device(geometry_ptr, dev_idx)))
+                    dev = Device(dev_idx, geometry_ptr)
+                    cached = (f(dev), dev._ptr)
+                    self._cache[dev_idx] = cached
+            fn, dev_ptr = cached
+            return fn(Transducer(tr_idx, dev_idx, dev_ptr))  # type: ignore[bad-argument-type]
 
         self._f_native = CFUNCTYPE(c_bool, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
 
+    @classmethod
+    def __private_new__(cls: type["OutputMask"], values: list[bool], segment: Segment) -> "OutputMask":
+        ins = super().__new__(cls)
+        Datagram.__init__(ins)
+        ins._segment = segment
+        ins._cache = {}
+        ins._lock = Lock()
+        ins._values = values
+        ins._offsets = []
+
+        offsets = ins._offsets
+
+        def f_native(_context: c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int) -> bool:
+            return values[offsets[dev_idx] + tr_idx]
+
+        ins._f_native = CFUNCTYPE(c_bool, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
+        return ins
+
     @staticmethod
     def with_segment(f: Callable[[Device], Callable[[Transducer], bool]], segment: Segment) -> "OutputMask":
         return OutputMask(f, segment)
 
+    @staticmethod
+    def from_array(mask: ArrayLike, segment: Segment = Segment.S0) -> "OutputMask":
+        return OutputMask.__private_new__(_validate_bool_array(mask).ravel().tolist(), segment)
+
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        if self._values is not None:
+            self._offsets[:] = _transducer_offsets(geometry, len(self._values), "mask elements")
         return Base().datagram_output_mask_with_segment(self._f_native, c_void_p(None), geometry._geometry_ptr, self._segment)  # type: ignore[bad-argument-type]
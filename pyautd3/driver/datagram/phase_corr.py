@@ -1,33 +1,67 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from ctypes import CFUNCTYPE, c_uint8, c_uint16, c_void_p
 from threading import Lock
 from typing import Self
 
+from numpy.typing import ArrayLike
+
 from pyautd3.driver.datagram.datagram import Datagram
 from pyautd3.driver.firmware.fpga.phase import Phase
 from pyautd3.driver.geometry import Geometry
 from pyautd3.driver.geometry.device import Device
 from pyautd3.driver.geometry.transducer import Transducer
+from pyautd3.driver.utils import _transducer_offsets, _validate_u8_array
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
 
 
 class PhaseCorrection(Datagram):
-    _cache: dict[int, Callable[[Transducer], Phase]]
+    _cache: dict[int, tuple[Callable[[Transducer], Phase], object]]
     _lock: Lock
+    _values: list[int] | None
+    _offsets: list[int]
 
     def __init__(self: Self, f: Callable[[Device], Callable[[Transducer], Phase]]) -> None:
         super().__init__()
         self._cache = {}
         self._lock = Lock()
+        self._values = None
+        self._offsets = []
 
         def f_native(_context: c_void_p, geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int) -> int:
-            if dev_idx not in self._cache:
+            cached = self._cache.get(dev_idx)
+            if cached is None:
                 with self._lock:
-                    self._cache[dev_idx] = f(Device(dev_idx, geometry_ptr))
-            return self._cache[dev_idx](Transducer(tr_idx, dev_idx, Base().device(geometry_ptr, dev_idx))).value
+                    dev = Device(dev_idx, geometry_ptr)
+                    cached = (f(dev), dev._ptr)
+                    self._cache[dev_idx] = cached
+            fn, dev_ptr = cached
+            return fn(Transducer(tr_idx, dev_idx, dev_ptr)).value  # type: ignore[bad-argument-type]
 
         self._f_native = CFUNCTYPE(c_uint8, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
 
+    @classmethod
+    def __private_new__(cls: type["PhaseCorrection"], values: list[int]) -> "PhaseCorrection":
+        ins = super().__new__(cls)
+        Datagram.__init__(ins)
+        ins._cache = {}
+        ins._lock = Lock()
+        ins._values = values
+        ins._offsets = []
+
+        offsets = ins._offsets
+
+        def f_native(_context: c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int) -> int:
+            return values[offsets[dev_idx] + tr_idx]
+
+        ins._f_native = CFUNCTYPE(c_uint8, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
+        return ins
+
+    @staticmethod
+    def from_array(phases: ArrayLike | Sequence[ArrayLike]) -> "PhaseCorrection":
+        return PhaseCorrection.__private_new__(_validate_u8_array(phases).ravel().tolist())
+
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        if self._values is not None:
+            self._offsets[:] = _transducer_offsets(geometry, len(self._values), "phases")
         return Base().datagram_phase_corr(self._f_native, c_void_p(None), geometry._geometry_ptr)  # type: ignore[bad-argument-type]
@@ -3,6 +3,9 @@ from ctypes import CFUNCTYPE, c_uint8, c_uint16, c_uint64, c_void_p
 from threading import Lock
 from typing import Self
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from pyautd3.driver.datagram.datagram import Datagram
 from pyautd3.driver.firmware.fpga import PulseWidth
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
@@ -11,16 +14,24 @@ from pyautd3.driver.geometry.device import Device
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import DatagramPtr, GeometryPtr
 
+PULSE_WIDTH_ENCODER_TABLE_SIZE: int = 256
+
 
 class PulseWidthEncoder(Datagram):
     _cache: dict[int, Callable[[Intensity], PulseWidth]]
     _lock: Lock
     _f_native: Callable[[c_void_p, GeometryPtr, int, int], int] | None
+    _tables: list[list[int]] | None
+    _rows: list[int]
+    _index: list[int]
 
     def __init__(self: Self, f: Callable[[Device], Callable[[Intensity], PulseWidth]] | None = None) -> None:
         super().__init__()
         self._cache = {}
         self._lock = Lock()
+        self._tables = None
+        self._rows = []
+        self._index = []
 
         if f is None:
             self._f_native = None
@@ -35,7 +46,49 @@ class PulseWidthEncoder(Datagram):
 
             self._f_native = CFUNCTYPE(c_uint64, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
 
+    @classmethod
+    def __private_new__(cls: type["PulseWidthEncoder"], tables: list[list[int]], rows: list[int]) -> "PulseWidthEncoder":
+        ins = super().__new__(cls)
+        Datagram.__init__(ins)
+        ins._cache = {}
+        ins._lock = Lock()
+        ins._tables = tables
+        ins._rows = rows
+        ins._index = []
+
+        index = ins._index
+
+        def f_native(_context: c_void_p, _geometry_ptr: GeometryPtr, dev_idx: int, idx: int) -> int:
+            return tables[index[dev_idx]][idx]
+
+        ins._f_native = CFUNCTYPE(c_uint64, c_void_p, GeometryPtr, c_uint16, c_uint8)(f_native)
+        return ins
+
+    @staticmethod
+    def from_table(table: ArrayLike) -> "PulseWidthEncoder":
+        table_ = np.asarray(table)
+        if table_.ndim == 1:
+            table_ = table_[np.newaxis, :]
+        if table_.ndim != 2 or table_.shape[1] != PULSE_WIDTH_ENCODER_TABLE_SIZE:  # noqa: PLR2004
+            msg = f"table must have shape ({PULSE_WIDTH_ENCODER_TABLE_SIZE},) or (D, {PULSE_WIDTH_ENCODER_TABLE_SIZE}), but got {table_.shape}"
+            raise ValueError(msg)
+        if table_.size != 0 and not np.issubdtype(table_.dtype, np.integer):
+            raise TypeError
+        unique, rows = np.unique(table_, axis=0, return_inverse=True)
+        values, inverse = np.unique(unique, return_inverse=True)
+        encoded = np.array([PulseWidth(int(v))._inner.value for v in values], dtype=np.uint64)
+        return PulseWidthEncoder.__private_new__(encoded[inverse.reshape(unique.shape)].tolist(), rows.ravel().tolist())
+
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
+        if self._tables is not None:
+            num_devices = geometry.num_devices()
+            if len(self._rows) == 1:
+                self._index[:] = self._rows * num_devices
+            elif len(self._rows) == num_devices:
+                self._index[:] = self._rows
+            else:
+                msg = f"The number of tables ({len(self._rows)}) does not match the number of devices ({num_devices})"
+                raise ValueError(msg)
         return (
             Base().datagram_pulse_width_encoder_default()
             if self._f_native is None
@@ -3,6 +3,7 @@ from pyautd3.native_methods.autd3 import GainSTMMode
 from .control_point import ControlPoint, ControlPoints
 from .foci import FociSTM
 from .gain import GainSTM, GainSTMOption
+from .streamer import StmStreamer, StmStreamStats
 
 __all__ = [
     "ControlPoint",
@@ -11,4 +12,6 @@ __all__ = [
     "GainSTM",
     "GainSTMMode",
     "GainSTMOption",
+    "StmStreamStats",
+    "StmStreamer",
 ]
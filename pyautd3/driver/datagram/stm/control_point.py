@@ -10,6 +10,12 @@ from pyautd3.native_methods.structs import Point3
 
 # _pad is not required for python 3.12+?
 
+_CONTROL_POINT_DTYPE = np.dtype([("point", np.float32, (3,)), ("offset", np.uint8), ("_pad", np.uint8, (3,))])
+
+
+def _control_points_dtype(n: int) -> np.dtype:
+    return np.dtype([("points", _CONTROL_POINT_DTYPE, (n,)), ("intensity", np.uint8), ("_pad", np.uint8, (3,))])
+
 
 class ControlPoint(ctypes.Structure):
     _fields_ = [
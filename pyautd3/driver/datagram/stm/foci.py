@@ -1,5 +1,5 @@
 import ctypes
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Self
 
 import numpy as np
@@ -7,23 +7,15 @@ from numpy.typing import ArrayLike
 
 from pyautd3.driver.common.freq import Freq
 from pyautd3.driver.datagram.datagram import Datagram
-from pyautd3.driver.datagram.stm.control_point import (
-    ControlPoint,
-    ControlPoints,
-    ControlPoints1,
-    ControlPoints2,
-    ControlPoints3,
-    ControlPoints4,
-    ControlPoints5,
-    ControlPoints6,
-    ControlPoints7,
-    ControlPoints8,
-)
+from pyautd3.driver.datagram.stm.control_point import _CONTROL_POINT_DTYPE, ControlPoint, ControlPoints, _control_points_dtype
 from pyautd3.driver.datagram.stm.stm_sampling_config import FreqNearest, PeriodNearest, _sampling_config
 from pyautd3.driver.datagram.with_finite_loop import DatagramL
 from pyautd3.driver.datagram.with_segment import DatagramS
+from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
+from pyautd3.driver.firmware.fpga.phase import Phase
 from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.driver.geometry import Geometry
+from pyautd3.driver.utils import _validate_u8_array
 from pyautd3.native_methods.autd3 import Segment
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import DatagramPtr, FociSTMPtr, TransitionModeWrap
@@ -31,13 +23,14 @@ from pyautd3.utils import Duration
 
 
 class FociSTM(DatagramS[FociSTMPtr], DatagramL[FociSTMPtr], Datagram):
-    foci: list[ControlPoints]
+    _foci: list[ControlPoints] | None
+    _buffer: np.ndarray | None
     config: SamplingConfig | Freq[float] | Duration | FreqNearest | PeriodNearest
 
     @classmethod
     def __private_new__(
         cls: type["FociSTM"],
-        foci: (Iterable[ArrayLike] | Iterable[ControlPoint] | Iterable[ControlPoints]),
+        foci: (Iterable[ArrayLike] | Iterable[ControlPoint] | Iterable[ControlPoints] | np.ndarray),
         config: SamplingConfig | Freq[float] | Duration | FreqNearest | PeriodNearest,
     ) -> "FociSTM":
         ins = super().__new__(cls)
@@ -46,17 +39,26 @@ class FociSTM(DatagramS[FociSTMPtr], DatagramL[FociSTMPtr], Datagram):
 
     def __private_init__(
         self: "FociSTM",
-        foci: (Iterable[ArrayLike] | Iterable[ControlPoint] | Iterable[ControlPoints]),
+        foci: (Iterable[ArrayLike] | Iterable[ControlPoint] | Iterable[ControlPoints] | np.ndarray),
         config: SamplingConfig | Freq[float] | Duration | FreqNearest | PeriodNearest,
     ) -> None:
-        foci_ = list(foci)
-        match foci_[0]:
-            case ControlPoints():
-                self.foci = foci_  # type: ignore[bad-assignment]
-            case ControlPoint():
-                self.foci = [ControlPoints(points=[p]) for p in foci_]
+        self._foci = None
+        self._buffer = None
+        match foci:
+            case np.ndarray() if foci.dtype.names is not None:
+                self._buffer = foci
             case _:
-                self.foci = [ControlPoints(points=[ControlPoint(point=p)]) for p in foci_]
+                foci_ = list(foci)
+                match foci_[0]:
+                    case ControlPoints():
+                        self._foci = foci_  # type: ignore[bad-assignment]
+                    case ControlPoint():
+                        self._foci = [ControlPoints(points=[p]) for p in foci_]  # type: ignore[bad-argument-type]
+                    case _:
+                        points = np.asarray(foci_, dtype=np.float32).reshape(len(foci_), 1, 3)
+                        self._buffer = np.zeros(len(points), dtype=_control_points_dtype(1))
+                        self._buffer["points"]["point"] = points
+                        self._buffer["intensity"] = Intensity.MAX.value
 
         self.config = config
 
@@ -67,60 +69,80 @@ class FociSTM(DatagramS[FociSTMPtr], DatagramL[FociSTMPtr], Datagram):
     ) -> None:
         self.__private_init__(foci, config)
 
+    @staticmethod
+    def from_array(
+        points: ArrayLike,
+        config: SamplingConfig | Freq[float] | Duration,
+        intensity: ArrayLike | None = None,
+        phase_offset: ArrayLike | None = None,
+    ) -> "FociSTM":
+        points_ = np.asarray(points, dtype=np.float32)
+        if points_.ndim == 2:  # noqa: PLR2004
+            points_ = points_[:, np.newaxis, :]
+        if points_.ndim != 3 or points_.shape[2] != 3 or not 0 < points_.shape[1] <= 8:  # noqa: PLR2004
+            msg = f"points must have shape (T, n, 3) with 1 <= n <= 8, but got {np.shape(points)}"
+            raise ValueError(msg)
+        buffer = np.zeros(len(points_), dtype=_control_points_dtype(points_.shape[1]))
+        buffer["points"]["point"] = points_
+        buffer["points"]["offset"] = 0 if phase_offset is None else _validate_u8_array(np.asarray(phase_offset))
+        buffer["intensity"] = Intensity.MAX.value if intensity is None else _validate_u8_array(np.asarray(intensity))
+        return FociSTM.__private_new__(buffer, config)
+
+    @property
+    def foci(self: Self) -> list[ControlPoints]:
+        if self._foci is None:
+            buffer: np.ndarray = self._buffer  # type: ignore[bad-assignment]
+            self._foci = [
+                ControlPoints(
+                    points=[ControlPoint(point=p["point"], phase_offset=Phase(int(p["offset"]))) for p in f["points"]],
+                    intensity=Intensity(int(f["intensity"])),
+                )
+                for f in buffer
+            ]
+        return self._foci
+
+    @foci.setter
+    def foci(self: Self, value: list[ControlPoints]) -> None:
+        self._foci = value
+        self._buffer = None
+
     def into_nearest(self: Self) -> "FociSTM":
+        foci = self._foci if self._buffer is None else self._buffer
         match self.config:
             case Freq() as freq:
-                return FociSTM.__private_new__(self.foci, FreqNearest(freq))
+                return FociSTM.__private_new__(foci, FreqNearest(freq))  # type: ignore[bad-argument-type]
             case Duration() as period:
-                return FociSTM.__private_new__(self.foci, PeriodNearest(period))
+                return FociSTM.__private_new__(foci, PeriodNearest(period))  # type: ignore[bad-argument-type]
             case _:
                 raise TypeError
 
     def _raw_ptr(self: Self, _: Geometry) -> FociSTMPtr:
-        n = self._n()
-        match n:
-            case 1:
-                foci = (ControlPoints1(p.points[0], p.intensity.value) for p in self.foci)
-            case 2:
-                foci = (ControlPoints2(p.points[0], p.points[1], p.intensity.value) for p in self.foci)
-            case 3:
-                foci = (ControlPoints3(p.points[0], p.points[1], p.points[2], p.intensity.value) for p in self.foci)
-            case 4:
-                foci = (ControlPoints4(p.points[0], p.points[1], p.points[2], p.points[3], p.intensity.value) for p in self.foci)
-            case 5:
-                foci = (ControlPoints5(p.points[0], p.points[1], p.points[2], p.points[3], p.points[4], p.intensity.value) for p in self.foci)
-            case 6:
-                foci = (
-                    ControlPoints6(p.points[0], p.points[1], p.points[2], p.points[3], p.points[4], p.points[5], p.intensity.value) for p in self.foci
-                )
-            case 7:
-                foci = (
-                    ControlPoints7(p.points[0], p.points[1], p.points[2], p.points[3], p.points[4], p.points[5], p.points[6], p.intensity.value)
-                    for p in self.foci
-                )
-            case _:
-                foci = (
-                    ControlPoints8(
-                        p.points[0],
-                        p.points[1],
-                        p.points[2],
-                        p.points[3],
-                        p.points[4],
-                        p.points[5],
-                        p.points[6],
-                        p.points[7],
-                        p.intensity.value,
-                    )
-                    for p in self.foci
-                )
-        foci_ = np.fromiter((np.void(p) for p in foci), dtype=np.dtype((np.void, 4 + n * 16)))  # type: ignore[no-matching-overload]
+        return self._foci_ptr(self._pack(), self.sampling_config())
+
+    def _compile_raw(self: Self, _: Geometry) -> Callable[[], FociSTMPtr]:
+        buffer = self._pack()
+        config = self.sampling_config()
+        return lambda: self._foci_ptr(buffer, config)
+
+    def _foci_ptr(self: Self, buffer: np.ndarray, config: SamplingConfig) -> FociSTMPtr:
         return Base().stm_foci(
-            self.sampling_config()._inner,
-            foci_.ctypes.data_as(ctypes.c_void_p),
-            len(self.foci),
-            n,
+            config._inner,
+            buffer.ctypes.data_as(ctypes.c_void_p),
+            len(buffer),
+            buffer.dtype["points"].shape[0],
         )
 
+    def _pack(self: Self) -> np.ndarray:
+        if self._buffer is not None:
+            return self._buffer
+        foci: list[ControlPoints] = self._foci  # type: ignore[bad-assignment]
+        n = self._n()
+        buffer = np.empty(len(foci), dtype=_control_points_dtype(n))
+        buffer["points"] = np.frombuffer(b"".join(bytes(p) for f in foci for p in f.points), dtype=_CONTROL_POINT_DTYPE).reshape(len(foci), n)
+        buffer["intensity"] = np.fromiter((f.intensity.value for f in foci), dtype=np.uint8, count=len(foci))
+        buffer["_pad"] = 0
+        return buffer
+
     def _into_segment(self: Self, ptr: FociSTMPtr, segment: Segment, transition_mode: TransitionModeWrap) -> DatagramPtr:
         return Base().stm_foci_into_datagram_with_segment(ptr, self._n(), segment, transition_mode)
 
@@ -142,10 +164,17 @@ class FociSTM(DatagramS[FociSTMPtr], DatagramL[FociSTMPtr], Datagram):
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return Base().stm_foci_into_datagram(self._raw_ptr(geometry), self._n())
 
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        raw = self._compile_raw(geometry)
+        n = self._n()
+        return lambda: Base().stm_foci_into_datagram(raw(), n)
+
     def sampling_config(self: Self) -> SamplingConfig:
-        return _sampling_config(self.config, len(self.foci))
+        return _sampling_config(self.config, len(self._foci) if self._buffer is None else len(self._buffer))  # type: ignore[bad-argument-type]
 
     def _n(self: Self) -> int:
+        if self._buffer is not None:
+            return self._buffer.dtype["points"].shape[0]
         n = len(self.foci[0].points)
         if any(len(f.points) != n for f in self.foci):
             msg = "All components must have the same number of foci"
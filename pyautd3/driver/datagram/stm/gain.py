@@ -1,5 +1,5 @@
 import ctypes
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Self
 
 import numpy as np
@@ -77,6 +77,19 @@ class GainSTM(DatagramS[GainSTMPtr], DatagramL[GainSTMPtr], Datagram):
             self.option._inner(),
         )
 
+    def _compile_raw(self: Self, geometry: Geometry) -> Callable[[], GainSTMPtr]:
+        compiled = [g._compile_gain(geometry) for g in self.gains]
+        config = self.sampling_config()._inner
+        option = self.option._inner()
+
+        def raw_ptr() -> GainSTMPtr:
+            gains: np.ndarray = np.ndarray(len(compiled), dtype=GainPtr)
+            for i, g in enumerate(compiled):
+                gains[i]["value"] = g().value
+            return Base().stm_gain(config, gains.ctypes.data_as(ctypes.POINTER(GainPtr)), len(gains), option)
+
+        return raw_ptr
+
     def _into_segment(
         self: Self,
         ptr: GainSTMPtr,
@@ -97,5 +110,9 @@ class GainSTM(DatagramS[GainSTMPtr], DatagramL[GainSTMPtr], Datagram):
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return Base().stm_gain_into_datagram(self._raw_ptr(geometry))
 
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        raw = self._compile_raw(geometry)
+        return lambda: Base().stm_gain_into_datagram(raw())
+
     def sampling_config(self: Self) -> SamplingConfig:
         return _sampling_config(self.config, len(self.gains))
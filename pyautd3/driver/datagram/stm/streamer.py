@@ -0,0 +1,198 @@
+import itertools
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pyautd3.driver.common.freq import Freq
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.stm.foci import FociSTM
+from pyautd3.driver.datagram.stm.gain import GainSTM, GainSTMOption
+from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
+from pyautd3.driver.firmware.fpga.transition_mode import SyncIdx, SysTime
+from pyautd3.ethercat.dc_sys_time import DcSysTime
+from pyautd3.native_methods.autd3 import Segment
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from pyautd3.controller.controller import Controller
+
+STM_BUF_SIZE_MIN: int = 2
+FOCI_STM_BUF_SIZE_MAX: int = 65535
+GAIN_STM_BUF_SIZE_MAX: int = 1024
+
+_END = object()
+
+
+class StmStreamStats:
+    chunks: int
+    frames: int
+    underruns: int
+    min_slack_ns: int | None
+    max_late_ns: int
+
+    def __init__(self: Self) -> None:
+        self.chunks = 0
+        self.frames = 0
+        self.underruns = 0
+        self.min_slack_ns = None
+        self.max_late_ns = 0
+
+    def __repr__(self: Self) -> str:
+        return (
+            f"StmStreamStats(chunks={self.chunks}, frames={self.frames}, underruns={self.underruns}, "
+            f"min_slack_ns={self.min_slack_ns}, max_late_ns={self.max_late_ns})"
+        )
+
+
+class StmStreamer:
+    _source: Iterator[ArrayLike | Gain]
+    _config: SamplingConfig
+    _chunk_size: int | None
+    _option: GainSTMOption
+    _queue_depth: int
+    _stats: StmStreamStats
+
+    def __init__(
+        self: Self,
+        source: Iterable[ArrayLike | Gain],
+        config: SamplingConfig | Freq[int] | Freq[float] | Duration,
+        *,
+        chunk_size: int | None = None,
+        option: GainSTMOption | None = None,
+        queue_depth: int = 2,
+    ) -> None:
+        if chunk_size is not None and not STM_BUF_SIZE_MIN <= chunk_size <= FOCI_STM_BUF_SIZE_MAX:
+            msg = f"chunk_size ({chunk_size}) is out of range ([{STM_BUF_SIZE_MIN}, {FOCI_STM_BUF_SIZE_MAX}])"
+            raise ValueError(msg)
+        if queue_depth <= 0:
+            msg = "queue_depth must be greater than 0"
+            raise ValueError(msg)
+        self._source = iter(source)
+        self._config = SamplingConfig(config)
+        self._chunk_size = chunk_size
+        self._option = option or GainSTMOption()
+        self._queue_depth = queue_depth
+        self._stats = StmStreamStats()
+
+    def stats(self: Self) -> StmStreamStats:
+        return self._stats
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return self._config
+
+    def _batches(self: Self) -> Iterator[list[Gain | ArrayLike]]:
+        try:
+            first = next(self._source)
+        except StopIteration:
+            return
+        limit = GAIN_STM_BUF_SIZE_MAX if isinstance(first, Gain) else FOCI_STM_BUF_SIZE_MAX
+        size = min(self._chunk_size or limit, limit)
+        items = itertools.chain([first], self._source)
+        pending = list(itertools.islice(items, size))
+        if len(pending) < STM_BUF_SIZE_MIN:
+            msg = f"The stream must contain at least {STM_BUF_SIZE_MIN} frames"
+            raise ValueError(msg)
+        while True:
+            head = list(itertools.islice(items, STM_BUF_SIZE_MIN))
+            match len(head):
+                case 0:
+                    yield pending
+                    return
+                case 1 if len(pending) < limit:
+                    yield pending + head
+                    return
+                case 1:
+                    yield pending[:-1]
+                    yield pending[-1:] + head
+                    return
+            yield pending
+            pending = head + list(itertools.islice(items, size - STM_BUF_SIZE_MIN))
+
+    def _build(self: Self, batch: list[Gain | ArrayLike]) -> FociSTM | GainSTM:
+        if isinstance(batch[0], Gain):
+            return GainSTM(gains=batch, config=self._config, option=self._option)  # type: ignore[bad-argument-type]
+        return FociSTM.from_array(np.asarray(batch, dtype=np.float32), self._config)
+
+    def __iter__(self: Self) -> Iterator[FociSTM | GainSTM]:
+        return (self._build(batch) for batch in self._batches())
+
+    @staticmethod
+    def _segment(idx: int, first_segment: Segment) -> Segment:
+        if idx % 2 == 0:
+            return first_segment
+        return Segment.S0 if first_segment == Segment.S1 else Segment.S1
+
+    def _produce(self: Self, chunks: queue.Queue, stop: threading.Event) -> None:
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        try:
+            for batch in self._batches():
+                if not put((self._build(batch), len(batch))):
+                    return
+            put(_END)
+        except BaseException as e:  # noqa: BLE001
+            put(e)
+
+    def play(
+        self: Self,
+        controller: "Controller",
+        *,
+        lead: Duration | None = None,
+        margin: Duration | None = None,
+        sys_time: bool = True,
+        first_segment: Segment = Segment.S1,
+    ) -> StmStreamStats:
+        lead_ns = (lead or Duration.from_millis(50)).as_nanos()
+        margin_ns = (margin or Duration.from_millis(2)).as_nanos()
+        period_ns = self._config.period().as_nanos()
+        chunks: queue.Queue[tuple[FociSTM | GainSTM, int] | BaseException | object] = queue.Queue(maxsize=self._queue_depth)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._produce, args=(chunks, stop), daemon=True)
+        producer.start()
+        try:
+            origin = time.monotonic_ns()
+            origin_dc = DcSysTime.now()
+            start_ns = lead_ns
+            playing_ns = None
+            idx = 0
+            while (item := chunks.get()) is not _END:
+                if isinstance(item, BaseException):
+                    raise item
+                stm, n = item  # type: ignore[misc]
+                if playing_ns is not None and (wait_ns := playing_ns - (time.monotonic_ns() - origin)) > 0:
+                    time.sleep(wait_ns / 1e9)
+                elapsed_ns = time.monotonic_ns() - origin
+                slack_ns = start_ns - margin_ns - elapsed_ns
+                if slack_ns < 0:
+                    if idx > 0:
+                        self._stats.underruns += 1
+                        self._stats.max_late_ns = max(self._stats.max_late_ns, -slack_ns)
+                    start_ns = elapsed_ns + lead_ns
+                elif idx > 0:
+                    self._stats.min_slack_ns = slack_ns if self._stats.min_slack_ns is None else min(self._stats.min_slack_ns, slack_ns)
+                transition_mode = SysTime(origin_dc + Duration.from_nanos(start_ns)) if sys_time else SyncIdx()
+                controller.send(
+                    WithFiniteLoop(inner=stm, segment=self._segment(idx, first_segment), transition_mode=transition_mode, loop_count=1),
+                )
+                self._stats.chunks += 1
+                self._stats.frames += n
+                playing_ns = start_ns
+                start_ns += n * period_ns
+                idx += 1
+        finally:
+            stop.set()
+            producer.join()
+        return self._stats
@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
 from typing import Self, TypeVar
 
 from pyautd3.driver.datagram.datagram import Datagram
@@ -26,6 +27,9 @@ class DatagramL[P](metaclass=ABCMeta):
     def _raw_ptr(self: Self, geometry: Geometry) -> P:
         pass
 
+    def _compile_raw(self: Self, geometry: Geometry) -> Callable[[], P]:
+        return lambda: self._raw_ptr(geometry)
+
 
 class WithFiniteLoop[DL: "DatagramL"](Datagram):
     inner: DL
@@ -46,3 +50,8 @@ class WithFiniteLoop[DL: "DatagramL"](Datagram):
 
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return self.inner._into_loop_behavior(self.inner._raw_ptr(geometry), self.segment, self.transition_mode, self.loop_count)
+
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        raw = self.inner._compile_raw(geometry)
+        inner, segment, transition_mode, loop_count = self.inner, self.segment, self.transition_mode, self.loop_count
+        return lambda: inner._into_loop_behavior(raw(), segment, transition_mode, loop_count)
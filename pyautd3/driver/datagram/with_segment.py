@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
 from typing import Self, TypeVar
 
 from pyautd3.driver.datagram.datagram import Datagram
@@ -20,6 +21,9 @@ class DatagramS[P](metaclass=ABCMeta):
     def _raw_ptr(self: Self, geometry: Geometry) -> P:
         pass
 
+    def _compile_raw(self: Self, geometry: Geometry) -> Callable[[], P]:
+        return lambda: self._raw_ptr(geometry)
+
 
 class WithSegment[DS: "DatagramS"](Datagram):
     inner: DS
@@ -34,3 +38,8 @@ class WithSegment[DS: "DatagramS"](Datagram):
 
     def _datagram_ptr(self: Self, geometry: Geometry) -> DatagramPtr:
         return self.inner._into_segment(self.inner._raw_ptr(geometry), self.segment, self.transitiom_mode)
+
+    def _compile(self: Self, geometry: Geometry) -> Callable[[], DatagramPtr]:
+        raw = self.inner._compile_raw(geometry)
+        inner, segment, transition_mode = self.inner, self.segment, self.transitiom_mode
+        return lambda: inner._into_segment(raw(), segment, transition_mode)
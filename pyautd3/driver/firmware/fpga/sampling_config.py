@@ -6,7 +6,7 @@ from pyautd3.driver.common import Freq
 from pyautd3.driver.common.freq import Hz
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi import SamplingConfigWrap
-from pyautd3.native_methods.utils import _validate_duration, _validate_f32, _validate_u16
+from pyautd3.native_methods.utils import LazyConstant, _validate_duration, _validate_f32, _validate_u16
 from pyautd3.utils import Duration
 
 
@@ -54,9 +54,5 @@ class SamplingConfig:
     def __hash__(self: Self) -> int:
         return self._inner.__hash__()  # pragma: no cover
 
-    FREQ_40K: "SamplingConfig"
-    FREQ_4K: "SamplingConfig"
-
-
-SamplingConfig.FREQ_40K = SamplingConfig(40000.0 * Hz)
-SamplingConfig.FREQ_4K = SamplingConfig(4000.0 * Hz)
+    FREQ_40K = LazyConstant(lambda: SamplingConfig(40000.0 * Hz))
+    FREQ_4K = LazyConstant(lambda: SamplingConfig(4000.0 * Hz))
@@ -13,16 +13,20 @@ from .transducer import Transducer
 
 
 class Device:
+    __slots__ = ("_geo_ptr", "_idx", "_positions", "_ptr", "_transducers")
+
     _idx: int
     _geo_ptr: GeometryPtr
     _ptr: DevicePtr
-    _transducers: list[Transducer]
+    _transducers: list[Transducer | None]
+    _positions: np.ndarray | None
 
     def __init__(self: Self, idx: int, ptr: GeometryPtr) -> None:
         self._idx = idx
         self._geo_ptr = ptr
         self._ptr = Base().device(ptr, idx)
-        self._transducers = [Transducer(i, idx, self._ptr) for i in range(int(Base().device_num_transducers(self._ptr)))]
+        self._transducers = [None] * int(Base().device_num_transducers(self._ptr))
+        self._positions = None
 
     def idx(self: Self) -> int:
         return self._idx
@@ -45,8 +49,23 @@ class Device:
     def axial_direction(self: Self) -> np.ndarray:
         return Base().device_direction_axial(self._ptr).ndarray()
 
+    def positions(self: Self) -> np.ndarray:
+        if self._positions is None:
+            positions = np.empty((len(self._transducers), 3), dtype=np.float32)
+            for i in range(len(self._transducers)):
+                p = Base().transducer_position(Base().transducer(self._ptr, i))
+                positions[i] = (p.x, p.y, p.z)
+            positions.setflags(write=False)
+            self._positions = positions
+        return self._positions
+
     def __getitem__(self: Self, key: int) -> Transducer:
-        return self._transducers[key]
+        tr = self._transducers[key]
+        if tr is None:
+            idx = range(len(self._transducers))[key]
+            tr = Transducer(idx, self._idx, self._ptr)
+            self._transducers[idx] = tr
+        return tr
 
     def __iter__(self: Self) -> Iterator[Transducer]:
-        return iter(self._transducers)
+        return (self[i] for i in range(len(self._transducers)))
@@ -1,6 +1,6 @@
 import ctypes
 from collections.abc import Callable, Iterator
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 import numpy as np
 
@@ -11,14 +11,36 @@ from pyautd3.native_methods.structs import Point3, Quaternion
 
 from .device import Device
 
+if TYPE_CHECKING:
+    from pyautd3.driver.datagram.gain import Gain
+
 
 class Geometry:
+    __slots__ = ("_device_indices", "_devices", "_directions", "_geometry_ptr", "_positions", "_version")
+
     _geometry_ptr: GeometryPtr
-    _devices: list[Device]
+    _devices: list[Device | None]
+    _positions: np.ndarray | None
+    _directions: np.ndarray | None
+    _device_indices: np.ndarray | None
+    _version: int
 
     def __init__(self: Self, ptr: GeometryPtr) -> None:
         self._geometry_ptr = ptr
-        self._devices = [Device(i, ptr) for i in range(int(Base().geometry_num_devices(self._geometry_ptr)))]
+        self._version = 0
+        self._devices = [None] * int(Base().geometry_num_devices(self._geometry_ptr))
+        self._invalidate_cache()
+
+    def _invalidate_cache(self: Self) -> None:
+        self._positions = None
+        self._directions = None
+        self._device_indices = None
+
+    def _stamp(self: Self) -> tuple[int, ...]:
+        return (self._version,)
+
+    def _solve_drives(self: Self, _gain: "Gain") -> np.ndarray | None:
+        return None
 
     def center(self: Self) -> np.ndarray:
         return Base().geometry_center(self._geometry_ptr).ndarray()
@@ -29,14 +51,48 @@ class Geometry:
     def num_transducers(self: Self) -> int:
         return int(Base().geometry_num_transducers(self._geometry_ptr))
 
+    def positions(self: Self) -> np.ndarray:
+        if self._positions is None:
+            positions = np.concatenate([dev.positions() for dev in self]) if self._devices else np.empty((0, 3), dtype=np.float32)
+            positions.setflags(write=False)
+            self._positions = positions
+        return self._positions
+
+    def directions(self: Self) -> np.ndarray:
+        if self._directions is None:
+            directions = np.empty((self.num_transducers(), 3), dtype=np.float32)
+            begin = 0
+            for dev in self:
+                end = begin + dev.num_transducers()
+                directions[begin:end] = dev.axial_direction()
+                begin = end
+            directions.setflags(write=False)
+            self._directions = directions
+        return self._directions
+
+    def device_indices(self: Self) -> np.ndarray:
+        if self._device_indices is None:
+            device_indices = np.repeat(
+                np.arange(len(self._devices), dtype=np.uint16),
+                [dev.num_transducers() for dev in self],
+            )
+            device_indices.setflags(write=False)
+            self._device_indices = device_indices
+        return self._device_indices
+
     def __getitem__(self: Self, key: int) -> Device:
-        return self._devices[key]
+        dev = self._devices[key]
+        if dev is None:
+            idx = range(len(self._devices))[key]
+            dev = Device(idx, self._geometry_ptr)
+            self._devices[idx] = dev
+        return dev
 
     def __iter__(self: Self) -> Iterator[Device]:
-        return iter(self._devices)
+        return (self[i] for i in range(len(self._devices)))
 
     def reconfigure(self: Self, f: Callable[[Device], AUTD3]) -> None:
-        devices = [f(d) for d in self._devices]
+        devices = [f(d) for d in self]
         pos = np.fromiter((np.void(Point3(d.pos)) for d in devices), dtype=Point3)  # type: ignore[no-matching-overload]
         rot = np.fromiter((np.void(Quaternion(d.rot)) for d in devices), dtype=Quaternion)  # type: ignore[no-matching-overload]
         Base().geometry_reconfigure(
@@ -44,4 +100,6 @@ class Geometry:
             pos.ctypes.data_as(ctypes.POINTER(Point3)),
             rot.ctypes.data_as(ctypes.POINTER(Quaternion)),
         )
-        self._devices = [Device(i, self._geometry_ptr) for i in range(int(Base().geometry_num_devices(self._geometry_ptr)))]
+        self._devices = [None] * int(Base().geometry_num_devices(self._geometry_ptr))
+        self._invalidate_cache()
+        self._version += 1
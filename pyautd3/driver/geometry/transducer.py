@@ -10,14 +10,24 @@ from pyautd3.native_methods.autd3capi_driver import (
 
 
 class Transducer:
+    __slots__ = ("_dev_idx", "_dev_ptr", "_idx", "_tr_ptr")
+
     _idx: int
     _dev_idx: int
-    _ptr: TransducerPtr
+    _dev_ptr: DevicePtr
+    _tr_ptr: TransducerPtr | None
 
     def __init__(self: Self, idx: int, dev_idx: int, ptr: DevicePtr) -> None:
         self._idx = idx
         self._dev_idx = dev_idx
-        self._ptr = Base().transducer(ptr, idx)
+        self._dev_ptr = ptr
+        self._tr_ptr = None
+
+    @property
+    def _ptr(self: Self) -> TransducerPtr:
+        if self._tr_ptr is None:
+            self._tr_ptr = Base().transducer(self._dev_ptr, self._idx)
+        return self._tr_ptr
 
     def idx(self: Self) -> int:
         return self._idx
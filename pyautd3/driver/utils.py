@@ -1,3 +1,13 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+if TYPE_CHECKING:
+    from pyautd3.driver.geometry import Geometry
+
+
 def _validate_u8(value: int) -> int:
     if not isinstance(value, int):
         raise TypeError
@@ -20,3 +30,40 @@ def _validate_nonzero_u32(value: int) -> int:
     if value <= 0 or value > 0xFFFFFFFF:  # noqa: PLR2004
         raise ValueError
     return value
+
+
+def _validate_int_array(value: ArrayLike | Sequence[ArrayLike], min_value: int, max_value: int) -> np.ndarray:
+    match value:
+        case np.ndarray():
+            arr = value
+        case _:
+            arr = np.asarray(value) if np.ndim(value) == 0 else np.concatenate([np.ravel(np.asarray(v)) for v in value])  # type: ignore[not-iterable]
+    if arr.size != 0 and not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError
+    if arr.size != 0 and (arr.min() < min_value or arr.max() > max_value):
+        raise ValueError
+    return arr
+
+
+def _validate_u8_array(value: ArrayLike | Sequence[ArrayLike]) -> np.ndarray:
+    return _validate_int_array(value, 0, 0xFF).astype(np.uint8, copy=False)
+
+
+def _validate_bool_array(value: ArrayLike) -> np.ndarray:
+    arr = np.asarray(value)
+    if arr.size != 0 and arr.dtype != np.bool_:
+        if not np.issubdtype(arr.dtype, np.integer):
+            raise TypeError
+        if arr.min() < 0 or arr.max() > 1:
+            raise ValueError
+    return arr.astype(np.bool_, copy=False)
+
+
+def _transducer_offsets(geometry: "Geometry", n: int, name: str) -> list[int]:
+    counts = [dev.num_transducers() for dev in geometry]
+    if n == sum(counts):
+        return np.cumsum([0, *counts[:-1]]).tolist()
+    if all(c == n for c in counts):
+        return [0] * len(counts)
+    msg = f"The number of {name} ({n}) does not match the number of transducers ({sum(counts)})"
+    raise ValueError(msg)
@@ -1,9 +1,12 @@
+import time
 from typing import Self
 
 from pyautd3.native_methods.autd3 import DcSysTime as _DcSysTime
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.utils import Duration
 
+_ECAT_EPOCH_NS: int = 946_684_800_000_000_000
+
 
 class DcSysTime:
     _inner: _DcSysTime
@@ -17,6 +20,12 @@ class DcSysTime:
         ins._inner = inner
         return ins
 
+    @staticmethod
+    def now() -> "DcSysTime":
+        inner = _DcSysTime()
+        inner.dc_sys_time = time.time_ns() - _ECAT_EPOCH_NS
+        return DcSysTime.__private_new__(inner)
+
     def sys_time(self: Self) -> int:
         return int(self._inner.dc_sys_time)
 
@@ -1,18 +1,27 @@
 import ctypes
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Self
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from pyautd3.driver.datagram.gain import Gain
 from pyautd3.driver.firmware.fpga import Drive
 from pyautd3.driver.geometry import Device, Geometry, Transducer
+from pyautd3.driver.utils import _validate_u8_array
 from pyautd3.native_methods.autd3 import Drive as Drive_
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import ConstPtr, GainPtr, GeometryPtr
 
 
 class Custom(Gain):
+    _drives: np.ndarray | None
+    _offsets: list[int]
+
     def __init__(self: Self, f: Callable[[Device], Callable[[Transducer], Drive]]) -> None:
         super().__init__()
+        self._drives = None
+        self._offsets = []
 
         dev_cache: dict[int, Device] = {}
         fn_cache: dict[int, Callable[[Transducer], Drive]] = {}
@@ -36,5 +45,47 @@ class Custom(Gain):
 
         self._f_native = ctypes.CFUNCTYPE(None, ConstPtr, GeometryPtr, ctypes.c_uint16, ctypes.c_uint8, ctypes.POINTER(Drive_))(f_native)
 
+    @classmethod
+    def __private_new__(cls: type["Custom"], drives: np.ndarray) -> "Custom":
+        ins = super().__new__(cls)
+        Gain.__init__(ins)
+        ins._drives = drives
+        ins._offsets = []
+
+        base = drives.ctypes.data
+        size = ctypes.sizeof(Drive_)
+        offsets = ins._offsets
+        memmove = ctypes.memmove
+
+        def f_native(_context: ConstPtr, _geometry_ptr: GeometryPtr, dev_idx: int, tr_idx: int, raw) -> None:  # noqa: ANN001
+            memmove(raw, base + (offsets[dev_idx] + tr_idx) * size, size)
+
+        ins._f_native = ctypes.CFUNCTYPE(None, ConstPtr, GeometryPtr, ctypes.c_uint16, ctypes.c_uint8, ctypes.POINTER(Drive_))(f_native)
+        return ins
+
+    @staticmethod
+    def from_arrays(phase: ArrayLike | Sequence[ArrayLike], intensity: ArrayLike | Sequence[ArrayLike]) -> "Custom":
+        phase_ = _validate_u8_array(phase).ravel()
+        intensity_ = _validate_u8_array(intensity).ravel()
+        if phase_.shape != intensity_.shape:
+            msg = "phase and intensity must have the same number of elements"
+            raise ValueError(msg)
+        drives = np.empty((len(phase_), 2), dtype=np.uint8)
+        drives[:, 0] = phase_
+        drives[:, 1] = intensity_
+        return Custom.__private_new__(drives)
+
+    def _update_offsets(self: Self, geometry: Geometry) -> None:
+        if self._drives is not None:
+            if len(self._drives) != geometry.num_transducers():
+                msg = f"The number of drives ({len(self._drives)}) does not match the number of transducers ({geometry.num_transducers()})"
+                raise ValueError(msg)
+            self._offsets[:] = np.cumsum([0, *[dev.num_transducers() for dev in geometry][:-1]]).tolist()
+
     def _gain_ptr(self: Self, geometry: Geometry) -> GainPtr:
+        self._update_offsets(geometry)
         return Base().gain_custom(self._f_native, ctypes.c_void_p(None), geometry._geometry_ptr)  # type: ignore[bad-argument-type]
+
+    def _compile_gain(self: Self, geometry: Geometry) -> Callable[[], GainPtr]:
+        self._update_offsets(geometry)
+        return lambda: Base().gain_custom(self._f_native, ctypes.c_void_p(None), geometry._geometry_ptr)  # type: ignore[bad-argument-type]
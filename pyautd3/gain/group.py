@@ -1,12 +1,14 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from ctypes import POINTER, c_int32, c_uint16
 from typing import Self, TypeVar
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 from pyautd3.autd_error import UnknownGroupKeyError
 from pyautd3.driver.datagram.gain import Gain
 from pyautd3.driver.geometry import Device, Geometry, Transducer
+from pyautd3.driver.utils import _transducer_offsets, _validate_int_array
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import GainPtr
 
@@ -14,20 +16,54 @@ K = TypeVar("K")
 
 
 class Group[K](Gain):
-    key_map: Callable[[Device], Callable[[Transducer], K | None]]
+    key_map: Callable[[Device], Callable[[Transducer], K | None]] | None
     gain_map: dict[K, Gain]
+    _labels: np.ndarray | None
+    _present: frozenset[int]
+    _cache: tuple[tuple[int, ...], list[np.ndarray]] | None
 
     def __init__(self: Self, key_map: Callable[[Device], Callable[[Transducer], K | None]], gain_map: dict[K, Gain]) -> None:
         super().__init__()
         self.key_map = key_map
         self.gain_map = gain_map
+        self._labels = None
+        self._present = frozenset()
+        self._cache = None
 
-    def _gain_ptr(self: Self, geometry: Geometry) -> GainPtr:
-        keymap: dict[K, int] = {}
+    @classmethod
+    def __private_new__(cls: type["Group[K]"], labels: np.ndarray, gain_map: dict[K, Gain]) -> "Group[K]":
+        ins = super().__new__(cls)
+        Gain.__init__(ins)
+        ins.key_map = None
+        ins.gain_map = gain_map
+        ins._labels = labels
+        ins._present = frozenset(np.unique(labels[labels >= 0]).tolist())
+        ins._cache = None
+        return ins
+
+    @staticmethod
+    def from_labels(labels: ArrayLike | Sequence[ArrayLike], gain_map: dict[K, Gain]) -> "Group[K]":
+        arr = _validate_int_array(labels, np.iinfo(np.int32).min, np.iinfo(np.int32).max)
+        return Group.__private_new__(np.ascontiguousarray(arr.ravel(), dtype=np.int32), gain_map)
 
-        device_indices = np.array([dev.idx() for dev in geometry])
+    def _label_maps(self: Self, geometry: Geometry) -> tuple[np.ndarray, list[np.ndarray]]:
+        labels: np.ndarray = self._labels  # type: ignore[bad-assignment]
+        keys = np.fromiter(self.gain_map.keys(), dtype=np.int32, count=len(self.gain_map))  # type: ignore[no-matching-overload]
+        if any(int(k) not in self._present for k in keys):
+            raise UnknownGroupKeyError
+        stamp = (*geometry._stamp(), geometry.num_devices(), geometry.num_transducers())
+        if self._cache is None or self._cache[0] != stamp:
+            offsets = _transducer_offsets(geometry, len(labels), "labels")
+            self._cache = (stamp, [labels[offset : offset + dev.num_transducers()] for offset, dev in zip(offsets, geometry, strict=True)])
+        return keys, self._cache[1]
+
+    def _key_maps(self: Self, geometry: Geometry) -> tuple[np.ndarray, list[np.ndarray]]:
+        if self.key_map is None:
+            return self._label_maps(geometry)
+
+        keymap: dict[K, int] = {}
+        maps: list[np.ndarray] = []
 
-        gain_group_map = Base().gain_group_create_map(np.ctypeslib.as_ctypes(device_indices.astype(c_uint16)), len(device_indices))
         k: int = 0
         for dev in geometry:
             f = self.key_map(dev)
@@ -41,18 +77,37 @@ class Group[K](Gain):
                     m[tr.idx()] = keymap[key]
                 else:
                     m[tr.idx()] = -1
-            gain_group_map = Base().gain_group_map_set(gain_group_map, dev.idx(), np.ctypeslib.as_ctypes(m.astype(c_int32)))
+            maps.append(m)
 
         keys: np.ndarray = np.ndarray(len(self.gain_map), dtype=np.int32)
-        values: np.ndarray = np.ndarray(len(self.gain_map), dtype=GainPtr)
-        for i, (key, value) in enumerate(self.gain_map.items()):
+        for i, key in enumerate(self.gain_map):
             if key not in keymap:
                 raise UnknownGroupKeyError
             keys[i] = keymap[key]
-            values[i]["value"] = value._gain_ptr(geometry).value
+        return keys, maps
+
+    @staticmethod
+    def _build(keys: np.ndarray, maps: list[np.ndarray], gains: list[Callable[[], GainPtr]]) -> GainPtr:
+        device_indices = np.arange(len(maps), dtype=c_uint16)
+        gain_group_map = Base().gain_group_create_map(np.ctypeslib.as_ctypes(device_indices), len(device_indices))
+        for dev_idx, m in enumerate(maps):
+            gain_group_map = Base().gain_group_map_set(gain_group_map, dev_idx, m.ctypes.data_as(POINTER(c_int32)))
+
+        values: np.ndarray = np.ndarray(len(gains), dtype=GainPtr)
+        for i, gain in enumerate(gains):
+            values[i]["value"] = gain().value
         return Base().gain_group(
             gain_group_map,
-            np.ctypeslib.as_ctypes(keys.astype(c_int32)),
+            keys.ctypes.data_as(POINTER(c_int32)),
             values.ctypes.data_as(POINTER(GainPtr)),
             len(keys),
         )
+
+    def _gain_ptr(self: Self, geometry: Geometry) -> GainPtr:
+        keys, maps = self._key_maps(geometry)
+        return Group._build(keys, maps, [lambda g=g: g._gain_ptr(geometry) for g in self.gain_map.values()])
+
+    def _compile_gain(self: Self, geometry: Geometry) -> Callable[[], GainPtr]:
+        keys, maps = self._key_maps(geometry)
+        gains = [g._compile_gain(geometry) for g in self.gain_map.values()]
+        return lambda: Group._build(keys, maps, gains)
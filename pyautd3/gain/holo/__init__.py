@@ -1,6 +1,8 @@
 from pyautd3.gain.holo.constraint import EmissionConstraint
 
 from .amplitude import Amplitude, Pa, dB
+from .backend import NumpyBackend
+from .cache import HoloCache
 from .greedy import Greedy, GreedyOption
 from .gs import GS, GSOption
 from .gspat import GSPAT, GSPATOption
@@ -15,8 +17,10 @@ __all__ = [
     "GSPATOption",
     "Greedy",
     "GreedyOption",
+    "HoloCache",
     "Naive",
     "NaiveOption",
+    "NumpyBackend",
     "Pa",
     "dB",
 ]
@@ -26,6 +26,9 @@ class Amplitude:
     def pascal(self: Self) -> float:
         return self._value
 
+    def __reduce__(self: Self) -> tuple:
+        return (Amplitude.new_pascal, (self._value,))
+
     def spl(self: Self) -> float:
         return float(GainHolo().gain_holo_pascal_to_spl(self._value))
 
@@ -0,0 +1,227 @@
+from collections.abc import Callable
+from typing import Self
+
+import numpy as np
+
+from pyautd3.controller.environment import Environment
+from pyautd3.driver.geometry import Geometry
+from pyautd3.gain.custom import Custom
+from pyautd3.native_methods.autd3capi_gain_holo import EmissionConstraintTag, EmissionConstraintWrap
+from pyautd3.simulate.directivity import sphere
+from pyautd3.simulate.field import T4010A1_AMPLITUDE, Simulator
+
+HOLO_AMPLITUDE: float = T4010A1_AMPLITUDE / (4.0 * np.pi)
+
+
+def _round(x: np.ndarray) -> np.ndarray:
+    return np.trunc(x + np.copysign(0.5, x))
+
+
+def _norm_sqr(g: np.ndarray) -> np.ndarray:
+    return np.einsum("kn,kn->k", g.real, g.real) + np.einsum("kn,kn->k", g.imag, g.imag)
+
+
+def _converged(prev: np.ndarray, cur: np.ndarray, tol: float) -> bool:
+    prev = prev / np.abs(prev)
+    cur = cur / np.abs(cur)
+    rot = np.vdot(prev, cur)
+    return float(np.max(np.abs(cur - prev * (rot / np.abs(rot))), initial=0.0)) < tol
+
+
+type _Solution = tuple[np.ndarray, np.ndarray | None, int]
+type _Solver = Callable[[np.ndarray, np.ndarray, int, np.ndarray | None, float | None], _Solution]
+
+
+class NumpyBackend:
+    dtype: type[np.float32] | type[np.float64]
+    directivity: Callable[[np.ndarray], np.ndarray]
+    chunk_size: int | None
+    num_threads: int | None
+    environment: Environment | None
+
+    def __init__(
+        self: Self,
+        *,
+        dtype: type[np.float32] | type[np.float64] = np.float32,
+        directivity: Callable[[np.ndarray], np.ndarray] = sphere,
+        chunk_size: int | None = None,
+        num_threads: int | None = None,
+        environment: Environment | None = None,
+    ) -> None:
+        self.dtype = dtype
+        self.directivity = directivity
+        self.chunk_size = chunk_size
+        self.num_threads = num_threads
+        self.environment = environment
+
+    def _simulator(self: Self, geometry: Geometry) -> Simulator:
+        return Simulator(
+            geometry,
+            self.environment,
+            dtype=self.dtype,
+            directivity=self.directivity,
+            chunk_size=self.chunk_size,
+            num_threads=self.num_threads,
+        )
+
+    def _transfer(self: Self, sim: Simulator, points: np.ndarray) -> np.ndarray:
+        g = sim.transfer(np.asarray(points, dtype=self.dtype).reshape(-1, 3))
+        g *= self.dtype(HOLO_AMPLITUDE)
+        return g
+
+    def transfer(self: Self, geometry: Geometry, points: np.ndarray) -> np.ndarray:
+        return self._transfer(self._simulator(geometry), points)
+
+    @staticmethod
+    def _back_prop(g: np.ndarray, norm: np.ndarray, p: np.ndarray) -> np.ndarray:
+        return (g.T @ (p / norm).conj()).conj()
+
+    @staticmethod
+    def _drives(q: np.ndarray, constraint: EmissionConstraintWrap) -> Custom:
+        phase = _round(np.angle(q) * (256.0 / (2.0 * np.pi))).astype(np.int64) & 0xFF
+        value = np.abs(q)
+        max_value = value.max(initial=0.0)
+        ratio = value / max_value if max_value > 0 else np.zeros_like(value)
+        match constraint.tag:
+            case EmissionConstraintTag.Normalize:
+                intensity = _round(ratio * 255.0)
+            case EmissionConstraintTag.Uniform:
+                intensity = np.full(len(q), constraint.value.uniform.value)
+            case EmissionConstraintTag.Multiply:
+                intensity = _round(ratio * 255.0 * constraint.value.multiply)
+            case EmissionConstraintTag.Clamp:
+                min_v, max_v = constraint.value.clamp
+                intensity = np.clip(_round(value * 255.0), min_v.value, max_v.value)
+            case _:
+                msg = f"Unknown emission constraint: {constraint.tag}"
+                raise ValueError(msg)
+        return Custom.from_arrays(phase.astype(np.uint8), np.clip(intensity, 0, 255).astype(np.uint8))
+
+    def _naive(self: Self, g: np.ndarray, amps: np.ndarray, _repeat: int, _state: np.ndarray | None, _tol: float | None) -> _Solution:
+        return self._back_prop(g, _norm_sqr(g), amps.astype(g.dtype)), None, 0
+
+    def _gs(self: Self, g: np.ndarray, amps: np.ndarray, repeat: int, state: np.ndarray | None, tol: float | None) -> _Solution:
+        norm = _norm_sqr(g)
+        q = np.ones(g.shape[1], dtype=g.dtype) if state is None else state.copy()
+        for i in range(repeat):
+            q /= np.abs(q)
+            p = g @ q
+            p *= amps / np.abs(p)
+            q_next = self._back_prop(g, norm, p)
+            if tol is not None and _converged(q, q_next, tol):
+                return q_next, q_next, i + 1
+            q = q_next
+        return q, q, repeat
+
+    def _gspat(self: Self, g: np.ndarray, amps: np.ndarray, repeat: int, state: np.ndarray | None, tol: float | None) -> _Solution:
+        norm = _norm_sqr(g)
+        r = (g @ g.conj().T) / norm
+        p = amps.astype(g.dtype) if state is None else state * (amps / np.abs(state))
+        iterations = repeat
+        for i in range(repeat):
+            gamma = r @ p
+            p_next = gamma * (amps / np.abs(gamma))
+            if tol is not None and _converged(p, p_next, tol):
+                p = p_next
+                iterations = i + 1
+                break
+            p = p_next
+        return self._back_prop(g, norm, p), p, iterations
+
+    def _solve(
+        self: Self,
+        solver: _Solver,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: int,
+        constraint: EmissionConstraintWrap,
+    ) -> Custom:
+        g = self.transfer(geometry, points)
+        q, _, _ = solver(g, np.asarray(amps, dtype=g.real.dtype), repeat, None, None)
+        return self._drives(q, constraint)
+
+    def _solve_batch(
+        self: Self,
+        solver: _Solver,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: np.ndarray,
+        constraint: EmissionConstraintWrap,
+        warm_start: bool,
+        tol: float | None,
+    ) -> tuple[list[Custom], np.ndarray]:
+        sim = self._simulator(geometry)
+        gains = []
+        iterations = np.zeros(len(points), dtype=np.int64)
+        state = None
+        for t in range(len(points)):
+            g = self._transfer(sim, points[t])
+            q, state, iterations[t] = solver(g, np.asarray(amps[t], dtype=g.real.dtype), int(repeat[t]), state if warm_start else None, tol)
+            gains.append(self._drives(q, constraint))
+        return gains, iterations
+
+    def naive(self: Self, geometry: Geometry, points: np.ndarray, amps: np.ndarray, *, constraint: EmissionConstraintWrap) -> Custom:
+        return self._solve(self._naive, geometry, points, amps, repeat=0, constraint=constraint)
+
+    def gs(
+        self: Self,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: int,
+        constraint: EmissionConstraintWrap,
+    ) -> Custom:
+        return self._solve(self._gs, geometry, points, amps, repeat=repeat, constraint=constraint)
+
+    def gspat(
+        self: Self,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: int,
+        constraint: EmissionConstraintWrap,
+    ) -> Custom:
+        return self._solve(self._gspat, geometry, points, amps, repeat=repeat, constraint=constraint)
+
+    def naive_batch(
+        self: Self,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        constraint: EmissionConstraintWrap,
+    ) -> tuple[list[Custom], np.ndarray]:
+        repeat = np.zeros(len(points), dtype=np.int64)
+        return self._solve_batch(self._naive, geometry, points, amps, repeat=repeat, constraint=constraint, warm_start=False, tol=None)
+
+    def gs_batch(
+        self: Self,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: np.ndarray,
+        constraint: EmissionConstraintWrap,
+        warm_start: bool = True,
+        tol: float | None = None,
+    ) -> tuple[list[Custom], np.ndarray]:
+        return self._solve_batch(self._gs, geometry, points, amps, repeat=repeat, constraint=constraint, warm_start=warm_start, tol=tol)
+
+    def gspat_batch(
+        self: Self,
+        geometry: Geometry,
+        points: np.ndarray,
+        amps: np.ndarray,
+        *,
+        repeat: np.ndarray,
+        constraint: EmissionConstraintWrap,
+        warm_start: bool = True,
+        tol: float | None = None,
+    ) -> tuple[list[Custom], np.ndarray]:
+        return self._solve_batch(self._gspat, geometry, points, amps, repeat=repeat, constraint=constraint, warm_start=warm_start, tol=tol)
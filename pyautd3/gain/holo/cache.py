@@ -0,0 +1,140 @@
+import threading
+from collections import OrderedDict
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+
+from pyautd3.controller.controller import Controller
+from pyautd3.controller.environment import Environment
+from pyautd3.controller.shadow import _AuditShadow
+from pyautd3.driver.geometry import Geometry
+from pyautd3.gain.custom import Custom
+from pyautd3.gain.holo.holo import Holo
+
+
+class HoloCache:
+    _geometry: Geometry
+    _environment: Environment
+    _max_entries: int
+    _max_bytes: int
+    _resolution: float
+    _entries: OrderedDict[tuple, np.ndarray]
+    _nbytes: int
+    _stamp: tuple | None
+    _hits: int
+    _misses: int
+    _evictions: int
+    _lock: threading.Lock
+    _shadow: _AuditShadow
+
+    def __init__(
+        self: Self,
+        geometry: Geometry,
+        environment: Environment | None = None,
+        *,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        resolution: float = 1e-3,
+    ) -> None:
+        match environment, geometry:
+            case None, Controller():
+                environment = geometry.environment
+            case None, _:
+                msg = "environment is required unless geometry is a Controller"
+                raise ValueError(msg)
+        if max_entries <= 0 or max_bytes <= 0 or resolution <= 0:
+            msg = "max_entries, max_bytes and resolution must be positive"
+            raise ValueError(msg)
+        self._geometry = geometry
+        self._environment = environment  # type: ignore[bad-assignment]
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._resolution = resolution
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._stamp = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._shadow = _AuditShadow()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        self.clear()
+        self._shadow.close()
+
+    def _key(self: Self, holo: Holo) -> tuple:
+        points, amps = holo._pack()
+        option = getattr(holo, "option", None)
+        return (
+            type(holo),
+            np.round(points / self._resolution).astype(np.int64).tobytes(),
+            amps.tobytes(),
+            None if option is None else bytes(option._inner()),
+        )
+
+    def _check_stamp(self: Self) -> None:
+        stamp = (self._geometry._stamp(), self._environment.sound_speed)
+        if stamp != self._stamp:
+            self._entries.clear()
+            self._nbytes = 0
+            self._stamp = stamp
+
+    def get(self: Self, holo: Holo) -> Custom:
+        key = self._key(holo)
+        with self._lock:
+            self._check_stamp()
+            drives = self._entries.get(key)
+            if drives is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return Custom.__private_new__(drives)
+            self._misses += 1
+            intensity, phase = self._shadow.drives(holo, self._geometry, self._environment.sound_speed)
+            drives = np.empty((len(intensity), 2), dtype=np.uint8)
+            drives[:, 0] = phase
+            drives[:, 1] = intensity
+            drives.flags.writeable = False
+            self._entries[key] = drives
+            self._nbytes += drives.nbytes
+            while len(self._entries) > self._max_entries or (self._nbytes > self._max_bytes and len(self._entries) > 1):
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self._evictions += 1
+            return Custom.__private_new__(drives)
+
+    def clear(self: Self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def __len__(self: Self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self: Self) -> int:
+        return self._hits
+
+    @property
+    def misses(self: Self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self: Self) -> int:
+        return self._evictions
+
+    @property
+    def nbytes(self: Self) -> int:
+        return self._nbytes
@@ -3,7 +3,7 @@ from typing import Self
 from pyautd3.driver.firmware.fpga import Intensity
 from pyautd3.native_methods.autd3capi_gain_holo import EmissionConstraintWrap
 from pyautd3.native_methods.autd3capi_gain_holo import NativeMethods as GainHolo
-from pyautd3.native_methods.utils import ConstantADT
+from pyautd3.native_methods.utils import ConstantADT, LazyConstant
 
 __all__ = ["EmissionConstraint"]
 
@@ -12,7 +12,7 @@ class EmissionConstraint(metaclass=ConstantADT):
     def __new__(cls: type["EmissionConstraint"]) -> Self:
         raise NotImplementedError
 
-    Normalize: EmissionConstraintWrap = GainHolo().gain_holo_constraint_normalize()
+    Normalize = LazyConstant(GainHolo().gain_holo_constraint_normalize)
 
     @staticmethod
     def Uniform(value: Intensity) -> EmissionConstraintWrap:  # noqa: N802
@@ -5,7 +5,6 @@ from typing import Self
 import numpy as np
 
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
-from pyautd3.driver.geometry import Geometry
 from pyautd3.driver.utils import _validate_nonzero_u16
 from pyautd3.gain.holo.amplitude import Amplitude
 from pyautd3.gain.holo.constraint import EmissionConstraint
@@ -36,13 +35,10 @@ class Greedy(Holo["Greedy"]):
         super().__init__(foci)
         self.option = option
 
-    def _gain_ptr(self: Self, _: Geometry) -> GainPtr:
-        size = len(self.foci)
-        points = np.fromiter((np.void(Point3(d)) for d, _ in self.foci), dtype=Point3)  # type: ignore[no-matching-overload]
-        amps = np.fromiter((d.pascal() for _, d in self.foci), dtype=ctypes.c_float)  # type: ignore[no-matching-overload]
+    def _holo_ptr(self: Self, points: np.ndarray, amps: np.ndarray) -> GainPtr:
         return GainHolo().gain_holo_greedy_sphere(
             points.ctypes.data_as(ctypes.POINTER(Point3)),
             amps.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-            size,
+            len(amps),
             self.option._inner(),
         )
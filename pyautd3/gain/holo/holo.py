@@ -1,17 +1,183 @@
-from collections.abc import Iterable
+import copy
+from abc import abstractmethod
+from collections.abc import Callable, Iterable
 from typing import Self, TypeVar
 
 import numpy as np
+from numpy.typing import ArrayLike
 
+from pyautd3.driver.common.freq import Freq
 from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.datagram.stm.gain import GainSTM, GainSTMOption
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
+from pyautd3.driver.geometry import Geometry
+from pyautd3.driver.utils import _validate_nonzero_u32
+from pyautd3.gain.custom import Custom
+from pyautd3.native_methods.autd3capi_driver import GainPtr
+from pyautd3.utils import Duration
 
 from .amplitude import Amplitude
 
 H = TypeVar("H", bound="Holo")
 
 
+class _HoloBatch:
+    points: np.ndarray
+    amps: np.ndarray
+    repeat: np.ndarray
+    warm_start: bool
+    tol: float | None
+    iterations: np.ndarray | None
+    _cache: tuple[tuple[int, ...], list[Custom] | None] | None
+
+    def __init__(self: Self, points: np.ndarray, amps: np.ndarray, repeat: np.ndarray, *, warm_start: bool, tol: float | None) -> None:
+        self.points = points
+        self.amps = amps
+        self.repeat = repeat
+        self.warm_start = warm_start
+        self.tol = tol
+        self.iterations = None
+        self._cache = None
+
+    def solve(self: Self, frame: "Holo", geometry: Geometry) -> list[Custom] | None:
+        stamp = (*geometry._stamp(), geometry.num_devices(), geometry.num_transducers())
+        if self._cache is None or self._cache[0] != stamp:
+            res = frame._numpy_batch(geometry, self)
+            if res is None:
+                self._cache = (stamp, None)
+            else:
+                gains, self.iterations = res
+                self._cache = (stamp, gains)
+        return self._cache[1]
+
+
 class Holo[H: "Holo"](Gain):
-    foci: list[tuple[np.ndarray, Amplitude]]
+    _foci: list[tuple[np.ndarray, Amplitude]] | None
+    _points: np.ndarray | None
+    _amps: np.ndarray | None
+    _custom: Custom | None
+    _batch: tuple[_HoloBatch, int] | None
 
     def __init__(self: Self, foci: Iterable[tuple[np.ndarray, Amplitude]]) -> None:
         self.foci = list(foci)
+
+    @classmethod
+    def batch(
+        cls: type[Self],
+        points: ArrayLike,
+        amps: ArrayLike | Amplitude,
+        option: object,
+        config: SamplingConfig | Freq[float] | Duration,
+        stm_option: GainSTMOption | None = None,
+        *,
+        repeat: ArrayLike | None = None,
+        warm_start: bool = True,
+        tol: float | None = None,
+    ) -> GainSTM:
+        """Solve T frames of K foci (`points` of shape (T, K, 3)) into a GainSTM.
+
+        `repeat` sets the iteration count per frame (options with `repeat` only). With a NumpyBackend in `option`,
+        all frames are solved together on the first send: each frame starts from the previous frame's solution when
+        `warm_start` is set, stops early once the phases move less than `tol`, and reports its iteration count in
+        `Holo.iterations`. The native solvers have no initial-guess or convergence input, so without a backend every
+        frame is solved independently for exactly `repeat` iterations and `iterations` stays None; `tol` requires a
+        backend.
+        """
+        points_ = np.ascontiguousarray(points, dtype=np.float32)
+        if points_.ndim != 3 or points_.shape[2] != 3:  # noqa: PLR2004
+            msg = f"points must have shape (T, K, 3), but got {points_.shape}"
+            raise ValueError(msg)
+        amps_ = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(amps.pascal() if isinstance(amps, Amplitude) else amps, dtype=np.float32), points_.shape[:2]),
+        )
+        if tol is not None and getattr(option, "backend", None) is None:
+            msg = "tol requires a NumpyBackend"
+            raise ValueError(msg)
+        if repeat is None:
+            repeat_ = np.full(len(points_), getattr(option, "repeat", 0), dtype=np.int64)
+        elif hasattr(option, "repeat"):
+            repeat_ = np.broadcast_to(np.asarray(repeat), len(points_))
+            repeat_ = np.fromiter((_validate_nonzero_u32(int(r)) for r in repeat_), dtype=np.int64, count=len(repeat_))
+        else:
+            msg = f"{cls.__name__} does not support repeat"
+            raise ValueError(msg)
+        batch = _HoloBatch(points_, amps_, repeat_, warm_start=warm_start, tol=tol)
+        frames = []
+        for t in range(len(points_)):
+            frame_option = option
+            if repeat is not None:
+                frame_option = copy.copy(option)
+                frame_option.repeat = int(repeat_[t])  # type: ignore[missing-attribute]
+            frame = cls([], frame_option)  # type: ignore[call-arg]
+            frame._foci = None
+            frame._points = points_[t]
+            frame._amps = amps_[t]
+            frame._batch = (batch, t)
+            frames.append(frame)
+        return GainSTM(gains=frames, config=config, option=stm_option or GainSTMOption())
+
+    @property
+    def iterations(self: Self) -> int | None:
+        if self._batch is None:
+            return None
+        batch, idx = self._batch
+        return None if batch.iterations is None else int(batch.iterations[idx])
+
+    @property
+    def foci(self: Self) -> list[tuple[np.ndarray, Amplitude]]:
+        if self._foci is None:
+            points: np.ndarray = self._points  # type: ignore[bad-assignment]
+            amps: np.ndarray = self._amps  # type: ignore[bad-assignment]
+            self._foci = [(p.astype(np.float64), Amplitude.new_pascal(float(a))) for p, a in zip(points, amps, strict=True)]
+            self._points = None
+            self._amps = None
+        return self._foci
+
+    @foci.setter
+    def foci(self: Self, value: list[tuple[np.ndarray, Amplitude]]) -> None:
+        self._foci = value
+        self._points = None
+        self._amps = None
+        self._batch = None
+
+    def _pack(self: Self) -> tuple[np.ndarray, np.ndarray]:
+        if self._points is not None and self._amps is not None:
+            return self._points, self._amps
+        foci: list[tuple[np.ndarray, Amplitude]] = self._foci  # type: ignore[bad-assignment]
+        points = np.array([p for p, _ in foci], dtype=np.float32).reshape(len(foci), 3)
+        amps = np.fromiter((a.pascal() for _, a in foci), dtype=np.float32, count=len(foci))
+        return points, amps
+
+    @abstractmethod
+    def _holo_ptr(self: Self, points: np.ndarray, amps: np.ndarray) -> GainPtr:
+        pass
+
+    def _numpy_gain(self: Self, _: Geometry) -> Custom | None:
+        return None
+
+    def _numpy_batch(self: Self, _geometry: Geometry, _batch: _HoloBatch) -> tuple[list[Custom], np.ndarray] | None:
+        return None
+
+    def _numpy(self: Self, geometry: Geometry) -> Custom | None:
+        if self._batch is None:
+            return self._numpy_gain(geometry)
+        batch, idx = self._batch
+        gains = batch.solve(self, geometry)
+        return None if gains is None else gains[idx]
+
+    def _gain_ptr(self: Self, geometry: Geometry) -> GainPtr:
+        gain = self._custom = self._numpy(geometry)
+        if gain is not None:
+            return gain._gain_ptr(geometry)
+        return self._holo_ptr(*self._pack())
+
+    def _compile_gain(self: Self, geometry: Geometry) -> Callable[[], GainPtr]:
+        gain = self._numpy(geometry)
+        if gain is None:
+            drives = geometry._solve_drives(self)
+            gain = None if drives is None else Custom.__private_new__(drives)
+        self._custom = gain
+        if gain is not None:
+            return gain._compile_gain(geometry)
+        points, amps = self._pack()
+        return lambda: self._holo_ptr(points, amps)
@@ -6,9 +6,11 @@ import numpy as np
 
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
 from pyautd3.driver.geometry import Geometry
+from pyautd3.gain.custom import Custom
 from pyautd3.gain.holo.amplitude import Amplitude
+from pyautd3.gain.holo.backend import NumpyBackend
 from pyautd3.gain.holo.constraint import EmissionConstraint
-from pyautd3.gain.holo.holo import Holo
+from pyautd3.gain.holo.holo import Holo, _HoloBatch
 from pyautd3.native_methods.autd3capi_driver import GainPtr
 from pyautd3.native_methods.autd3capi_gain_holo import EmissionConstraintWrap
 from pyautd3.native_methods.autd3capi_gain_holo import NaiveOption as NaiveOption_
@@ -18,9 +20,11 @@ from pyautd3.native_methods.structs import Point3
 
 class NaiveOption:
     constraint: EmissionConstraintWrap
+    backend: NumpyBackend | None
 
-    def __init__(self: Self, *, constraint: EmissionConstraintWrap | None = None) -> None:
+    def __init__(self: Self, *, constraint: EmissionConstraintWrap | None = None, backend: NumpyBackend | None = None) -> None:
         self.constraint = constraint or EmissionConstraint.Clamp(Intensity.MIN, Intensity.MAX)
+        self.backend = backend
 
     def _inner(self: Self) -> NaiveOption_:
         return NaiveOption_(self.constraint)
@@ -33,13 +37,25 @@ class Naive(Holo["Naive"]):
         super().__init__(foci)
         self.option = option
 
-    def _gain_ptr(self: Self, _: Geometry) -> GainPtr:
-        size = len(self.foci)
-        points = np.fromiter((np.void(Point3(d)) for d, _ in self.foci), dtype=Point3)  # type: ignore[no-matching-overload]
-        amps = np.fromiter((d.pascal() for _, d in self.foci), dtype=ctypes.c_float)
+    def _numpy_gain(self: Self, geometry: Geometry) -> Custom | None:
+        if self.option.backend is None:
+            return None
+        return self.option.backend.naive(geometry, *self._pack(), constraint=self.option.constraint)
+
+    def _numpy_batch(self: Self, geometry: Geometry, batch: _HoloBatch) -> tuple[list[Custom], np.ndarray] | None:
+        if self.option.backend is None:
+            return None
+        return self.option.backend.naive_batch(
+            geometry,
+            batch.points,
+            batch.amps,
+            constraint=self.option.constraint,
+        )
+
+    def _holo_ptr(self: Self, points: np.ndarray, amps: np.ndarray) -> GainPtr:
         return GainHolo().gain_holo_naive_sphere(
             points.ctypes.data_as(ctypes.POINTER(Point3)),
             amps.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
-            size,
+            len(amps),
             self.option._inner(),
         )
@@ -1,4 +1,5 @@
 import ctypes
+from collections.abc import Iterable
 from typing import Self
 
 import numpy as np
@@ -83,7 +84,7 @@ class Audit(Link):
 
     def drives_at(self: Self, idx: int, segment: Segment, stm_idx: int) -> tuple[np.ndarray, np.ndarray]:
         n = int(LinkAudit().link_audit_cpu_num_transducers(self._ptr, idx))
-        drive = np.zeros(n, dtype=Drive_)
+        drive = np.zeros((n, 2), dtype=np.uint8)
         LinkAudit().link_audit_fpga_drives_at(
             self._ptr,
             segment,
@@ -91,7 +92,30 @@ class Audit(Link):
             stm_idx,
             drive.ctypes.data_as(ctypes.POINTER(Drive_)),
         )
-        return np.array([int(d[1][0]) for d in drive]), np.array([int(d[0][0]) for d in drive])
+        return drive[:, 1].astype(np.int64), drive[:, 0].astype(np.int64)
+
+    def drives(self: Self, segment: Segment, devices: Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+        devices = list(devices)
+        cycles = {int(LinkAudit().link_audit_fpga_stm_cycle(self._ptr, segment, idx)) for idx in devices}
+        nums = {int(LinkAudit().link_audit_cpu_num_transducers(self._ptr, idx)) for idx in devices}
+        if len(cycles) > 1 or len(nums) > 1:
+            msg = "All devices must have the same STM cycle and number of transducers"
+            raise ValueError(msg)
+        cycle = cycles.pop() if cycles else 0
+        n = nums.pop() if nums else 0
+        drive = np.zeros((len(devices), cycle, n, 2), dtype=np.uint8)
+        base = drive.ctypes.data
+        stride = n * ctypes.sizeof(Drive_)
+        for i, idx in enumerate(devices):
+            for stm_idx in range(cycle):
+                LinkAudit().link_audit_fpga_drives_at(
+                    self._ptr,
+                    segment,
+                    idx,
+                    stm_idx,
+                    ctypes.cast(base + (i * cycle + stm_idx) * stride, ctypes.POINTER(Drive_)),
+                )
+        return drive[..., 1], drive[..., 0]
 
     def sound_speed(self: Self, idx: int, segment: Segment) -> int:
         return int(LinkAudit().link_audit_fpga_sound_speed(self._ptr, segment, idx))
@@ -5,12 +5,14 @@ from .radiation_pressure import RadiationPressure
 from .sine import Sine, SineOption
 from .square import Square, SquareOption
 from .static import Static
+from .streamer import ModulationStreamer
 
 __all__ = [
     "Custom",
     "Fir",
     "Fourier",
     "FourierOption",
+    "ModulationStreamer",
     "RadiationPressure",
     "Sine",
     "SineOption",
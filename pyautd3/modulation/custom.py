@@ -18,9 +18,19 @@ class Custom(Modulation):
 
     def __init__(self: Self, buffer: Iterable[int], sampling_config: SamplingConfig | Freq[int] | Freq[float] | Duration) -> None:
         super().__init__()
-        self.buffer = np.fromiter(buffer, dtype=np.uint8)
+        match buffer:
+            case np.ndarray() if buffer.dtype == np.uint8:
+                self.buffer = buffer.ravel().copy()
+            case _:
+                self.buffer = np.fromiter(buffer, dtype=np.uint8)
         self.config = sampling_config
 
+    def _params(self: Self) -> object:
+        return (self.buffer.tobytes(), bytes(self.sampling_config()._inner))
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return SamplingConfig(self.config)
+
     def _modulation_ptr(self: Self) -> ModulationPtr:
         return Base().modulation_custom(
             self.buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8)),
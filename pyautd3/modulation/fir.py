@@ -5,6 +5,7 @@ from typing import Self, TypeVar
 import numpy as np
 
 from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import ModulationPtr
 
@@ -19,9 +20,16 @@ class Fir[M: Modulation](Modulation):
         self.target = target
         self.coef = np.fromiter(coef, dtype=ctypes.c_float)
 
+    def _params(self: Self) -> object | None:
+        target = self.target._params()
+        return None if target is None else (target, self.coef.tobytes())
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return self.target.sampling_config()
+
     def _modulation_ptr(self: Self) -> ModulationPtr:
         return Base().modulation_with_fir(
-            self.target._modulation_ptr(),
+            self.target._ptr(),
             self.coef.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
             len(self.coef),
         )
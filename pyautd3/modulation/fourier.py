@@ -5,6 +5,7 @@ from typing import Self
 import numpy as np
 
 from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.modulation.sine import Sine, SineMode
 from pyautd3.native_methods.autd3capi import FourierOption as FourierOption_
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
@@ -46,6 +47,14 @@ class Fourier(Modulation):
         self.components = list(components)
         self.option = option
 
+    def _params(self: Self) -> object:
+        return (tuple(m._params() for m in self.components), bytes(self.option._inner()))
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        if not self.components:
+            return super().sampling_config()
+        return self.components[0].sampling_config()
+
     def _modulation_ptr(self: Self) -> ModulationPtr:
         size = len(self.components)
         option = self.option._inner()
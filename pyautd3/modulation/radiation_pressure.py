@@ -1,6 +1,7 @@
 from typing import Self, TypeVar
 
 from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import ModulationPtr
 
@@ -13,5 +14,11 @@ class RadiationPressure[M: Modulation](Modulation):
     def __init__(self: Self, target: M) -> None:
         self.target = target
 
+    def _params(self: Self) -> object | None:
+        return self.target._params()
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return self.target.sampling_config()
+
     def _modulation_ptr(self: Self) -> ModulationPtr:
-        return Base().modulation_with_radiation_pressure(self.target._modulation_ptr())
+        return Base().modulation_with_radiation_pressure(self.target._ptr())
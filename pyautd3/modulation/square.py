@@ -72,6 +72,12 @@ class Square[T: (int, float)](Modulation):
             case _:
                 raise TypeError
 
+    def _params(self: Self) -> object:
+        return (self._mode, self.freq.hz(), bytes(self.option._inner()))
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return self.option.sampling_config
+
     def _modulation_ptr(self) -> ModulationPtr:
         match self._mode:
             case SquareMode.Exact:
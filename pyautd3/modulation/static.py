@@ -1,6 +1,7 @@
 from typing import Self
 
 from pyautd3.driver.datagram.modulation import Modulation
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
 from pyautd3.driver.utils import _validate_u8
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi_driver import ModulationPtr
@@ -13,5 +14,11 @@ class Static(Modulation):
         super().__init__()
         self.intensity = _validate_u8(intensity)
 
+    def _params(self: Self) -> object:
+        return self.intensity
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return SamplingConfig(0xFFFF)
+
     def _modulation_ptr(self: Self) -> ModulationPtr:
         return Base().modulation_static(self.intensity)
@@ -0,0 +1,196 @@
+import os
+import struct
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from pyautd3.driver.common.freq import Freq
+from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
+from pyautd3.driver.firmware.fpga.sampling_config import SamplingConfig
+from pyautd3.driver.firmware.fpga.transition_mode import SyncIdx, SysTime
+from pyautd3.ethercat.dc_sys_time import DcSysTime
+from pyautd3.modulation.custom import Custom
+from pyautd3.native_methods.autd3 import Segment
+from pyautd3.utils import Duration
+
+if TYPE_CHECKING:
+    from pyautd3.controller.controller import Controller
+
+MOD_BUF_SIZE_MIN: int = 2
+MOD_BUF_SIZE_MAX: int = 65535
+
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_WAVE_DTYPES: dict[tuple[int, int], str] = {
+    (0x0001, 8): "u1",
+    (0x0001, 16): "<i2",
+    (0x0001, 32): "<i4",
+    (0x0003, 32): "<f4",
+    (0x0003, 64): "<f8",
+}
+
+
+def _read_wav_header(path: str | os.PathLike[str]) -> tuple[tuple[int, int, int, int], int, int]:
+    with open(path, "rb") as f:  # noqa: PTH123
+        header = f.read(12)
+        if len(header) != 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":  # noqa: PLR2004
+            msg = f"{path} is not a RIFF/WAVE file"
+            raise ValueError(msg)
+        fmt = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:  # noqa: PLR2004
+                msg = f"{path} has no data chunk"
+                raise ValueError(msg)
+            chunk_id, size = struct.unpack("<4sI", chunk)
+            if chunk_id == b"data":
+                if fmt is None:
+                    msg = f"{path} has no fmt chunk before the data chunk"
+                    raise ValueError(msg)
+                return fmt, f.tell(), size
+            body = f.read(size + (size & 1))
+            if chunk_id == b"fmt ":
+                tag, channels, rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+                if tag == _WAVE_FORMAT_EXTENSIBLE and size >= 40:  # noqa: PLR2004
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (tag, channels, rate, bits)
+
+
+def _open_wav(path: str | os.PathLike[str]) -> tuple[np.ndarray, float]:
+    (tag, channels, rate, bits), offset, size = _read_wav_header(path)
+    dtype = _WAVE_DTYPES.get((tag, bits))
+    if dtype is None:
+        msg = f"Unsupported WAV format (format tag {tag}, {bits} bits)"
+        raise ValueError(msg)
+    itemsize = np.dtype(dtype).itemsize
+    frames = min(size, os.path.getsize(path) - offset) // (itemsize * channels)  # noqa: PTH202
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels)), float(rate)
+
+
+def _normalize(samples: np.ndarray) -> np.ndarray:
+    match samples.dtype.kind:
+        case "u":
+            half = float(1 << (8 * samples.dtype.itemsize - 1))
+            return (samples.astype(np.float64) - half) / half
+        case "i":
+            return samples.astype(np.float64) / float(1 << (8 * samples.dtype.itemsize - 1))
+        case _:
+            return samples.astype(np.float64)
+
+
+class ModulationStreamer:
+    _samples: np.ndarray
+    _rate: float
+    _config: SamplingConfig
+    _chunk_size: int
+    _len: int
+    _step: float
+
+    def __init__(
+        self: Self,
+        source: str | os.PathLike[str] | ArrayLike,
+        sampling_config: SamplingConfig | Freq[int] | Freq[float] | Duration,
+        *,
+        rate: float | None = None,
+        dtype: DTypeLike = np.int16,
+        channels: int = 1,
+        chunk_size: int = 32768,
+    ) -> None:
+        match source:
+            case str() | os.PathLike() if str(source).lower().endswith(".wav"):
+                samples, wav_rate = _open_wav(source)
+                rate = rate or wav_rate
+            case str() | os.PathLike():
+                if rate is None:
+                    msg = "rate is required for raw PCM files"
+                    raise ValueError(msg)
+                dtype_ = np.dtype(dtype)
+                frames = os.path.getsize(source) // (dtype_.itemsize * channels)  # noqa: PTH202
+                samples = np.memmap(source, dtype=dtype_, mode="r", shape=(frames, channels))
+            case _:
+                if rate is None:
+                    msg = "rate is required for in-memory samples"
+                    raise ValueError(msg)
+                samples = np.asarray(source)
+                samples = samples.reshape(len(samples), -1)
+        if not MOD_BUF_SIZE_MIN <= chunk_size <= MOD_BUF_SIZE_MAX:
+            msg = f"chunk_size ({chunk_size}) is out of range ([{MOD_BUF_SIZE_MIN}, {MOD_BUF_SIZE_MAX}])"
+            raise ValueError(msg)
+        if len(samples) == 0:
+            msg = "source has no samples"
+            raise ValueError(msg)
+        self._samples = samples
+        self._rate = float(rate)
+        self._config = SamplingConfig(sampling_config)
+        self._chunk_size = chunk_size
+        self._step = self._rate / float(self._config.freq().hz())
+        self._len = max(MOD_BUF_SIZE_MIN, int(np.ceil(len(samples) / self._step)))
+        if self._len % chunk_size == 1:
+            self._len += 1
+
+    def sampling_config(self: Self) -> SamplingConfig:
+        return self._config
+
+    def num_samples(self: Self) -> int:
+        return self._len
+
+    def num_chunks(self: Self) -> int:
+        return -(-self._len // self._chunk_size)
+
+    def __len__(self: Self) -> int:
+        return self.num_chunks()
+
+    def chunk_duration(self: Self, idx: int) -> Duration:
+        return Duration.from_nanos(self._chunk_len(idx) * self._config.period().as_nanos())
+
+    def _chunk_len(self: Self, idx: int) -> int:
+        return min(self._chunk_size, self._len - idx * self._chunk_size)
+
+    def chunk(self: Self, idx: int) -> np.ndarray:
+        if not 0 <= idx < self.num_chunks():
+            raise IndexError(idx)
+        start = idx * self._chunk_size
+        n = self._chunk_len(idx)
+        pos = (start + np.arange(n, dtype=np.float64)) * self._step
+        lo = int(pos[0])
+        hi = min(int(pos[-1]) + 2, len(self._samples))
+        window = _normalize(np.asarray(self._samples[lo:hi])).mean(axis=1)
+        x = np.interp(pos - lo, np.arange(len(window), dtype=np.float64), window)
+        return np.round((np.clip(x, -1.0, 1.0) * 0.5 + 0.5) * 255.0).astype(np.uint8)
+
+    def datagram(self: Self, idx: int, start: DcSysTime | None = None, *, first_segment: Segment = Segment.S1) -> WithFiniteLoop[Custom]:
+        if start is None:
+            transition_mode = SyncIdx()
+        else:
+            offset = idx * self._chunk_size * self._config.period().as_nanos()
+            transition_mode = SysTime(start + Duration.from_nanos(offset))
+        return WithFiniteLoop(
+            inner=Custom(self.chunk(idx), self._config),
+            segment=first_segment if idx % 2 == 0 else (Segment.S0 if first_segment == Segment.S1 else Segment.S1),
+            transition_mode=transition_mode,
+            loop_count=1,
+        )
+
+    def __iter__(self: Self) -> Iterator[WithFiniteLoop[Custom]]:
+        return (self.datagram(i) for i in range(self.num_chunks()))
+
+    def play(
+        self: Self,
+        controller: "Controller",
+        *,
+        lead: Duration | None = None,
+        sys_time: bool = True,
+        first_segment: Segment = Segment.S1,
+    ) -> None:
+        lead_ns = (lead or Duration.from_millis(100)).as_nanos()
+        start = DcSysTime.now() + Duration.from_nanos(lead_ns) if sys_time else None
+        begin = time.monotonic_ns() + lead_ns
+        for i in range(self.num_chunks()):
+            controller.send(self.datagram(i, start, first_segment=first_segment))
+            if i + 1 < self.num_chunks():
+                wait_ns = begin - time.monotonic_ns()
+                if wait_ns > 0:
+                    time.sleep(wait_ns / 1e9)
+                begin += self.chunk_duration(i).as_nanos()
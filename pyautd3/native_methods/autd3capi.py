@@ -1,5 +1,6 @@
 import ctypes
 import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from pyautd3.native_methods.autd3 import (
@@ -172,519 +173,222 @@ class Singleton(type):
         return cls._instances[cls]
 
 
-class NativeMethods(metaclass=Singleton):
-    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
-        self.dll = ctypes.CDLL(str(bin_location / f"{bin_prefix}autd3capi{bin_ext}"))
-
-        self.dll.AUTDControllerOpen.argtypes = [ctypes.POINTER(Point3), ctypes.POINTER(Quaternion), ctypes.c_uint16, LinkPtr, SenderOption]
-        self.dll.AUTDControllerOpen.restype = ResultController
-
-        self.dll.AUTDControllerClose.argtypes = [ControllerPtr]
-        self.dll.AUTDControllerClose.restype = ResultStatus
-
-        self.dll.AUTDControllerFPGAState.argtypes = [ControllerPtr]
-        self.dll.AUTDControllerFPGAState.restype = ResultFPGAStateList
-
-        self.dll.AUTDControllerFPGAStateGet.argtypes = [FPGAStateListPtr, ctypes.c_uint32]
-        self.dll.AUTDControllerFPGAStateGet.restype = ctypes.c_int16
-
-        self.dll.AUTDControllerFPGAStateDelete.argtypes = [FPGAStateListPtr]
-        self.dll.AUTDControllerFPGAStateDelete.restype = None
-
-        self.dll.AUTDControllerFirmwareVersionListPointer.argtypes = [ControllerPtr]
-        self.dll.AUTDControllerFirmwareVersionListPointer.restype = ResultFirmwareVersionList
-
-        self.dll.AUTDControllerFirmwareVersionGet.argtypes = [FirmwareVersionListPtr, ctypes.c_uint32, ctypes.c_char_p]
-        self.dll.AUTDControllerFirmwareVersionGet.restype = None
-
-        self.dll.AUTDControllerFirmwareVersionListPointerDelete.argtypes = [FirmwareVersionListPtr]
-        self.dll.AUTDControllerFirmwareVersionListPointerDelete.restype = None
-
-        self.dll.AUTDFirmwareLatest.argtypes = [ctypes.c_char_p]
-        self.dll.AUTDFirmwareLatest.restype = None
-
-        self.dll.AUTDSetDefaultSenderOption.argtypes = [ControllerPtr, SenderOption]
-        self.dll.AUTDSetDefaultSenderOption.restype = None
-
-        self.dll.AUTDSender.argtypes = [ControllerPtr, SenderOption]
-        self.dll.AUTDSender.restype = SenderPtr
-
-        self.dll.AUTDSenderSend.argtypes = [SenderPtr, DatagramPtr]
-        self.dll.AUTDSenderSend.restype = ResultStatus
-
-        self.dll.AUTDSenderOptionIsDefault.argtypes = [SenderOption]
-        self.dll.AUTDSenderOptionIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDDatagramClear.argtypes = []
-        self.dll.AUTDDatagramClear.restype = DatagramPtr
-
-        self.dll.AUTDDatagramForceFan.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDDatagramForceFan.restype = DatagramPtr
-
-        self.dll.AUTDDatagramGPIOOutputs.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDDatagramGPIOOutputs.restype = DatagramPtr
-
-        self.dll.AUTDDatagramGroup.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_void_p,
-            GeometryPtr,
-            ctypes.POINTER(ctypes.c_int32),
-            ctypes.POINTER(DatagramPtr),
-            ctypes.c_uint16,
-        ]
-        self.dll.AUTDDatagramGroup.restype = DatagramPtr
-
-        self.dll.AUTDDatagramOutputMaskWithSegment.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr, ctypes.c_uint8]
-        self.dll.AUTDDatagramOutputMaskWithSegment.restype = DatagramPtr
-
-        self.dll.AUTDDatagramPhaseCorr.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDDatagramPhaseCorr.restype = DatagramPtr
-
-        self.dll.AUTDDatagramPulseWidthEncoder.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDDatagramPulseWidthEncoder.restype = DatagramPtr
-
-        self.dll.AUTDDatagramPulseWidthEncoderDefault.argtypes = []
-        self.dll.AUTDDatagramPulseWidthEncoderDefault.restype = DatagramPtr
-
-        self.dll.AUTDDatagramReadsFPGAState.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDDatagramReadsFPGAState.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSwapSegmentModulation.argtypes = [ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDDatagramSwapSegmentModulation.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSwapSegmentFociSTM.argtypes = [ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDDatagramSwapSegmentFociSTM.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSwapSegmentGainSTM.argtypes = [ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDDatagramSwapSegmentGainSTM.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSwapSegmentGain.argtypes = [ctypes.c_uint8]
-        self.dll.AUTDDatagramSwapSegmentGain.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSilencerFromUpdateRate.argtypes = [FixedUpdateRate]
-        self.dll.AUTDDatagramSilencerFromUpdateRate.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSilencerFromCompletionSteps.argtypes = [FixedCompletionSteps]
-        self.dll.AUTDDatagramSilencerFromCompletionSteps.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSilencerFromCompletionTime.argtypes = [FixedCompletionTime]
-        self.dll.AUTDDatagramSilencerFromCompletionTime.restype = DatagramPtr
-
-        self.dll.AUTDDatagramSilencerFixedCompletionStepsIsDefault.argtypes = [FixedCompletionSteps]
-        self.dll.AUTDDatagramSilencerFixedCompletionStepsIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDSTMFoci.argtypes = [SamplingConfigWrap, ctypes.c_void_p, ctypes.c_uint16, ctypes.c_uint8]
-        self.dll.AUTDSTMFoci.restype = FociSTMPtr
-
-        self.dll.AUTDSTMFociIntoDatagramWithSegment.argtypes = [FociSTMPtr, ctypes.c_uint8, ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDSTMFociIntoDatagramWithSegment.restype = DatagramPtr
-
-        self.dll.AUTDSTMFociIntoDatagramWithFiniteLoop.argtypes = [FociSTMPtr, ctypes.c_uint8, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16]
-        self.dll.AUTDSTMFociIntoDatagramWithFiniteLoop.restype = DatagramPtr
-
-        self.dll.AUTDSTMFociIntoDatagram.argtypes = [FociSTMPtr, ctypes.c_uint8]
-        self.dll.AUTDSTMFociIntoDatagram.restype = DatagramPtr
-
-        self.dll.AUTDSTMGain.argtypes = [SamplingConfigWrap, ctypes.POINTER(GainPtr), ctypes.c_uint16, GainSTMOption]
-        self.dll.AUTDSTMGain.restype = GainSTMPtr
-
-        self.dll.AUTDSTMGainIntoDatagramWithSegment.argtypes = [GainSTMPtr, ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDSTMGainIntoDatagramWithSegment.restype = DatagramPtr
-
-        self.dll.AUTDSTMGainIntoDatagramWithFiniteLoop.argtypes = [GainSTMPtr, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16]
-        self.dll.AUTDSTMGainIntoDatagramWithFiniteLoop.restype = DatagramPtr
-
-        self.dll.AUTDSTMGainIntoDatagram.argtypes = [GainSTMPtr]
-        self.dll.AUTDSTMGainIntoDatagram.restype = DatagramPtr
-
-        self.dll.AUTDSTMConfigFromFreq.argtypes = [ctypes.c_float, ctypes.c_uint16]
-        self.dll.AUTDSTMConfigFromFreq.restype = ResultSamplingConfig
-
-        self.dll.AUTDSTMConfigFromPeriod.argtypes = [Duration, ctypes.c_uint16]
-        self.dll.AUTDSTMConfigFromPeriod.restype = ResultSamplingConfig
-
-        self.dll.AUTDSTMConfigFromFreqNearest.argtypes = [ctypes.c_float, ctypes.c_uint16]
-        self.dll.AUTDSTMConfigFromFreqNearest.restype = SamplingConfigWrap
-
-        self.dll.AUTDSTMConfigFromPeriodNearest.argtypes = [Duration, ctypes.c_uint16]
-        self.dll.AUTDSTMConfigFromPeriodNearest.restype = SamplingConfigWrap
-
-        self.dll.AUTDDatagramSynchronize.argtypes = []
-        self.dll.AUTDDatagramSynchronize.restype = DatagramPtr
-
-        self.dll.AUTDDatagramTuple.argtypes = [DatagramPtr, DatagramPtr]
-        self.dll.AUTDDatagramTuple.restype = DatagramPtr
-
-        self.dll.AUTDDcSysTimeNew.argtypes = [ctypes.c_uint64]
-        self.dll.AUTDDcSysTimeNew.restype = DcSysTime
-
-        self.dll.AUTDGPIOOutputTypeNone.argtypes = []
-        self.dll.AUTDGPIOOutputTypeNone.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeBaseSignal.argtypes = []
-        self.dll.AUTDGPIOOutputTypeBaseSignal.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeThermo.argtypes = []
-        self.dll.AUTDGPIOOutputTypeThermo.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeForceFan.argtypes = []
-        self.dll.AUTDGPIOOutputTypeForceFan.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeSync.argtypes = []
-        self.dll.AUTDGPIOOutputTypeSync.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeModSegment.argtypes = []
-        self.dll.AUTDGPIOOutputTypeModSegment.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeModIdx.argtypes = [ctypes.c_uint16]
-        self.dll.AUTDGPIOOutputTypeModIdx.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeStmSegment.argtypes = []
-        self.dll.AUTDGPIOOutputTypeStmSegment.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeStmIdx.argtypes = [ctypes.c_uint16]
-        self.dll.AUTDGPIOOutputTypeStmIdx.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeIsStmMode.argtypes = []
-        self.dll.AUTDGPIOOutputTypeIsStmMode.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypePwmOut.argtypes = [TransducerPtr]
-        self.dll.AUTDGPIOOutputTypePwmOut.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeDirect.argtypes = [ctypes.c_bool]
-        self.dll.AUTDGPIOOutputTypeDirect.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeSysTimeEq.argtypes = [DcSysTime]
-        self.dll.AUTDGPIOOutputTypeSysTimeEq.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDGPIOOutputTypeSyncDiff.argtypes = []
-        self.dll.AUTDGPIOOutputTypeSyncDiff.restype = GPIOOutputTypeWrap
-
-        self.dll.AUTDPhaseFromRad.argtypes = [ctypes.c_float]
-        self.dll.AUTDPhaseFromRad.restype = ctypes.c_uint8
-
-        self.dll.AUTDPhaseToRad.argtypes = [Phase]
-        self.dll.AUTDPhaseToRad.restype = ctypes.c_float
-
-        self.dll.AUTDPulseWidth.argtypes = [ctypes.c_uint16]
-        self.dll.AUTDPulseWidth.restype = PulseWidth
-
-        self.dll.AUTDPulseWidthFromDuty.argtypes = [ctypes.c_float]
-        self.dll.AUTDPulseWidthFromDuty.restype = PulseWidth
-
-        self.dll.AUTDPulseWidthPulseWidth.argtypes = [PulseWidth]
-        self.dll.AUTDPulseWidthPulseWidth.restype = ResultU16
-
-        self.dll.AUTDSamplingConfigFromDivide.argtypes = [ctypes.c_uint16]
-        self.dll.AUTDSamplingConfigFromDivide.restype = SamplingConfigWrap
-
-        self.dll.AUTDSamplingConfigFromFreq.argtypes = [ctypes.c_float]
-        self.dll.AUTDSamplingConfigFromFreq.restype = SamplingConfigWrap
-
-        self.dll.AUTDSamplingConfigFromPeriod.argtypes = [Duration]
-        self.dll.AUTDSamplingConfigFromPeriod.restype = SamplingConfigWrap
-
-        self.dll.AUTDSamplingConfigIntoNearest.argtypes = [SamplingConfigWrap]
-        self.dll.AUTDSamplingConfigIntoNearest.restype = SamplingConfigWrap
-
-        self.dll.AUTDSamplingConfigDivide.argtypes = [SamplingConfigWrap]
-        self.dll.AUTDSamplingConfigDivide.restype = ResultU16
-
-        self.dll.AUTDSamplingConfigFreq.argtypes = [SamplingConfigWrap]
-        self.dll.AUTDSamplingConfigFreq.restype = ResultF32
-
-        self.dll.AUTDSamplingConfigPeriod.argtypes = [SamplingConfigWrap]
-        self.dll.AUTDSamplingConfigPeriod.restype = ResultDuration
-
-        self.dll.AUTDSamplingConfigEq.argtypes = [SamplingConfigWrap, SamplingConfigWrap]
-        self.dll.AUTDSamplingConfigEq.restype = ctypes.c_bool
-
-        self.dll.AUTDTransitionModeSyncIdx.argtypes = []
-        self.dll.AUTDTransitionModeSyncIdx.restype = TransitionModeWrap
-
-        self.dll.AUTDTransitionModeSysTime.argtypes = [DcSysTime]
-        self.dll.AUTDTransitionModeSysTime.restype = TransitionModeWrap
-
-        self.dll.AUTDTransitionModeGPIO.argtypes = [ctypes.c_uint8]
-        self.dll.AUTDTransitionModeGPIO.restype = TransitionModeWrap
-
-        self.dll.AUTDTransitionModeExt.argtypes = []
-        self.dll.AUTDTransitionModeExt.restype = TransitionModeWrap
-
-        self.dll.AUTDTransitionModeImmediate.argtypes = []
-        self.dll.AUTDTransitionModeImmediate.restype = TransitionModeWrap
-
-        self.dll.AUTDTransitionModeLater.argtypes = []
-        self.dll.AUTDTransitionModeLater.restype = TransitionModeWrap
-
-        self.dll.AUTDEnvironment.argtypes = [ControllerPtr]
-        self.dll.AUTDEnvironment.restype = EnvironmentPtr
-
-        self.dll.AUTDEnvironmentGetSoundSpeed.argtypes = [EnvironmentPtr]
-        self.dll.AUTDEnvironmentGetSoundSpeed.restype = ctypes.c_float
-
-        self.dll.AUTDEnvironmentSetSoundSpeed.argtypes = [EnvironmentPtr, ctypes.c_float]
-        self.dll.AUTDEnvironmentSetSoundSpeed.restype = None
-
-        self.dll.AUTDEnvironmentSetSoundSpeedFromTemp.argtypes = [EnvironmentPtr, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float]
-        self.dll.AUTDEnvironmentSetSoundSpeedFromTemp.restype = None
+class _LazyDLL:
+    def __init__(self, path: Path, signatures: Callable[[], dict[str, tuple[list, object]]]) -> None:
+        self._path = path
+        self._signatures = signatures
+        self._dll: ctypes.CDLL | None = None
+        self._table: dict[str, tuple[list, object]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> tuple[ctypes.CDLL, dict[str, tuple[list, object]]]:
+        if self._dll is None or self._table is None:
+            with self._lock:
+                if self._dll is None or self._table is None:
+                    self._table = self._signatures()
+                    self._dll = ctypes.CDLL(str(self._path))
+        return self._dll, self._table
+
+    def __getattr__(self, name: str):
+        dll, table = self._load()
+        func = getattr(dll, name)
+        func.argtypes, func.restype = table[name]
+        setattr(self, name, func)
+        return func
+
+
+def _signatures() -> dict[str, tuple[list, object]]:
+    return {
+        "AUTDControllerOpen": ([ctypes.POINTER(Point3), ctypes.POINTER(Quaternion), ctypes.c_uint16, LinkPtr, SenderOption], ResultController),
+        "AUTDControllerClose": ([ControllerPtr], ResultStatus),
+        "AUTDControllerFPGAState": ([ControllerPtr], ResultFPGAStateList),
+        "AUTDControllerFPGAStateGet": ([FPGAStateListPtr, ctypes.c_uint32], ctypes.c_int16),
+        "AUTDControllerFPGAStateDelete": ([FPGAStateListPtr], None),
+        "AUTDControllerFirmwareVersionListPointer": ([ControllerPtr], ResultFirmwareVersionList),
+        "AUTDControllerFirmwareVersionGet": ([FirmwareVersionListPtr, ctypes.c_uint32, ctypes.c_char_p], None),
+        "AUTDControllerFirmwareVersionListPointerDelete": ([FirmwareVersionListPtr], None),
+        "AUTDFirmwareLatest": ([ctypes.c_char_p], None),
+        "AUTDSetDefaultSenderOption": ([ControllerPtr, SenderOption], None),
+        "AUTDSender": ([ControllerPtr, SenderOption], SenderPtr),
+        "AUTDSenderSend": ([SenderPtr, DatagramPtr], ResultStatus),
+        "AUTDSenderOptionIsDefault": ([SenderOption], ctypes.c_bool),
+        "AUTDDatagramClear": ([], DatagramPtr),
+        "AUTDDatagramForceFan": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], DatagramPtr),
+        "AUTDDatagramGPIOOutputs": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], DatagramPtr),
+        "AUTDDatagramGroup": (
+            [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                GeometryPtr,
+                ctypes.POINTER(ctypes.c_int32),
+                ctypes.POINTER(DatagramPtr),
+                ctypes.c_uint16,
+            ],
+            DatagramPtr,
+        ),
+        "AUTDDatagramOutputMaskWithSegment": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr, ctypes.c_uint8], DatagramPtr),
+        "AUTDDatagramPhaseCorr": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], DatagramPtr),
+        "AUTDDatagramPulseWidthEncoder": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], DatagramPtr),
+        "AUTDDatagramPulseWidthEncoderDefault": ([], DatagramPtr),
+        "AUTDDatagramReadsFPGAState": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], DatagramPtr),
+        "AUTDDatagramSwapSegmentModulation": ([ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDDatagramSwapSegmentFociSTM": ([ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDDatagramSwapSegmentGainSTM": ([ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDDatagramSwapSegmentGain": ([ctypes.c_uint8], DatagramPtr),
+        "AUTDDatagramSilencerFromUpdateRate": ([FixedUpdateRate], DatagramPtr),
+        "AUTDDatagramSilencerFromCompletionSteps": ([FixedCompletionSteps], DatagramPtr),
+        "AUTDDatagramSilencerFromCompletionTime": ([FixedCompletionTime], DatagramPtr),
+        "AUTDDatagramSilencerFixedCompletionStepsIsDefault": ([FixedCompletionSteps], ctypes.c_bool),
+        "AUTDSTMFoci": ([SamplingConfigWrap, ctypes.c_void_p, ctypes.c_uint16, ctypes.c_uint8], FociSTMPtr),
+        "AUTDSTMFociIntoDatagramWithSegment": ([FociSTMPtr, ctypes.c_uint8, ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDSTMFociIntoDatagramWithFiniteLoop": ([FociSTMPtr, ctypes.c_uint8, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16], DatagramPtr),
+        "AUTDSTMFociIntoDatagram": ([FociSTMPtr, ctypes.c_uint8], DatagramPtr),
+        "AUTDSTMGain": ([SamplingConfigWrap, ctypes.POINTER(GainPtr), ctypes.c_uint16, GainSTMOption], GainSTMPtr),
+        "AUTDSTMGainIntoDatagramWithSegment": ([GainSTMPtr, ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDSTMGainIntoDatagramWithFiniteLoop": ([GainSTMPtr, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16], DatagramPtr),
+        "AUTDSTMGainIntoDatagram": ([GainSTMPtr], DatagramPtr),
+        "AUTDSTMConfigFromFreq": ([ctypes.c_float, ctypes.c_uint16], ResultSamplingConfig),
+        "AUTDSTMConfigFromPeriod": ([Duration, ctypes.c_uint16], ResultSamplingConfig),
+        "AUTDSTMConfigFromFreqNearest": ([ctypes.c_float, ctypes.c_uint16], SamplingConfigWrap),
+        "AUTDSTMConfigFromPeriodNearest": ([Duration, ctypes.c_uint16], SamplingConfigWrap),
+        "AUTDDatagramSynchronize": ([], DatagramPtr),
+        "AUTDDatagramTuple": ([DatagramPtr, DatagramPtr], DatagramPtr),
+        "AUTDDcSysTimeNew": ([ctypes.c_uint64], DcSysTime),
+        "AUTDGPIOOutputTypeNone": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeBaseSignal": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeThermo": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeForceFan": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeSync": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeModSegment": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeModIdx": ([ctypes.c_uint16], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeStmSegment": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeStmIdx": ([ctypes.c_uint16], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeIsStmMode": ([], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypePwmOut": ([TransducerPtr], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeDirect": ([ctypes.c_bool], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeSysTimeEq": ([DcSysTime], GPIOOutputTypeWrap),
+        "AUTDGPIOOutputTypeSyncDiff": ([], GPIOOutputTypeWrap),
+        "AUTDPhaseFromRad": ([ctypes.c_float], ctypes.c_uint8),
+        "AUTDPhaseToRad": ([Phase], ctypes.c_float),
+        "AUTDPulseWidth": ([ctypes.c_uint16], PulseWidth),
+        "AUTDPulseWidthFromDuty": ([ctypes.c_float], PulseWidth),
+        "AUTDPulseWidthPulseWidth": ([PulseWidth], ResultU16),
+        "AUTDSamplingConfigFromDivide": ([ctypes.c_uint16], SamplingConfigWrap),
+        "AUTDSamplingConfigFromFreq": ([ctypes.c_float], SamplingConfigWrap),
+        "AUTDSamplingConfigFromPeriod": ([Duration], SamplingConfigWrap),
+        "AUTDSamplingConfigIntoNearest": ([SamplingConfigWrap], SamplingConfigWrap),
+        "AUTDSamplingConfigDivide": ([SamplingConfigWrap], ResultU16),
+        "AUTDSamplingConfigFreq": ([SamplingConfigWrap], ResultF32),
+        "AUTDSamplingConfigPeriod": ([SamplingConfigWrap], ResultDuration),
+        "AUTDSamplingConfigEq": ([SamplingConfigWrap, SamplingConfigWrap], ctypes.c_bool),
+        "AUTDTransitionModeSyncIdx": ([], TransitionModeWrap),
+        "AUTDTransitionModeSysTime": ([DcSysTime], TransitionModeWrap),
+        "AUTDTransitionModeGPIO": ([ctypes.c_uint8], TransitionModeWrap),
+        "AUTDTransitionModeExt": ([], TransitionModeWrap),
+        "AUTDTransitionModeImmediate": ([], TransitionModeWrap),
+        "AUTDTransitionModeLater": ([], TransitionModeWrap),
+        "AUTDEnvironment": ([ControllerPtr], EnvironmentPtr),
+        "AUTDEnvironmentGetSoundSpeed": ([EnvironmentPtr], ctypes.c_float),
+        "AUTDEnvironmentSetSoundSpeed": ([EnvironmentPtr, ctypes.c_float], None),
+        "AUTDEnvironmentSetSoundSpeedFromTemp": ([EnvironmentPtr, ctypes.c_float, ctypes.c_float, ctypes.c_float, ctypes.c_float], None),
+        "AUTDEnvironmentWavelength": ([EnvironmentPtr], ctypes.c_float),
+        "AUTDEnvironmentWavenumber": ([EnvironmentPtr], ctypes.c_float),
+        "AUTDGainBessel": ([Point3, Vector3, Angle, BesselOption], GainPtr),
+        "AUTDGainBesselIsDefault": ([BesselOption], ctypes.c_bool),
+        "AUTDGainCustom": ([ctypes.c_void_p, ctypes.c_void_p, GeometryPtr], GainPtr),
+        "AUTDGainFocus": ([Point3, FocusOption], GainPtr),
+        "AUTDGainFocusIsDefault": ([FocusOption], ctypes.c_bool),
+        "AUTDGainGroupCreateMap": ([ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint16], GroupGainMapPtr),
+        "AUTDGainGroupMapSet": ([GroupGainMapPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_int32)], GroupGainMapPtr),
+        "AUTDGainGroup": ([GroupGainMapPtr, ctypes.POINTER(ctypes.c_int32), ctypes.POINTER(GainPtr), ctypes.c_uint32], GainPtr),
+        "AUTDGainIntoDatagramWithSegment": ([GainPtr, ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDGainIntoDatagram": ([GainPtr], DatagramPtr),
+        "AUTDGainNull": ([], GainPtr),
+        "AUTDGainPlane": ([Vector3, PlaneOption], GainPtr),
+        "AUTDGainPlanelIsDefault": ([PlaneOption], ctypes.c_bool),
+        "AUTDGainUniform": ([Intensity, Phase], GainPtr),
+        "AUTDDevice": ([GeometryPtr, ctypes.c_uint16], DevicePtr),
+        "AUTDDeviceNumTransducers": ([DevicePtr], ctypes.c_uint32),
+        "AUTDDeviceCenter": ([DevicePtr], Point3),
+        "AUTDDeviceRotation": ([DevicePtr], Quaternion),
+        "AUTDDeviceDirectionX": ([DevicePtr], Vector3),
+        "AUTDDeviceDirectionY": ([DevicePtr], Vector3),
+        "AUTDDeviceDirectionAxial": ([DevicePtr], Vector3),
+        "AUTDGeometry": ([ControllerPtr], GeometryPtr),
+        "AUTDGeometryNumDevices": ([GeometryPtr], ctypes.c_uint32),
+        "AUTDGeometryNumTransducers": ([GeometryPtr], ctypes.c_uint32),
+        "AUTDGeometryCenter": ([GeometryPtr], Point3),
+        "AUTDGeometryReconfigure": ([GeometryPtr, ctypes.POINTER(Point3), ctypes.POINTER(Quaternion)], None),
+        "AUTDRotationFromEulerXYZ": ([ctypes.c_float, ctypes.c_float, ctypes.c_float], Quaternion),
+        "AUTDRotationFromEulerZYZ": ([ctypes.c_float, ctypes.c_float, ctypes.c_float], Quaternion),
+        "AUTDTransducer": ([DevicePtr, ctypes.c_uint8], TransducerPtr),
+        "AUTDTransducerPosition": ([TransducerPtr], Point3),
+        "AUTDLinkAudit": ([], LinkPtr),
+        "AUTDLinkAuditIsOpen": ([LinkPtr], ctypes.c_bool),
+        "AUTDLinkAuditBreakDown": ([LinkPtr], None),
+        "AUTDLinkAuditRepair": ([LinkPtr], None),
+        "AUTDLinkAuditCpuNumTransducers": ([LinkPtr, ctypes.c_uint16], ctypes.c_uint32),
+        "AUTDLinkAuditFpgaAssertThermalSensor": ([LinkPtr, ctypes.c_uint16], None),
+        "AUTDLinkAuditFpgaDeassertThermalSensor": ([LinkPtr, ctypes.c_uint16], None),
+        "AUTDLinkAuditFpgaIsForceFan": ([LinkPtr, ctypes.c_uint16], ctypes.c_bool),
+        "AUTDLinkAuditFpgaCurrentStmSegment": ([LinkPtr, ctypes.c_uint16], Segment),
+        "AUTDLinkAuditFpgaCurrentModSegment": ([LinkPtr, ctypes.c_uint16], Segment),
+        "AUTDLinkAuditFpgaIsStmGainMode": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_bool),
+        "AUTDLinkAuditCpuSilencerStrict": ([LinkPtr, ctypes.c_uint16], ctypes.c_bool),
+        "AUTDLinkAuditFpgaSilencerUpdateRateIntensity": ([LinkPtr, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaSilencerUpdateRatePhase": ([LinkPtr, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaSilencerCompletionStepsIntensity": ([LinkPtr, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaSilencerCompletionStepsPhase": ([LinkPtr, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaSilencerFixedCompletionStepsMode": ([LinkPtr, ctypes.c_uint16], ctypes.c_bool),
+        "AUTDLinkAuditFpgaGPIOOutputTypes": ([LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8)], None),
+        "AUTDLinkAuditFpgaDebugValues": ([LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint64)], None),
+        "AUTDLinkAuditFpgaStmFreqDivide": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaStmCycle": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaSoundSpeed": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaStmLoopCount": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaModulationFreqDivide": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaModulationCycle": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaModulationBuffer": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8)], None),
+        "AUTDLinkAuditFpgaModulationLoopCount": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16], ctypes.c_uint16),
+        "AUTDLinkAuditFpgaDrivesAt": ([LinkPtr, ctypes.c_uint8, ctypes.c_uint16, ctypes.c_uint16, ctypes.POINTER(Drive)], None),
+        "AUTDLinkAuditFpgaPulseWidthEncoderTable": ([LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint64)], None),
+        "AUTDLinkGet": ([ControllerPtr], LinkPtr),
+        "AUTDLinkNop": ([], LinkPtr),
+        "AUTDModulationCustom": ([ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint16, SamplingConfigWrap], ModulationPtr),
+        "AUTDModulationWithFir": ([ModulationPtr, ctypes.POINTER(ctypes.c_float), ctypes.c_uint32], ModulationPtr),
+        "AUTDModulationFourierExact": ([ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(SineOption), ctypes.c_uint32, FourierOption], ModulationPtr),
+        "AUTDModulationFourierExactFloat": (
+            [
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(SineOption),
+                ctypes.c_uint32,
+                FourierOption,
+            ],
+            ModulationPtr,
+        ),
+        "AUTDModulationFourierNearest": ([ctypes.POINTER(ctypes.c_float), ctypes.POINTER(SineOption), ctypes.c_uint32, FourierOption], ModulationPtr),
+        "AUTDModulationSamplingConfig": ([ModulationPtr], SamplingConfigWrap),
+        "AUTDModulationIntoDatagramWithSegment": ([ModulationPtr, ctypes.c_uint8, TransitionModeWrap], DatagramPtr),
+        "AUTDModulationIntoDatagramWithFiniteLoop": ([ModulationPtr, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16], DatagramPtr),
+        "AUTDModulationIntoDatagram": ([ModulationPtr], DatagramPtr),
+        "AUTDModulationWithRadiationPressure": ([ModulationPtr], ModulationPtr),
+        "AUTDModulationSineExact": ([ctypes.c_uint32, SineOption], ModulationPtr),
+        "AUTDModulationSineExactFloat": ([ctypes.c_float, SineOption], ModulationPtr),
+        "AUTDModulationSineNearest": ([ctypes.c_float, SineOption], ModulationPtr),
+        "AUTDModulationSineIsDefault": ([SineOption], ctypes.c_bool),
+        "AUTDModulationSquareExact": ([ctypes.c_uint32, SquareOption], ModulationPtr),
+        "AUTDModulationSquareExactFloat": ([ctypes.c_float, SquareOption], ModulationPtr),
+        "AUTDModulationSquareNearest": ([ctypes.c_float, SquareOption], ModulationPtr),
+        "AUTDModulationSquareIsDefault": ([SquareOption], ctypes.c_bool),
+        "AUTDModulationStatic": ([ctypes.c_uint8], ModulationPtr),
+        "AUTDModulationStaticIsDefault": ([ctypes.c_uint8], ctypes.c_bool),
+        "AUTDGetErr": ([ctypes.c_void_p, ctypes.c_char_p], None),
+    }
 
-        self.dll.AUTDEnvironmentWavelength.argtypes = [EnvironmentPtr]
-        self.dll.AUTDEnvironmentWavelength.restype = ctypes.c_float
 
-        self.dll.AUTDEnvironmentWavenumber.argtypes = [EnvironmentPtr]
-        self.dll.AUTDEnvironmentWavenumber.restype = ctypes.c_float
-
-        self.dll.AUTDGainBessel.argtypes = [Point3, Vector3, Angle, BesselOption]
-        self.dll.AUTDGainBessel.restype = GainPtr
-
-        self.dll.AUTDGainBesselIsDefault.argtypes = [BesselOption]
-        self.dll.AUTDGainBesselIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGainCustom.argtypes = [ctypes.c_void_p, ctypes.c_void_p, GeometryPtr]
-        self.dll.AUTDGainCustom.restype = GainPtr
-
-        self.dll.AUTDGainFocus.argtypes = [Point3, FocusOption]
-        self.dll.AUTDGainFocus.restype = GainPtr
-
-        self.dll.AUTDGainFocusIsDefault.argtypes = [FocusOption]
-        self.dll.AUTDGainFocusIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGainGroupCreateMap.argtypes = [ctypes.POINTER(ctypes.c_uint16), ctypes.c_uint16]
-        self.dll.AUTDGainGroupCreateMap.restype = GroupGainMapPtr
-
-        self.dll.AUTDGainGroupMapSet.argtypes = [GroupGainMapPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_int32)]
-        self.dll.AUTDGainGroupMapSet.restype = GroupGainMapPtr
-
-        self.dll.AUTDGainGroup.argtypes = [GroupGainMapPtr, ctypes.POINTER(ctypes.c_int32), ctypes.POINTER(GainPtr), ctypes.c_uint32]
-        self.dll.AUTDGainGroup.restype = GainPtr
-
-        self.dll.AUTDGainIntoDatagramWithSegment.argtypes = [GainPtr, ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDGainIntoDatagramWithSegment.restype = DatagramPtr
-
-        self.dll.AUTDGainIntoDatagram.argtypes = [GainPtr]
-        self.dll.AUTDGainIntoDatagram.restype = DatagramPtr
-
-        self.dll.AUTDGainNull.argtypes = []
-        self.dll.AUTDGainNull.restype = GainPtr
-
-        self.dll.AUTDGainPlane.argtypes = [Vector3, PlaneOption]
-        self.dll.AUTDGainPlane.restype = GainPtr
-
-        self.dll.AUTDGainPlanelIsDefault.argtypes = [PlaneOption]
-        self.dll.AUTDGainPlanelIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGainUniform.argtypes = [Intensity, Phase]
-        self.dll.AUTDGainUniform.restype = GainPtr
-
-        self.dll.AUTDDevice.argtypes = [GeometryPtr, ctypes.c_uint16]
-        self.dll.AUTDDevice.restype = DevicePtr
-
-        self.dll.AUTDDeviceNumTransducers.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceNumTransducers.restype = ctypes.c_uint32
-
-        self.dll.AUTDDeviceCenter.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceCenter.restype = Point3
-
-        self.dll.AUTDDeviceRotation.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceRotation.restype = Quaternion
-
-        self.dll.AUTDDeviceDirectionX.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceDirectionX.restype = Vector3
-
-        self.dll.AUTDDeviceDirectionY.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceDirectionY.restype = Vector3
-
-        self.dll.AUTDDeviceDirectionAxial.argtypes = [DevicePtr]
-        self.dll.AUTDDeviceDirectionAxial.restype = Vector3
-
-        self.dll.AUTDGeometry.argtypes = [ControllerPtr]
-        self.dll.AUTDGeometry.restype = GeometryPtr
-
-        self.dll.AUTDGeometryNumDevices.argtypes = [GeometryPtr]
-        self.dll.AUTDGeometryNumDevices.restype = ctypes.c_uint32
-
-        self.dll.AUTDGeometryNumTransducers.argtypes = [GeometryPtr]
-        self.dll.AUTDGeometryNumTransducers.restype = ctypes.c_uint32
-
-        self.dll.AUTDGeometryCenter.argtypes = [GeometryPtr]
-        self.dll.AUTDGeometryCenter.restype = Point3
-
-        self.dll.AUTDGeometryReconfigure.argtypes = [GeometryPtr, ctypes.POINTER(Point3), ctypes.POINTER(Quaternion)]
-        self.dll.AUTDGeometryReconfigure.restype = None
-
-        self.dll.AUTDRotationFromEulerXYZ.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
-        self.dll.AUTDRotationFromEulerXYZ.restype = Quaternion
-
-        self.dll.AUTDRotationFromEulerZYZ.argtypes = [ctypes.c_float, ctypes.c_float, ctypes.c_float]
-        self.dll.AUTDRotationFromEulerZYZ.restype = Quaternion
-
-        self.dll.AUTDTransducer.argtypes = [DevicePtr, ctypes.c_uint8]
-        self.dll.AUTDTransducer.restype = TransducerPtr
-
-        self.dll.AUTDTransducerPosition.argtypes = [TransducerPtr]
-        self.dll.AUTDTransducerPosition.restype = Point3
-
-        self.dll.AUTDLinkAudit.argtypes = []
-        self.dll.AUTDLinkAudit.restype = LinkPtr
-
-        self.dll.AUTDLinkAuditIsOpen.argtypes = [LinkPtr]
-        self.dll.AUTDLinkAuditIsOpen.restype = ctypes.c_bool
-
-        self.dll.AUTDLinkAuditBreakDown.argtypes = [LinkPtr]
-        self.dll.AUTDLinkAuditBreakDown.restype = None
-
-        self.dll.AUTDLinkAuditRepair.argtypes = [LinkPtr]
-        self.dll.AUTDLinkAuditRepair.restype = None
-
-        self.dll.AUTDLinkAuditCpuNumTransducers.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditCpuNumTransducers.restype = ctypes.c_uint32
-
-        self.dll.AUTDLinkAuditFpgaAssertThermalSensor.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaAssertThermalSensor.restype = None
-
-        self.dll.AUTDLinkAuditFpgaDeassertThermalSensor.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaDeassertThermalSensor.restype = None
-
-        self.dll.AUTDLinkAuditFpgaIsForceFan.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaIsForceFan.restype = ctypes.c_bool
-
-        self.dll.AUTDLinkAuditFpgaCurrentStmSegment.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaCurrentStmSegment.restype = Segment
-
-        self.dll.AUTDLinkAuditFpgaCurrentModSegment.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaCurrentModSegment.restype = Segment
-
-        self.dll.AUTDLinkAuditFpgaIsStmGainMode.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaIsStmGainMode.restype = ctypes.c_bool
-
-        self.dll.AUTDLinkAuditCpuSilencerStrict.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditCpuSilencerStrict.restype = ctypes.c_bool
-
-        self.dll.AUTDLinkAuditFpgaSilencerUpdateRateIntensity.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSilencerUpdateRateIntensity.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaSilencerUpdateRatePhase.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSilencerUpdateRatePhase.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaSilencerCompletionStepsIntensity.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSilencerCompletionStepsIntensity.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaSilencerCompletionStepsPhase.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSilencerCompletionStepsPhase.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaSilencerFixedCompletionStepsMode.argtypes = [LinkPtr, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSilencerFixedCompletionStepsMode.restype = ctypes.c_bool
-
-        self.dll.AUTDLinkAuditFpgaGPIOOutputTypes.argtypes = [LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8)]
-        self.dll.AUTDLinkAuditFpgaGPIOOutputTypes.restype = None
-
-        self.dll.AUTDLinkAuditFpgaDebugValues.argtypes = [LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint64)]
-        self.dll.AUTDLinkAuditFpgaDebugValues.restype = None
-
-        self.dll.AUTDLinkAuditFpgaStmFreqDivide.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaStmFreqDivide.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaStmCycle.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaStmCycle.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaSoundSpeed.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaSoundSpeed.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaStmLoopCount.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaStmLoopCount.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaModulationFreqDivide.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaModulationFreqDivide.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaModulationCycle.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaModulationCycle.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaModulationBuffer.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint8)]
-        self.dll.AUTDLinkAuditFpgaModulationBuffer.restype = None
-
-        self.dll.AUTDLinkAuditFpgaModulationLoopCount.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16]
-        self.dll.AUTDLinkAuditFpgaModulationLoopCount.restype = ctypes.c_uint16
-
-        self.dll.AUTDLinkAuditFpgaDrivesAt.argtypes = [LinkPtr, ctypes.c_uint8, ctypes.c_uint16, ctypes.c_uint16, ctypes.POINTER(Drive)]
-        self.dll.AUTDLinkAuditFpgaDrivesAt.restype = None
-
-        self.dll.AUTDLinkAuditFpgaPulseWidthEncoderTable.argtypes = [LinkPtr, ctypes.c_uint16, ctypes.POINTER(ctypes.c_uint64)]
-        self.dll.AUTDLinkAuditFpgaPulseWidthEncoderTable.restype = None
-
-        self.dll.AUTDLinkGet.argtypes = [ControllerPtr]
-        self.dll.AUTDLinkGet.restype = LinkPtr
-
-        self.dll.AUTDLinkNop.argtypes = []
-        self.dll.AUTDLinkNop.restype = LinkPtr
-
-        self.dll.AUTDModulationCustom.argtypes = [ctypes.POINTER(ctypes.c_uint8), ctypes.c_uint16, SamplingConfigWrap]
-        self.dll.AUTDModulationCustom.restype = ModulationPtr
-
-        self.dll.AUTDModulationWithFir.argtypes = [ModulationPtr, ctypes.POINTER(ctypes.c_float), ctypes.c_uint32]
-        self.dll.AUTDModulationWithFir.restype = ModulationPtr
-
-        self.dll.AUTDModulationFourierExact.argtypes = [ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(SineOption), ctypes.c_uint32, FourierOption]
-        self.dll.AUTDModulationFourierExact.restype = ModulationPtr
-
-        self.dll.AUTDModulationFourierExactFloat.argtypes = [
-            ctypes.POINTER(ctypes.c_float),
-            ctypes.POINTER(SineOption),
-            ctypes.c_uint32,
-            FourierOption,
-        ]
-        self.dll.AUTDModulationFourierExactFloat.restype = ModulationPtr
-
-        self.dll.AUTDModulationFourierNearest.argtypes = [ctypes.POINTER(ctypes.c_float), ctypes.POINTER(SineOption), ctypes.c_uint32, FourierOption]
-        self.dll.AUTDModulationFourierNearest.restype = ModulationPtr
-
-        self.dll.AUTDModulationSamplingConfig.argtypes = [ModulationPtr]
-        self.dll.AUTDModulationSamplingConfig.restype = SamplingConfigWrap
-
-        self.dll.AUTDModulationIntoDatagramWithSegment.argtypes = [ModulationPtr, ctypes.c_uint8, TransitionModeWrap]
-        self.dll.AUTDModulationIntoDatagramWithSegment.restype = DatagramPtr
-
-        self.dll.AUTDModulationIntoDatagramWithFiniteLoop.argtypes = [ModulationPtr, ctypes.c_uint8, TransitionModeWrap, ctypes.c_uint16]
-        self.dll.AUTDModulationIntoDatagramWithFiniteLoop.restype = DatagramPtr
-
-        self.dll.AUTDModulationIntoDatagram.argtypes = [ModulationPtr]
-        self.dll.AUTDModulationIntoDatagram.restype = DatagramPtr
-
-        self.dll.AUTDModulationWithRadiationPressure.argtypes = [ModulationPtr]
-        self.dll.AUTDModulationWithRadiationPressure.restype = ModulationPtr
-
-        self.dll.AUTDModulationSineExact.argtypes = [ctypes.c_uint32, SineOption]
-        self.dll.AUTDModulationSineExact.restype = ModulationPtr
-
-        self.dll.AUTDModulationSineExactFloat.argtypes = [ctypes.c_float, SineOption]
-        self.dll.AUTDModulationSineExactFloat.restype = ModulationPtr
-
-        self.dll.AUTDModulationSineNearest.argtypes = [ctypes.c_float, SineOption]
-        self.dll.AUTDModulationSineNearest.restype = ModulationPtr
-
-        self.dll.AUTDModulationSineIsDefault.argtypes = [SineOption]
-        self.dll.AUTDModulationSineIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDModulationSquareExact.argtypes = [ctypes.c_uint32, SquareOption]
-        self.dll.AUTDModulationSquareExact.restype = ModulationPtr
-
-        self.dll.AUTDModulationSquareExactFloat.argtypes = [ctypes.c_float, SquareOption]
-        self.dll.AUTDModulationSquareExactFloat.restype = ModulationPtr
-
-        self.dll.AUTDModulationSquareNearest.argtypes = [ctypes.c_float, SquareOption]
-        self.dll.AUTDModulationSquareNearest.restype = ModulationPtr
-
-        self.dll.AUTDModulationSquareIsDefault.argtypes = [SquareOption]
-        self.dll.AUTDModulationSquareIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDModulationStatic.argtypes = [ctypes.c_uint8]
-        self.dll.AUTDModulationStatic.restype = ModulationPtr
-
-        self.dll.AUTDModulationStaticIsDefault.argtypes = [ctypes.c_uint8]
-        self.dll.AUTDModulationStaticIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGetErr.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self.dll.AUTDGetErr.restype = None
+class NativeMethods(metaclass=Singleton):
+    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
+        self.dll = _LazyDLL(bin_location / f"{bin_prefix}autd3capi{bin_ext}", _signatures)
 
     def controller_open(
         self, pos: "ctypes._Pointer[Point3]", rot: "ctypes._Pointer[Quaternion]", len_: int, link: LinkPtr, option: SenderOption
@@ -1,6 +1,7 @@
 import ctypes
 import enum
 import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from pyautd3.native_methods.autd3 import Intensity
@@ -85,51 +86,52 @@ class Singleton(type):
         return cls._instances[cls]
 
 
-class NativeMethods(metaclass=Singleton):
-    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
-        self.dll = ctypes.CDLL(str(bin_location / f"{bin_prefix}autd3capi_gain_holo{bin_ext}"))
-
-        self.dll.AUTDGainHoloConstraintNormalize.argtypes = []
-        self.dll.AUTDGainHoloConstraintNormalize.restype = EmissionConstraintWrap
-
-        self.dll.AUTDGainHoloConstraintUniform.argtypes = [Intensity]
-        self.dll.AUTDGainHoloConstraintUniform.restype = EmissionConstraintWrap
-
-        self.dll.AUTDGainHoloConstraintMultiply.argtypes = [ctypes.c_float]
-        self.dll.AUTDGainHoloConstraintMultiply.restype = EmissionConstraintWrap
-
-        self.dll.AUTDGainHoloConstraintClamp.argtypes = [Intensity, Intensity]
-        self.dll.AUTDGainHoloConstraintClamp.restype = EmissionConstraintWrap
-
-        self.dll.AUTDGainHoloGreedySphere.argtypes = [ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GreedyOption]
-        self.dll.AUTDGainHoloGreedySphere.restype = GainPtr
-
-        self.dll.AUTDGainGreedyIsDefault.argtypes = [GreedyOption]
-        self.dll.AUTDGainGreedyIsDefault.restype = ctypes.c_bool
+class _LazyDLL:
+    def __init__(self, path: Path, signatures: Callable[[], dict[str, tuple[list, object]]]) -> None:
+        self._path = path
+        self._signatures = signatures
+        self._dll: ctypes.CDLL | None = None
+        self._table: dict[str, tuple[list, object]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> tuple[ctypes.CDLL, dict[str, tuple[list, object]]]:
+        if self._dll is None or self._table is None:
+            with self._lock:
+                if self._dll is None or self._table is None:
+                    self._table = self._signatures()
+                    self._dll = ctypes.CDLL(str(self._path))
+        return self._dll, self._table
+
+    def __getattr__(self, name: str):
+        dll, table = self._load()
+        func = getattr(dll, name)
+        func.argtypes, func.restype = table[name]
+        setattr(self, name, func)
+        return func
+
+
+def _signatures() -> dict[str, tuple[list, object]]:
+    return {
+        "AUTDGainHoloConstraintNormalize": ([], EmissionConstraintWrap),
+        "AUTDGainHoloConstraintUniform": ([Intensity], EmissionConstraintWrap),
+        "AUTDGainHoloConstraintMultiply": ([ctypes.c_float], EmissionConstraintWrap),
+        "AUTDGainHoloConstraintClamp": ([Intensity, Intensity], EmissionConstraintWrap),
+        "AUTDGainHoloGreedySphere": ([ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GreedyOption], GainPtr),
+        "AUTDGainGreedyIsDefault": ([GreedyOption], ctypes.c_bool),
+        "AUTDGainHoloGSSphere": ([ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GSOption], GainPtr),
+        "AUTDGainGSIsDefault": ([GSOption], ctypes.c_bool),
+        "AUTDGainHoloGSPATSphere": ([ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GSPATOption], GainPtr),
+        "AUTDGainGSPATIsDefault": ([GSPATOption], ctypes.c_bool),
+        "AUTDGainHoloSPLToPascal": ([ctypes.c_float], ctypes.c_float),
+        "AUTDGainHoloPascalToSPL": ([ctypes.c_float], ctypes.c_float),
+        "AUTDGainHoloNaiveSphere": ([ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, NaiveOption], GainPtr),
+        "AUTDGainNaiveIsDefault": ([NaiveOption], ctypes.c_bool),
+    }
 
-        self.dll.AUTDGainHoloGSSphere.argtypes = [ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GSOption]
-        self.dll.AUTDGainHoloGSSphere.restype = GainPtr
 
-        self.dll.AUTDGainGSIsDefault.argtypes = [GSOption]
-        self.dll.AUTDGainGSIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGainHoloGSPATSphere.argtypes = [ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, GSPATOption]
-        self.dll.AUTDGainHoloGSPATSphere.restype = GainPtr
-
-        self.dll.AUTDGainGSPATIsDefault.argtypes = [GSPATOption]
-        self.dll.AUTDGainGSPATIsDefault.restype = ctypes.c_bool
-
-        self.dll.AUTDGainHoloSPLToPascal.argtypes = [ctypes.c_float]
-        self.dll.AUTDGainHoloSPLToPascal.restype = ctypes.c_float
-
-        self.dll.AUTDGainHoloPascalToSPL.argtypes = [ctypes.c_float]
-        self.dll.AUTDGainHoloPascalToSPL.restype = ctypes.c_float
-
-        self.dll.AUTDGainHoloNaiveSphere.argtypes = [ctypes.POINTER(Point3), ctypes.POINTER(ctypes.c_float), ctypes.c_uint32, NaiveOption]
-        self.dll.AUTDGainHoloNaiveSphere.restype = GainPtr
-
-        self.dll.AUTDGainNaiveIsDefault.argtypes = [NaiveOption]
-        self.dll.AUTDGainNaiveIsDefault.restype = ctypes.c_bool
+class NativeMethods(metaclass=Singleton):
+    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
+        self.dll = _LazyDLL(bin_location / f"{bin_prefix}autd3capi_gain_holo{bin_ext}", _signatures)
 
     def gain_holo_constraint_normalize(self) -> EmissionConstraintWrap:
         return self.dll.AUTDGainHoloConstraintNormalize()
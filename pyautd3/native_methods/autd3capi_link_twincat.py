@@ -1,5 +1,6 @@
 import ctypes
 import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from pyautd3.native_methods.autd3capi_driver import ResultLink
@@ -17,12 +18,39 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+class _LazyDLL:
+    def __init__(self, path: Path, signatures: Callable[[], dict[str, tuple[list, object]]]) -> None:
+        self._path = path
+        self._signatures = signatures
+        self._dll: ctypes.CDLL | None = None
+        self._table: dict[str, tuple[list, object]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> tuple[ctypes.CDLL, dict[str, tuple[list, object]]]:
+        if self._dll is None or self._table is None:
+            with self._lock:
+                if self._dll is None or self._table is None:
+                    self._table = self._signatures()
+                    self._dll = ctypes.CDLL(str(self._path))
+        return self._dll, self._table
+
+    def __getattr__(self, name: str):
+        dll, table = self._load()
+        func = getattr(dll, name)
+        func.argtypes, func.restype = table[name]
+        setattr(self, name, func)
+        return func
+
+
+def _signatures() -> dict[str, tuple[list, object]]:
+    return {
+        "AUTDLinkTwinCAT": ([], ResultLink),
+    }
+
+
 class NativeMethods(metaclass=Singleton):
     def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
-        self.dll = ctypes.CDLL(str(bin_location / f"{bin_prefix}autd3capi_link_twincat{bin_ext}"))
-
-        self.dll.AUTDLinkTwinCAT.argtypes = []
-        self.dll.AUTDLinkTwinCAT.restype = ResultLink
+        self.dll = _LazyDLL(bin_location / f"{bin_prefix}autd3capi_link_twincat{bin_ext}", _signatures)
 
     def link_twin_cat(self) -> ResultLink:
         return self.dll.AUTDLinkTwinCAT()
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from pyautd3.autd_error import AUTDError
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from pyautd3.native_methods.autd3capi import SamplingConfigWrap
@@ -64,6 +66,22 @@ def _validate_ptr(res):
     return res.result
 
 
+class LazyConstant[T]:
+    _factory: Callable[[], T]
+    _name: str
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: object, owner: type) -> T:
+        value = self._factory()
+        type.__setattr__(owner, self._name, value)
+        return value
+
+
 class ConstantADT(type):
     _initialized = False
 
@@ -0,0 +1,4 @@
+from .directivity import sphere, t4010a1
+from .field import T4010A1_AMPLITUDE, Simulator, grid
+
+__all__ = ["T4010A1_AMPLITUDE", "Simulator", "grid", "sphere", "t4010a1"]
@@ -0,0 +1,41 @@
+import numpy as np
+
+_DIR_COEF = np.array(
+    [
+        [1.0, 0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0, 0.0],
+        [1.0, -0.00459648054721, -0.000787968093807, 1.60125528528e-05],
+        [0.891250938, -0.0155520765675, -0.000307591508224, 2.9747624976e-06],
+        [0.707945784, -0.0208114779827, -0.000218348633296, 2.31910931569e-05],
+        [0.501187234, -0.0182211227016, 0.00047738416141, -1.1901034125e-05],
+        [0.354813389, -0.0122437497109, 0.000120353137658, 6.77743734332e-06],
+        [0.251188643, -0.00780345575475, 0.000323676257958, -5.99548024824e-06],
+        [0.199526231, -0.00312857467007, 0.000143850511, -4.79372459757e-06],
+    ],
+)
+
+
+def t4010a1(cos_theta: np.ndarray) -> np.ndarray:
+    dtype = cos_theta.dtype.type if np.issubdtype(cos_theta.dtype, np.floating) else np.float64
+    coef = _DIR_COEF.astype(dtype)
+    theta = np.abs(cos_theta, dtype=dtype)
+    np.minimum(theta, 1.0, out=theta)
+    np.arccos(theta, out=theta)
+    theta *= dtype(180.0 / np.pi)
+    i = np.ceil(theta * dtype(0.1)).astype(np.int32)
+    i -= 1
+    np.clip(i, 0, len(coef) - 1, out=i)
+    x = theta
+    x -= i * dtype(10.0)
+    res = np.take(coef[:, 3], i)
+    res *= x
+    res += np.take(coef[:, 2], i)
+    res *= x
+    res += np.take(coef[:, 1], i)
+    res *= x
+    res += np.take(coef[:, 0], i)
+    return res
+
+
+def sphere(cos_theta: np.ndarray) -> np.ndarray:
+    return np.ones_like(cos_theta)
@@ -0,0 +1,142 @@
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pyautd3.controller.controller import Controller
+from pyautd3.controller.environment import Environment
+from pyautd3.controller.shadow import _AuditShadow
+from pyautd3.driver.datagram.gain import Gain
+from pyautd3.driver.geometry import Geometry
+from pyautd3.driver.utils import _validate_u8_array
+from pyautd3.simulate.directivity import t4010a1
+
+T4010A1_AMPLITUDE: float = 275.574246625 * 200.0
+
+DEFAULT_CHUNK_ELEMENTS: int = 1 << 22
+
+
+class Simulator:
+    _geometry: Geometry
+    _environment: Environment
+    _dtype: type[np.floating]
+    _directivity: Callable[[np.ndarray], np.ndarray]
+    _chunk_size: int | None
+    _num_threads: int
+    _shadow: _AuditShadow
+
+    def __init__(
+        self: Self,
+        geometry: Geometry,
+        environment: Environment | None = None,
+        *,
+        dtype: type[np.float32] | type[np.float64] = np.float32,
+        directivity: Callable[[np.ndarray], np.ndarray] = t4010a1,
+        chunk_size: int | None = None,
+        num_threads: int | None = None,
+    ) -> None:
+        match environment, geometry:
+            case None, Controller():
+                environment = geometry.environment
+            case None, _:
+                msg = "environment is required unless geometry is a Controller"
+                raise ValueError(msg)
+        self._geometry = geometry
+        self._environment = environment  # type: ignore[bad-assignment]
+        self._dtype = dtype
+        self._directivity = directivity
+        self._chunk_size = chunk_size
+        self._num_threads = num_threads or os.cpu_count() or 1
+        self._shadow = _AuditShadow()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        self._shadow.close()
+
+    def drives(self: Self, gain: Gain) -> tuple[np.ndarray, np.ndarray]:
+        return self._shadow.drives(gain, self._geometry, self._environment.sound_speed)
+
+    def _sources(self: Self, source: Gain | tuple[ArrayLike | Sequence[ArrayLike], ArrayLike | Sequence[ArrayLike]]) -> np.ndarray:
+        match source:
+            case Gain():
+                intensity, phase = self.drives(source)
+            case (intensity_, phase_):
+                intensity = _validate_u8_array(intensity_).ravel()
+                phase = _validate_u8_array(phase_).ravel()
+            case _:
+                raise TypeError
+        if intensity.shape != (self._geometry.num_transducers(),) or phase.shape != intensity.shape:
+            msg = f"The number of drives does not match the number of transducers ({self._geometry.num_transducers()})"
+            raise ValueError(msg)
+        complex_dtype = np.result_type(self._dtype, np.complex64)
+        amp = (T4010A1_AMPLITUDE / 255.0) * intensity.astype(self._dtype)
+        return (amp * np.exp(1j * (2.0 * np.pi / 256.0) * phase.astype(self._dtype))).astype(complex_dtype)
+
+    def transfer(self: Self, points: ArrayLike) -> np.ndarray:
+        x = np.asarray(points, dtype=self._dtype)
+        return self._propagate(x.reshape(-1, 3), None).reshape((*x.shape[:-1], self._geometry.num_transducers()))
+
+    def pressure(
+        self: Self,
+        source: Gain | tuple[ArrayLike | Sequence[ArrayLike], ArrayLike | Sequence[ArrayLike]],
+        points: ArrayLike,
+    ) -> np.ndarray:
+        x = np.asarray(points, dtype=self._dtype)
+        if x.shape[-1] != 3:  # noqa: PLR2004
+            msg = f"points must have shape (..., 3), but got {x.shape}"
+            raise ValueError(msg)
+        return self._propagate(x.reshape(-1, 3), self._sources(source)).reshape(x.shape[:-1])
+
+    def _propagate(self: Self, points: np.ndarray, q: np.ndarray | None) -> np.ndarray:
+        origin = self._geometry.center()
+        pos = (self._geometry.positions() - origin).astype(self._dtype)
+        dirs = self._geometry.directions().astype(self._dtype)
+        points = (points - origin.astype(self._dtype)).astype(self._dtype, copy=False)
+        pos_sq = np.einsum("nk,nk->n", pos, pos)
+        pos_dir = np.einsum("nk,nk->n", pos, dirs)
+        k = self._dtype(self._environment.wavenumber())
+        complex_dtype = np.result_type(self._dtype, np.complex64)
+        n = len(pos)
+        m = len(points)
+        out = np.empty(m if q is not None else (m, n), dtype=complex_dtype)
+        chunk = self._chunk_size or max(1, DEFAULT_CHUNK_ELEMENTS // max(n, 1))
+
+        def run(start: int) -> None:
+            x = points[start : start + chunk]
+            dist = np.einsum("mk,mk->m", x, x)[:, np.newaxis] + pos_sq - 2 * (x @ pos.T)
+            np.sqrt(np.maximum(dist, 0, out=dist), out=dist)
+            amp = self._directivity((x @ dirs.T - pos_dir) / dist)
+            amp /= dist
+            dist *= k
+            g = np.empty(dist.shape, dtype=complex_dtype)
+            np.multiply(amp, np.cos(dist), out=g.real)
+            np.multiply(amp, np.sin(dist), out=g.imag)
+            out[start : start + chunk] = g if q is None else g @ q
+
+        starts = range(0, m, chunk)
+        if len(starts) <= 1 or self._num_threads == 1:
+            for s in starts:
+                run(s)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._num_threads, len(starts))) as pool:
+                list(pool.map(run, starts))
+        return out
+
+
+def grid(x: ArrayLike, y: ArrayLike, z: ArrayLike) -> np.ndarray:
+    xx, yy, zz = np.meshgrid(np.atleast_1d(x), np.atleast_1d(y), np.atleast_1d(z), indexing="ij")
+    return np.stack([xx, yy, zz], axis=-1)
@@ -38,6 +38,9 @@ class Duration:
     def as_nanos(self) -> int:
         return int(self._inner.nanos)
 
+    def __reduce__(self: Self) -> tuple:
+        return (Duration.from_nanos, (self.as_nanos(),))
+
     def as_micros(self) -> int:
         return self.as_nanos() // 1000
 
@@ -10,6 +10,7 @@ from pyautd3.driver.datagram.stm.control_point import ControlPoint, ControlPoint
 from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
 from pyautd3.driver.datagram.with_segment import WithSegment
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
+from pyautd3.driver.firmware.fpga.phase import Phase
 from pyautd3.utils import Duration
 from tests.test_autd import create_controller
 
@@ -255,3 +256,71 @@ def test_foci_stm_invalid_sampling_config():
     with pytest.raises(AUTDError) as e:
         _ = stm.sampling_config()
     assert str(e.value) == "STM sampling period (1ns/2) must be integer"
+
+
+def test_foci_stm_from_array():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Silencer.disable())
+
+        size = 10
+        n = 2
+        rng = np.random.default_rng(0)
+        points = autd.center() + np.array([0.0, 0.0, 150.0]) + rng.uniform(-20.0, 20.0, (size, n, 3))
+        intensity = np.arange(size, dtype=np.uint8) * 10
+        phase_offset = rng.integers(0, 256, (size, n), dtype=np.uint8)
+
+        stm = FociSTM.from_array(points, SamplingConfig.FREQ_40K, intensity=intensity, phase_offset=phase_offset)
+        assert stm._n() == n
+        autd.send(stm)
+        expected = FociSTM(
+            foci=[
+                ControlPoints(
+                    points=[ControlPoint(point=points[i, j], phase_offset=Phase(int(phase_offset[i, j]))) for j in range(n)],
+                    intensity=Intensity(int(intensity[i])),
+                )
+                for i in range(size)
+            ],
+            config=SamplingConfig.FREQ_40K,
+        )
+        autd.send(WithSegment(inner=expected, segment=Segment.S1, transition_mode=transition_mode.Later()))
+        for dev in autd.geometry():
+            assert autd.link().stm_cycle(dev.idx(), Segment.S0) == size
+            for i in range(size):
+                intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, i)
+                intensities_e, phases_e = autd.link().drives_at(dev.idx(), Segment.S1, i)
+                assert np.array_equal(intensities, intensities_e)
+                assert np.array_equal(phases, phases_e)
+
+        stm = FociSTM.from_array(points[:, 0, :], 1.0 * Hz).into_nearest()
+        assert stm._n() == 1
+        autd.send(stm)
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.all(intensities == 0xFF)
+
+        stm = FociSTM.from_array(points, SamplingConfig.FREQ_40K, intensity=intensity)
+        foci = stm.foci
+        assert len(foci) == size
+        assert np.allclose(foci[3].points[1].point, points[3, 1])
+        assert foci[3].intensity == Intensity(30)
+        assert foci[3].points[1].phase_offset == Phase(0)
+        assert stm.foci is foci
+        assert stm._pack() is stm._buffer
+        autd.send(stm)
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 3)
+            assert np.all(intensities <= 30)
+        stm.foci = foci[:2]
+        assert stm._buffer is None
+        assert stm.sampling_config() == SamplingConfig.FREQ_40K
+        assert len(stm._pack()) == 2
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = FociSTM.from_array(np.zeros((size, 9, 3)), SamplingConfig.FREQ_40K)
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = FociSTM.from_array(np.zeros((size, 2)), SamplingConfig.FREQ_40K)
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = FociSTM.from_array(points, SamplingConfig.FREQ_40K, intensity=np.full(size, 256))
+        with pytest.raises(TypeError):
+            _ = FociSTM.from_array(points, SamplingConfig.FREQ_40K, phase_offset=np.zeros((size, n)))
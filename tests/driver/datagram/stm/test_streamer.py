@@ -0,0 +1,80 @@
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import Controller, FociSTM, GainSTM, SamplingConfig, Segment, Silencer, StmStreamer, Uniform
+from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
+from pyautd3.driver.firmware.fpga.phase import Phase
+from pyautd3.utils import Duration
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3.link.audit import Audit
+
+
+def trajectory(n: int, delay_at: int | None = None) -> Iterator[np.ndarray]:
+    for i in range(n):
+        if i == delay_at:
+            time.sleep(0.2)
+        yield np.array([10.0 * i, 0.0, 150.0])
+
+
+def test_stm_streamer_foci():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Silencer.disable())
+        config = SamplingConfig(200)
+
+        streamer = StmStreamer(trajectory(21), config, chunk_size=10)
+        stats = streamer.play(autd, lead=Duration.from_millis(10), margin=Duration.from_millis(1), sys_time=False)
+        assert (stats.chunks, stats.frames) == (2, 21)
+        assert autd.link().stm_cycle(0, Segment.S1) == 10
+        assert autd.link().stm_cycle(0, Segment.S0) == 11
+        assert autd.link().stm_loop_count(0, Segment.S0) == 0
+
+        expected = [autd.link().drives_at(dev.idx(), Segment.S0, 10) for dev in autd.geometry()]
+        autd.send(FociSTM(foci=list(trajectory(21))[10:], config=config))
+        for dev, (intensities, phases) in zip(autd.geometry(), expected, strict=True):
+            intensities_e, phases_e = autd.link().drives_at(dev.idx(), Segment.S0, 10)
+            assert np.array_equal(intensities, intensities_e)
+            assert np.array_equal(phases, phases_e)
+
+        streamer = StmStreamer(trajectory(30, delay_at=15), config, chunk_size=10)
+        stats = streamer.play(autd, lead=Duration.from_millis(10), margin=Duration.from_millis(1), sys_time=False)
+        assert (stats.chunks, stats.frames) == (3, 30)
+        assert stats.underruns >= 1
+        assert stats.max_late_ns > 0
+        assert autd.link().stm_cycle(0, Segment.S1) == 10
+
+
+def test_stm_streamer_gain():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Silencer.disable())
+        gains = (Uniform(intensity=Intensity(i), phase=Phase(0)) for i in range(5))
+        first, second = StmStreamer(gains, SamplingConfig(200), chunk_size=2)
+        assert isinstance(first, GainSTM)
+        assert isinstance(second, GainSTM)
+        assert [len(first.gains), len(second.gains)] == [2, 3]
+
+        stats = StmStreamer(iter(second.gains), SamplingConfig(200)).play(autd, lead=Duration.from_millis(1), sys_time=False)
+        assert (stats.chunks, stats.frames) == (1, 3)
+        assert autd.link().is_stm_gain_mode(0, Segment.S1)
+        for i in range(3):
+            intensities, _ = autd.link().drives_at(0, Segment.S1, i)
+            assert np.all(intensities == i + 2)
+
+
+def test_stm_streamer_invalid():
+    with pytest.raises(ValueError, match="chunk_size"):
+        _ = StmStreamer(trajectory(4), SamplingConfig(200), chunk_size=1)
+    with pytest.raises(ValueError, match="at least 2 frames"):
+        _ = list(StmStreamer(trajectory(1), SamplingConfig(200)))
+    assert list(StmStreamer(trajectory(0), SamplingConfig(200))) == []
+
+    autd: Controller[Audit]
+    with create_controller() as autd, pytest.raises(ValueError, match="at least 2 frames"):
+        _ = StmStreamer(trajectory(1), SamplingConfig(200)).play(autd, sys_time=False)
@@ -66,3 +66,25 @@ def test_group_check_only_for_enabled():
         intensities, phases = autd.link().drives_at(1, Segment.S0, 0)
         assert np.all(intensities == 0x80)
         assert np.all(phases == 0x90)
+
+
+def test_group_from_labels():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Group.from_labels(["a", None], {"a": Uniform(intensity=Intensity(0x80), phase=Phase(0x90))}))
+
+        intensities, phases = autd.link().drives_at(0, Segment.S0, 0)
+        assert np.all(intensities == 0x80)
+        assert np.all(phases == 0x90)
+        intensities, _ = autd.link().drives_at(1, Segment.S0, 0)
+        assert np.all(intensities == 0)
+
+        autd.send(Group.from_labels(np.array([1, 0]), {0: Null(), 1: Uniform(intensity=Intensity(0x81), phase=Phase(0x91))}))
+
+        intensities, _ = autd.link().drives_at(0, Segment.S0, 0)
+        assert np.all(intensities == 0x81)
+        intensities, _ = autd.link().drives_at(1, Segment.S0, 0)
+        assert np.all(intensities == 0)
+
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(Group.from_labels([0], {0: Null()}))
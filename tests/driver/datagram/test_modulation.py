@@ -3,10 +3,13 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pytest
 
-from pyautd3 import Controller, Segment, Static, transition_mode
+from pyautd3 import Controller, Hz, SamplingConfig, Segment, Static, transition_mode
+from pyautd3.autd_error import AUTDError
 from pyautd3.driver.datagram.segment import SwapSegmentModulation
 from pyautd3.driver.datagram.with_finite_loop import WithFiniteLoop
 from pyautd3.driver.datagram.with_segment import WithSegment
+from pyautd3.modulation import Custom, Fir, Fourier, FourierOption, RadiationPressure, Sine, SineOption, Square, SquareOption
+from pyautd3.native_methods.autd3capi import NativeMethods as Base
 from tests.test_autd import create_controller
 
 if TYPE_CHECKING:
@@ -77,3 +80,61 @@ def test_mod_loop_behavior():
                 transition_mode=transition_mode.SyncIdx(),
                 loop_count=0,
             )
+
+
+def test_mod_calc():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        modulations = [
+            Static(intensity=0x80),
+            Sine(freq=150 * Hz, option=SineOption(sampling_config=SamplingConfig(20))),
+            Square(freq=200 * Hz, option=SquareOption()),
+            Fourier(components=[Sine(freq=50 * Hz, option=SineOption()), Sine(freq=100 * Hz, option=SineOption())], option=FourierOption()),
+            Fir(target=Sine(freq=150 * Hz, option=SineOption()), coef=[0.25, 0.5, 0.25]),
+            RadiationPressure(target=Sine(freq=150 * Hz, option=SineOption())),
+            Custom(buffer=[0x00, 0x40, 0x80], sampling_config=SamplingConfig(10)),
+        ]
+        for m in modulations:
+            config = SamplingConfig(Base().modulation_sampling_config(m._modulation_ptr()))
+            assert m.sampling_config() == config
+
+            autd.send(m)
+            expected = autd.link().modulation_buffer(0, Segment.S0)
+
+            buffer, config_ = autd.calc_modulation(m)
+            assert np.array_equal(buffer, expected)
+            assert config_ == config
+            assert autd.calc_modulation(m)[0] is buffer
+
+            autd.send(WithSegment(inner=m, segment=Segment.S1, transition_mode=transition_mode.Immediate()))
+            assert np.array_equal(autd.link().modulation_buffer(0, Segment.S1), expected)
+            assert autd.link().modulation_frequency_divide(0, Segment.S1) == config.divide
+
+        m = Sine(freq=150 * Hz, option=SineOption())
+        buffer, _ = autd.calc_modulation(m)
+        m.freq = 100 * Hz
+        assert autd.calc_modulation(m)[0] is not buffer
+        autd.send(m)
+        assert np.array_equal(autd.link().modulation_buffer(0, Segment.S0), autd.calc_modulation(m)[0])
+
+        target = Sine(freq=150 * Hz, option=SineOption())
+        _ = autd.calc_modulation(target)
+        fir = Fir(target=target, coef=[1.0])
+        autd.send(fir)
+        assert np.array_equal(autd.link().modulation_buffer(0, Segment.S0), autd.calc_modulation(target)[0])
+
+
+def test_mod_calc_shadow_closed():
+    autd = create_controller()
+    assert autd._shadow is None
+    buffer, _ = autd.calc_modulation(Static(intensity=0x80))
+    assert np.all(buffer == 0x80)
+    modulation_shadow = autd._shadow
+    assert modulation_shadow is not None
+    assert modulation_shadow._controller is not None
+
+    autd.close()
+    assert autd._shadow is None
+    assert modulation_shadow._controller is None
+    with pytest.raises(AUTDError, match="Controller is closed"):
+        autd.calc_modulation(Static(intensity=0x40))
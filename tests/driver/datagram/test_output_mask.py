@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 from pyautd3 import Controller, Intensity, OutputMask, Phase, Segment, Uniform, WithSegment, transition_mode
 from tests.test_autd import create_controller
@@ -45,3 +46,20 @@ def test_output_mask():
             intensities, phases = autd.link().drives_at(dev.idx(), Segment.S1, 0)
             assert np.all(intensities == 0x00)
             assert np.all(phases == 0x81)
+
+
+def test_output_mask_from_array():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Uniform(intensity=Intensity(0x80), phase=Phase(0x81)))
+
+        mask = np.arange(autd.num_transducers()) % 2 == 0
+        autd.send(OutputMask.from_array(mask))
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, np.where(mask[autd.geometry().device_indices() == dev.idx()], 0x80, 0x00))
+
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(OutputMask.from_array(np.ones(3, dtype=bool)))
+        with pytest.raises(TypeError):
+            OutputMask.from_array([0.5])
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 from pyautd3 import Controller, Phase, PhaseCorrection, Segment
 from tests.test_autd import create_controller
@@ -19,3 +20,24 @@ def test_phase_corr():
             assert np.all(intensities == 0x00)
             for i, phase in enumerate(phases):
                 assert phase == dev.idx() + i
+
+
+def test_phase_corr_from_array():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        phases = np.arange(autd.num_transducers(), dtype=np.uint32) % 256
+        autd.send(PhaseCorrection.from_array(phases.astype(np.uint8)))
+        for dev in autd.geometry():
+            _, p = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(p, phases[autd.geometry().device_indices() == dev.idx()])
+
+        per_device = np.full(autd.geometry()[0].num_transducers(), 0x42, dtype=np.uint8)
+        autd.send(PhaseCorrection.from_array(per_device))
+        for dev in autd.geometry():
+            _, p = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.all(p == 0x42)
+
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(PhaseCorrection.from_array(np.zeros(3, dtype=np.uint8)))
+        with pytest.raises(TypeError):
+            PhaseCorrection.from_array([0.5])
@@ -2,6 +2,7 @@ import secrets
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 from pyautd3.driver.datagram.pulse_width_encoder import PulseWidthEncoder
 from pyautd3.driver.firmware.fpga.pulse_width import PulseWidth
@@ -26,3 +27,25 @@ def test_pulse_width_encoder():
         for dev in autd.geometry():
             table = autd.link().pulse_width_encoder_table(dev.idx())
             assert np.array_equal(table, buf_default)
+
+
+def test_pulse_width_encoder_from_table():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        table = np.array([secrets.randbelow(256) for _ in range(256)], dtype=np.uint16)
+        autd.send(PulseWidthEncoder.from_table(table))
+        for dev in autd.geometry():
+            assert np.array_equal(autd.link().pulse_width_encoder_table(dev.idx()), [PulseWidth(int(v)) for v in table])
+
+        tables = np.stack([np.arange(256, dtype=np.uint16), np.arange(256, dtype=np.uint16)[::-1]])
+        pwe = PulseWidthEncoder.from_table(tables)
+        autd.send(pwe)
+        for dev in autd.geometry():
+            assert np.array_equal(autd.link().pulse_width_encoder_table(dev.idx()), [PulseWidth(int(v)) for v in tables[dev.idx()]])
+
+        assert len(PulseWidthEncoder.from_table(np.stack([table, table]))._tables) == 1  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(PulseWidthEncoder.from_table(np.zeros((3, 256), dtype=np.uint16)))
+        with pytest.raises(ValueError, match="must have shape"):
+            PulseWidthEncoder.from_table(np.zeros(255, dtype=np.uint16))
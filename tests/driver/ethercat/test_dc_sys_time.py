@@ -1,3 +1,5 @@
+import time
+
 from pyautd3.ethercat.dc_sys_time import DcSysTime
 from pyautd3.utils import Duration
 
@@ -11,3 +13,9 @@ def test_dc_sys_time():
 
     sub_1 = now - Duration.from_micros(1)
     assert sub_1.sys_time() == now.sys_time() - 1000
+
+
+def test_dc_sys_time_now():
+    before = time.time_ns()
+    now = DcSysTime.now()
+    assert before - 946_684_800_000_000_000 <= now.sys_time() <= time.time_ns() - 946_684_800_000_000_000
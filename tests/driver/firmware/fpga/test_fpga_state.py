@@ -87,3 +87,12 @@ def test_fpga_state():
             _ = autd.fpga_state()
         assert str(e.value) == "broken"
         autd.link().repair()
+
+
+def test_fpga_state_from_mask():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(ReadsFPGAState.from_mask([False, True]))
+        infos = autd.fpga_state()
+        assert infos[0] is None
+        assert infos[1] is not None
@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import GainSTMOption, SamplingConfig, Segment
+from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
+from pyautd3.driver.geometry import Geometry
+from pyautd3.gain.holo import GS, GSPAT, EmissionConstraint, GSOption, GSPATOption, Naive, NaiveOption, NumpyBackend, Pa
+from pyautd3.simulate import t4010a1
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+def drives(autd: "Controller[Audit]", idx: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    intensities, phases = zip(*(autd.link().drives_at(dev.idx(), Segment.S0, idx) for dev in autd.geometry()), strict=True)
+    return np.concatenate(intensities).astype(np.int32), np.concatenate(phases).astype(np.int32)
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        EmissionConstraint.Normalize,
+        EmissionConstraint.Uniform(Intensity(0x80)),
+        EmissionConstraint.Multiply(0.5),
+        EmissionConstraint.Clamp(Intensity(0x10), Intensity(0xF0)),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_numpy_backend(constraint, dtype):  # noqa: ANN001
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        backend = NumpyBackend(dtype=dtype, chunk_size=2, num_threads=2)
+        foci = [(autd.center() + np.array([x, y, 150.0]), (5e3 + 10.0 * x) * Pa) for x in [-30.0, 0.0, 30.0] for y in [-20.0, 20.0]]
+        for native, numpy in [
+            (GS(foci, GSOption(repeat=10, constraint=constraint)), GS(foci, GSOption(repeat=10, constraint=constraint, backend=backend))),
+            (
+                GSPAT(foci, GSPATOption(repeat=10, constraint=constraint)),
+                GSPAT(foci, GSPATOption(repeat=10, constraint=constraint, backend=backend)),
+            ),
+            (Naive(foci, NaiveOption(constraint=constraint)), Naive(foci, NaiveOption(constraint=constraint, backend=backend))),
+        ]:
+            autd.send(native)
+            intensities_e, phases_e = drives(autd)
+            autd.send(numpy)
+            intensities, phases = drives(autd)
+            assert np.abs(intensities - intensities_e).max() <= 1
+            assert np.abs((phases - phases_e + 128) % 256 - 128).max() <= 1
+
+
+def test_numpy_backend_batch():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        size = 4
+        points = np.tile(autd.center() + np.array([0.0, 0.0, 150.0]), (size, 2, 1))
+        points[:, 0, 0] += np.linspace(0.0, 10.0, size) - 30.0
+        points[:, 1, 0] += 30.0
+        stm = GS.batch(points, 5e3 * Pa, GSOption(repeat=10, backend=NumpyBackend()), SamplingConfig(0xFFFF), GainSTMOption(), warm_start=False)
+        autd.send(stm)
+        assert [g.iterations for g in stm.gains] == [10] * size  # type: ignore[missing-attribute]
+        expected = GS.batch(points, 5e3 * Pa, GSOption(repeat=10), SamplingConfig(0xFFFF))
+        for i in range(size):
+            intensities, phases = drives(autd, i)
+            autd.send(expected.gains[i])
+            intensities_e, phases_e = drives(autd)
+            assert np.abs(intensities - intensities_e).max() <= 1
+            assert np.abs((phases - phases_e + 128) % 256 - 128).max() <= 1
+
+
+@pytest.mark.parametrize(("cls", "option"), [(GS, GSOption), (GSPAT, GSPATOption)])
+def test_numpy_backend_batch_warm_start(cls: type[GS | GSPAT], option: type[GSOption | GSPATOption]):
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        size = 8
+        points = np.tile(autd.center() + np.array([0.0, 0.0, 150.0]), (size, 3, 1))
+        points[:, 0, 0] += np.linspace(0.0, 1.0, size) - 30.0
+        points[:, 1, 0] += 30.0
+        points[:, 2, 1] += 20.0
+        backend = NumpyBackend(dtype=np.float64)
+
+        cold = cls.batch(points, 5e3 * Pa, option(repeat=200, backend=backend), SamplingConfig(0xFFFF), warm_start=False, tol=1e-3)
+        warm = cls.batch(points, 5e3 * Pa, option(repeat=200, backend=backend), SamplingConfig(0xFFFF), tol=1e-3)
+        assert warm.gains[0].iterations is None  # type: ignore[missing-attribute]
+        autd.send(cold)
+        autd.send(warm)
+        cold_iterations = np.array([g.iterations for g in cold.gains])  # type: ignore[missing-attribute]
+        warm_iterations = np.array([g.iterations for g in warm.gains])  # type: ignore[missing-attribute]
+        assert np.all(cold_iterations <= 200)
+        assert np.all(warm_iterations <= 200)
+        assert warm_iterations[0] == cold_iterations[0]
+        assert warm_iterations[1:].sum() < cold_iterations[1:].sum()
+
+        stm = cls.batch(points, 5e3 * Pa, option(repeat=200, backend=backend), SamplingConfig(0xFFFF), repeat=np.arange(1, size + 1))
+        autd.send(stm)
+        assert [g.iterations for g in stm.gains] == list(range(1, size + 1))  # type: ignore[missing-attribute]
+
+
+def test_numpy_backend_transfer():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        points = autd.center() + np.array([[0.0, 0.0, 150.0], [30.0, 0.0, 150.0]])
+        g = NumpyBackend().transfer(autd, points)
+        assert g.shape == (2, autd.num_transducers())
+        assert g.dtype == np.complex64
+        assert NumpyBackend(dtype=np.float64).transfer(autd, points).dtype == np.complex128
+        assert np.all(np.abs(NumpyBackend(directivity=t4010a1).transfer(autd, points)) <= np.abs(g) * (1 + 1e-6))
+
+        with pytest.raises(ValueError, match="environment is required"):
+            _ = NumpyBackend().transfer(Geometry(autd._geometry_ptr), points)
+        g_env = NumpyBackend(environment=autd.environment).transfer(Geometry(autd._geometry_ptr), points)
+        assert np.allclose(g_env, g)
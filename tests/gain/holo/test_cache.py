@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import AUTD3, Segment
+from pyautd3.gain.holo import GS, GSOption, HoloCache, Naive, NaiveOption, Pa
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+def test_holo_cache():
+    autd: Controller[Audit]
+    with create_controller() as autd, HoloCache(autd, max_entries=2) as cache:
+        center = autd.center() + np.array([0.0, 0.0, 150.0])
+        foci = [(center + np.array([30.0, 0.0, 0.0]), 5e3 * Pa), (center - np.array([30.0, 0.0, 0.0]), 5e3 * Pa)]
+
+        autd.send(cache.get(GS(foci=foci, option=GSOption())))
+        assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+        cached = [autd.link().drives_at(dev.idx(), Segment.S0, 0) for dev in autd.geometry()]
+
+        autd.send(GS(foci=foci, option=GSOption()))
+        for dev, (intensities, phases) in zip(autd.geometry(), cached, strict=True):
+            intensities_e, phases_e = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, intensities_e)
+            assert np.array_equal(phases, phases_e)
+
+        jittered = [(p + 1e-5, a) for p, a in foci]
+        _ = cache.get(GS(foci=jittered, option=GSOption()))
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.nbytes == 2 * autd.num_transducers()
+
+        _ = cache.get(GS(foci=foci, option=GSOption(repeat=10)))
+        _ = cache.get(Naive(foci=foci, option=NaiveOption()))
+        assert (cache.misses, cache.evictions, len(cache)) == (3, 1, 2)
+
+        autd.environment.sound_speed = 350e3
+        _ = cache.get(Naive(foci=foci, option=NaiveOption()))
+        assert (cache.misses, len(cache)) == (4, 1)
+
+        autd.geometry().reconfigure(lambda dev: AUTD3(pos=[0.0, 0.0, 10.0 * dev.idx()], rot=dev.rotation()))
+        _ = cache.get(Naive(foci=foci, option=NaiveOption()))
+        assert (cache.misses, len(cache)) == (5, 1)
+
+    with create_controller() as autd, HoloCache(autd, max_bytes=autd.num_transducers() * 2) as cache:
+        _ = cache.get(Naive(foci=foci, option=NaiveOption()))
+        _ = cache.get(GS(foci=foci, option=GSOption()))
+        assert (len(cache), cache.evictions) == (1, 1)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        _ = HoloCache(autd, max_entries=0)
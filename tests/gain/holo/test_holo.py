@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import GainSTM, GainSTMOption, SamplingConfig, Segment, WithSegment, transition_mode
+from pyautd3.gain.holo import GS, GSPAT, GSOption, GSPATOption, Naive, NaiveOption, Pa
+from pyautd3.native_methods.autd3capi_driver import GainPtr
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+@pytest.mark.parametrize(
+    ("cls", "option"),
+    [(GS, GSOption()), (GSPAT, GSPATOption()), (Naive, NaiveOption())],
+)
+def test_holo_batch(cls: type[GS | GSPAT | Naive], option: GSOption | GSPATOption | NaiveOption):
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        size = 4
+        shift = np.linspace(0.0, 10.0, size)
+        points = np.tile(autd.center() + np.array([0.0, 0.0, 150.0]), (size, 2, 1))
+        points[:, 0, 0] += shift - 30.0
+        points[:, 1, 0] += shift + 30.0
+        amps = np.full((size, 2), 5e3)
+
+        stm = cls.batch(points, amps, option, SamplingConfig(0xFFFF), GainSTMOption())
+        assert isinstance(stm, GainSTM)
+        assert len(stm.gains) == size
+        assert stm.config == SamplingConfig(0xFFFF)
+        autd.send(stm)
+        for i in range(size):
+            expected = cls(foci=[(p, a * Pa) for p, a in zip(points[i], amps[i], strict=True)], option=option)
+            autd.send(WithSegment(inner=expected, segment=Segment.S1, transition_mode=transition_mode.Later()))
+            for dev in autd.geometry():
+                intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, i)
+                intensities_e, phases_e = autd.link().drives_at(dev.idx(), Segment.S1, 0)
+                assert np.array_equal(intensities, intensities_e)
+                assert np.array_equal(phases, phases_e)
+
+        stm = cls.batch(points, 5e3 * Pa, option, SamplingConfig(0xFFFF))
+        frame = stm.gains[1]
+        assert isinstance(frame, cls)
+        assert frame.iterations is None
+        foci = frame.foci
+        assert len(foci) == 2
+        assert np.allclose(foci[0][0], points[1, 0])
+        assert foci[0][1].pascal() == 5e3
+
+        with pytest.raises(ValueError, match="points must have shape"):
+            _ = cls.batch(points[0], amps[0], option, SamplingConfig(0xFFFF))
+        with pytest.raises(ValueError, match="tol requires a NumpyBackend"):
+            _ = cls.batch(points, amps, option, SamplingConfig(0xFFFF), tol=1e-3)
+
+
+def test_holo_batch_repeat():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        points = np.tile(autd.center() + np.array([0.0, 0.0, 150.0]), (3, 2, 1))
+        points[:, 0, 0] -= 30.0
+        points[:, 1, 0] += 30.0
+        option = GSOption(repeat=50)
+        stm = GS.batch(points, 5e3 * Pa, option, SamplingConfig(0xFFFF), repeat=[1, 2, 3])
+        assert [g.option.repeat for g in stm.gains] == [1, 2, 3]  # type: ignore[missing-attribute]
+        assert option.repeat == 50
+        autd.send(stm)
+        for i, r in enumerate([1, 2, 3]):
+            autd.send(
+                WithSegment(
+                    inner=GS(foci=[(p, 5e3 * Pa) for p in points[i]], option=GSOption(repeat=r)),
+                    segment=Segment.S1,
+                    transition_mode=transition_mode.Later(),
+                )
+            )
+            for dev in autd.geometry():
+                assert np.array_equal(autd.link().drives_at(dev.idx(), Segment.S0, i), autd.link().drives_at(dev.idx(), Segment.S1, 0))
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = GS.batch(points, 5e3 * Pa, option, SamplingConfig(0xFFFF), repeat=[1, 0, 3])
+        with pytest.raises(ValueError, match="Naive does not support repeat"):
+            _ = Naive.batch(points, 5e3 * Pa, NaiveOption(), SamplingConfig(0xFFFF), repeat=1)
+
+
+def test_holo_prepare(monkeypatch: pytest.MonkeyPatch):
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        calls = []
+        holo_ptr = GS._holo_ptr
+
+        def counted(self: GS, points: np.ndarray, amps: np.ndarray) -> GainPtr:
+            calls.append(len(amps))
+            return holo_ptr(self, points, amps)
+
+        monkeypatch.setattr(GS, "_holo_ptr", counted)
+        center = autd.center() + np.array([0.0, 0.0, 150.0])
+        gain = GS(foci=[(center, 5e3 * Pa), (center + np.array([20.0, 0.0, 0.0]), 5e3 * Pa)], option=GSOption())
+        autd.send(gain)
+        expected = [autd.link().drives_at(dev.idx(), Segment.S0, 0) for dev in autd.geometry()]
+        calls.clear()
+
+        compiled = autd.prepare(gain)
+        assert len(calls) == 1
+        for _ in range(3):
+            autd.send(compiled)
+        assert len(calls) == 1
+        for dev, (intensities_e, phases_e) in zip(autd.geometry(), expected, strict=True):
+            intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, intensities_e)
+            assert np.array_equal(phases, phases_e)
+
+        stm = autd.prepare(
+            GainSTM(gains=[gain, GS(foci=[(center, 5e3 * Pa)], option=GSOption())], config=SamplingConfig(0xFFFF), option=GainSTMOption())
+        )
+        assert len(calls) == 3
+        autd.send(stm)
+        autd.send(stm)
+        assert len(calls) == 3
+        for dev, (intensities_e, phases_e) in zip(autd.geometry(), expected, strict=True):
+            intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, intensities_e)
+            assert np.array_equal(phases, phases_e)
+
+        autd.environment.sound_speed = 350e3
+        autd.send(compiled)
+        assert len(calls) == 4
+        autd.send(compiled)
+        assert len(calls) == 4
+        autd.send(gain)
+        expected = [autd.link().drives_at(dev.idx(), Segment.S0, 0) for dev in autd.geometry()]
+        autd.send(compiled)
+        for dev, (intensities_e, phases_e) in zip(autd.geometry(), expected, strict=True):
+            intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, intensities_e)
+            assert np.array_equal(phases, phases_e)
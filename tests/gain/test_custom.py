@@ -2,6 +2,7 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 from pyautd3 import Controller, Segment
 from pyautd3.driver.firmware.fpga import Drive, Intensity, Phase
@@ -38,3 +39,38 @@ def test_custom():
         assert phases[-1] == 0x91
         assert np.all(intensities[:-1] == 0)
         assert np.all(phases[:-1] == 0)
+
+
+def test_custom_from_arrays():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        n = autd.num_transducers()
+        phase = np.arange(n, dtype=np.uint16) % 256
+        intensity = (np.arange(n, dtype=np.uint16) * 7) % 256
+
+        autd.send(Custom.from_arrays(phase, intensity))
+        for dev in autd.geometry():
+            intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, intensity[dev.idx() * 249 : (dev.idx() + 1) * 249])
+            assert np.array_equal(phases, phase[dev.idx() * 249 : (dev.idx() + 1) * 249])
+
+        autd.send(Custom.from_arrays([np.full(249, 0x10), np.full(249, 0x20)], [np.full(249, 0x30), np.full(249, 0x40)]))
+        intensities, phases = autd.link().drives_at(0, Segment.S0, 0)
+        assert np.all(intensities == 0x30)
+        assert np.all(phases == 0x10)
+        intensities, phases = autd.link().drives_at(1, Segment.S0, 0)
+        assert np.all(intensities == 0x40)
+        assert np.all(phases == 0x20)
+
+
+def test_custom_from_arrays_invalid():
+    with pytest.raises(TypeError):
+        _ = Custom.from_arrays(np.zeros(249, dtype=np.float32), np.zeros(249, dtype=np.uint8))
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = Custom.from_arrays(np.full(249, 256), np.zeros(249, dtype=np.uint8))
+    with pytest.raises(ValueError, match="same number of elements"):
+        _ = Custom.from_arrays(np.zeros(249, dtype=np.uint8), np.zeros(248, dtype=np.uint8))
+
+    autd: Controller[Audit]
+    with create_controller() as autd, pytest.raises(ValueError, match="does not match the number of transducers"):
+        autd.send(Custom.from_arrays(np.zeros(249, dtype=np.uint8), np.zeros(249, dtype=np.uint8)))
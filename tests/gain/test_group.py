@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pytest
 
-from pyautd3 import Controller, Device, Segment, Transducer
+from pyautd3 import AUTD3, Controller, Device, Segment, Transducer
 from pyautd3.autd_error import AUTDError
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
 from pyautd3.driver.firmware.fpga.phase import Phase
@@ -76,3 +76,54 @@ def test_group_check_only_for_enabled():
         intensities, phases = autd.link().drives_at(1, Segment.S0, 0)
         assert np.all(intensities == 0x80)
         assert np.all(phases == 0x90)
+
+
+def test_group_from_labels():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        cx = autd.center()[0]
+        left = autd.positions()[:, 0] < cx
+        labels = np.where(left, 7, 3)
+        labels[:10] = -1
+
+        g = Group.from_labels(
+            labels, {7: Uniform(intensity=Intensity(0x80), phase=Phase(0x90)), 3: Uniform(intensity=Intensity(0x20), phase=Phase(0))}
+        )
+        autd.send(g)
+        expected = np.where(left, 0x80, 0x20)
+        expected[:10] = 0
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, expected[dev.idx() * 249 : (dev.idx() + 1) * 249])
+
+        cache = g._cache
+        g.gain_map[3] = Null()
+        autd.send(g)
+        assert g._cache is cache
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, np.where(expected == 0x20, 0, expected)[dev.idx() * 249 : (dev.idx() + 1) * 249])
+
+        autd.reconfigure(lambda dev: AUTD3(pos=[0.0, 0.0, 0.0], rot=dev.rotation()))
+        autd.send(g)
+        assert g._cache is not cache
+
+        autd.send(Group.from_labels([np.full(249, -1), np.zeros(249, dtype=np.int64)], {0: Uniform(intensity=Intensity(0x40), phase=Phase(0))}))
+        intensities, _ = autd.link().drives_at(0, Segment.S0, 0)
+        assert np.all(intensities == 0)
+        intensities, _ = autd.link().drives_at(1, Segment.S0, 0)
+        assert np.all(intensities == 0x40)
+
+        autd.send(Group.from_labels(np.where(np.arange(249) % 2 == 1, 1, -1), {1: Uniform(intensity=Intensity(0x30), phase=Phase(0))}))
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensities, np.where(np.arange(249) % 2 == 1, 0x30, 0))
+
+        with pytest.raises(AUTDError, match="Unknown group key"):
+            autd.send(Group.from_labels(np.zeros(498, dtype=np.int32), {1: Null()}))
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(Group.from_labels(np.zeros(10, dtype=np.int32), {0: Null()}))
+        with pytest.raises(TypeError):
+            _ = Group.from_labels(np.zeros(498), {0: Null()})
+        with pytest.raises(ValueError):  # noqa: PT011
+            _ = Group.from_labels(np.full(498, 1 << 40), {0: Null()})
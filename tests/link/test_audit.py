@@ -1,7 +1,49 @@
-from pyautd3 import AUTD3, Controller
+import numpy as np
+
+from pyautd3 import AUTD3, Controller, GainSTM, GainSTMOption, Intensity, Phase, SamplingConfig, Segment
+from pyautd3.gain import Uniform
 from pyautd3.link.audit import Audit
+from tests.test_autd import create_controller
 
 
 def test_audit():
     with Controller.open([AUTD3(pos=[0.0, 0.0, 0.0], rot=[1.0, 0.0, 0.0, 0.0])], Audit()) as _:
         pass
+
+
+def test_audit_drives():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        autd.send(Uniform(intensity=Intensity(0x80), phase=Phase(0x40)))
+        intensities, phases = autd.link().drives(Segment.S0, range(autd.num_devices()))
+        assert intensities.shape == (2, 1, 249)
+        assert intensities.dtype == np.uint8
+        assert np.all(intensities == 0x80)
+        assert np.all(phases == 0x40)
+
+        intensities, phases = autd.link().drives_at(0, Segment.S0, 0)
+        assert intensities.dtype == np.int64
+        assert phases.dtype == np.int64
+        assert intensities.flags.writeable
+        assert np.all(phases + 0xC0 == 0x100)
+
+        size = 5
+        autd.send(
+            GainSTM(
+                gains=[Uniform(intensity=Intensity(i), phase=Phase(0xFF - i)) for i in range(size)],
+                config=SamplingConfig(0xFFFF),
+                option=GainSTMOption(),
+            ),
+        )
+        intensities, phases = autd.link().drives(Segment.S0, range(autd.num_devices()))
+        assert intensities.shape == (2, size, 249)
+        for dev in autd.geometry():
+            for i in range(size):
+                expected_intensities, expected_phases = autd.link().drives_at(dev.idx(), Segment.S0, i)
+                assert np.array_equal(intensities[dev.idx(), i], expected_intensities)
+                assert np.array_equal(phases[dev.idx(), i], expected_phases)
+                assert np.all(intensities[dev.idx(), i] == i)
+                assert np.all(phases[dev.idx(), i] == 0xFF - i)
+
+        intensities, _ = autd.link().drives(Segment.S0, [1])
+        assert intensities.shape == (1, size, 249)
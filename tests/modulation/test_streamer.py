@@ -0,0 +1,78 @@
+import wave
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import Controller, DcSysTime, Duration, SamplingConfig, Segment
+from pyautd3.modulation import ModulationStreamer
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3.link.audit import Audit
+
+
+def test_modulation_streamer_wav(tmp_path: Path):
+    rate = 8000
+    t = np.arange(rate // 10) / rate
+    signal = 0.5 * np.sin(2.0 * np.pi * 100.0 * t)
+    path = tmp_path / "track.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        pcm = np.round(signal * 32767).astype("<i2")
+        f.writeframes(np.stack([pcm, pcm], axis=1).tobytes())
+
+    streamer = ModulationStreamer(path, SamplingConfig.FREQ_4K, chunk_size=150)
+    assert streamer.num_samples() == 400
+    assert len(streamer) == 3
+    assert streamer.chunk_duration(0) == Duration.from_micros(150 * 250)
+    assert streamer.chunk_duration(2) == Duration.from_micros(100 * 250)
+
+    expected = np.round((0.5 * np.sin(2.0 * np.pi * 100.0 * np.arange(400) / 4000) * 0.5 + 0.5) * 255.0)
+    buffer = np.concatenate([streamer.chunk(i) for i in range(len(streamer))])
+    assert np.abs(buffer.astype(np.int32) - expected).max() <= 1
+
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        streamer.play(autd, lead=Duration.from_millis(1), sys_time=False)
+        for dev in autd.geometry():
+            assert np.array_equal(autd.link().modulation_buffer(dev.idx(), Segment.S1), streamer.chunk(2))
+            assert np.array_equal(autd.link().modulation_buffer(dev.idx(), Segment.S0), streamer.chunk(1))
+            assert autd.link().modulation_frequency_divide(dev.idx(), Segment.S1) == 10
+            assert autd.link().modulation_loop_count(dev.idx(), Segment.S1) == 0
+
+    with create_controller() as autd:
+        for i in range(2):
+            autd.send(streamer.datagram(i, DcSysTime(1_000_000_000)))
+            assert np.array_equal(autd.link().modulation_buffer(0, Segment.S1 if i % 2 == 0 else Segment.S0), streamer.chunk(i))
+
+    with pytest.raises(IndexError):
+        _ = streamer.chunk(3)
+
+
+def test_modulation_streamer_raw(tmp_path: Path):
+    path = tmp_path / "track.pcm"
+    np.array([-1.0, 0.0, 1.0, 0.0, -1.0], dtype=np.float32).tofile(path)
+    streamer = ModulationStreamer(path, SamplingConfig.FREQ_4K, rate=8000, dtype=np.float32, chunk_size=2)
+    assert streamer.num_samples() == 4
+    assert np.array_equal(np.concatenate([streamer.chunk(0), streamer.chunk(1)]), [0, 255, 0, 0])
+
+    start = DcSysTime(1_000_000)
+    assert streamer.datagram(1, start).segment == Segment.S0
+    assert streamer.datagram(1, start, first_segment=Segment.S0).segment == Segment.S1
+
+    streamer = ModulationStreamer(np.zeros(5), SamplingConfig.FREQ_4K, rate=4000, chunk_size=4)
+    assert streamer.num_samples() == 6
+    assert len(streamer.chunk(1)) == 2
+
+    with pytest.raises(ValueError, match="rate is required"):
+        _ = ModulationStreamer(path, SamplingConfig.FREQ_4K)
+    with pytest.raises(ValueError, match="chunk_size"):
+        _ = ModulationStreamer(np.zeros(10), SamplingConfig.FREQ_4K, rate=4000, chunk_size=1)
+    bad = tmp_path / "bad.wav"
+    bad.write_bytes(b"0" * 16)
+    with pytest.raises(ValueError, match="not a RIFF/WAVE file"):
+        _ = ModulationStreamer(bad, SamplingConfig.FREQ_4K)
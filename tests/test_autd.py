@@ -2,14 +2,14 @@ import numpy as np
 import pytest
 
 from pyautd3 import *  # noqa: F403
-from pyautd3 import AUTD3, Clear, Controller, ForceFan, Segment
+from pyautd3 import AUTD3, Clear, Controller, FociSTM, ForceFan, SamplingConfig, Segment, WithSegment, transition_mode
 from pyautd3.autd_error import AUTDError, InvalidDatagramTypeError
 from pyautd3.controller.controller import SenderOption
 from pyautd3.driver.datagram import Synchronize
 from pyautd3.driver.firmware.fpga.emit_intensity import Intensity
 from pyautd3.driver.firmware.fpga.phase import Phase
 from pyautd3.driver.firmware_version import FirmwareInfo
-from pyautd3.gain import Uniform
+from pyautd3.gain import GainGroup, Null, Uniform
 from pyautd3.link.audit import Audit
 from pyautd3.modulation import Static
 from pyautd3.native_methods.autd3capi import NativeMethods as Base
@@ -81,6 +81,53 @@ def test_send_single():
         autd.link().repair()
 
 
+def test_send_async():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        futures = [autd.send_async(Uniform(intensity=Intensity(i), phase=Phase(0))) for i in range(1, 11)]
+        for f in futures:
+            assert f.result() is None
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.all(intensities == 10)
+
+        autd.sender(SenderOption()).send_async((Static(intensity=0x80), Null())).result()
+        for dev in autd.geometry():
+            assert np.all(autd.link().modulation_buffer(dev.idx(), Segment.S0) == 0x80)
+
+        with pytest.raises(InvalidDatagramTypeError):
+            autd.send_async(0)
+
+        gain = Uniform(intensity=Intensity(0x10), phase=Phase(0))
+        with autd._worker.lock:
+            future = autd.send_async(gain)
+            gain.intensity = Intensity(0x20)
+        future.result()
+        for dev in autd.geometry():
+            intensities, _ = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.all(intensities == 0x10)
+
+        autd.link().break_down()
+        with pytest.raises(AUTDError) as e:
+            autd.send_async(Static()).result()
+        assert str(e.value) == "broken"
+        autd.link().repair()
+
+        future = autd.send_async(Static(intensity=0x40))
+        sender = autd.sender(SenderOption())
+    assert future.done()
+    assert future.exception() is None
+    with pytest.raises(AUTDError, match="Controller is closed"):
+        autd.send_async(Static())
+    with pytest.raises(AUTDError, match="Controller is closed"):
+        sender.send(Static())
+    profiles = []
+    sender._profiler = profiles.append
+    with pytest.raises(AUTDError, match="Controller is closed"):
+        sender.send(Static())
+    assert str(profiles[0].error) == "Controller is closed"
+
+
 def test_send_tuple():
     autd: Controller[Audit]
     with create_controller() as autd:
@@ -147,6 +194,13 @@ def test_force_fan():
         assert not autd.link().is_force_fan(0)
         assert autd.link().is_force_fan(1)
 
+        autd.send(ForceFan.from_mask([True, True]))
+        assert autd.link().is_force_fan(0)
+        assert autd.link().is_force_fan(1)
+
+        with pytest.raises(ValueError, match="does not match"):
+            autd.send(ForceFan.from_mask([True]))
+
 
 def test_geometry():
     autd: Controller[Audit]
@@ -165,3 +219,65 @@ def test_sender_option():
         )
         autd.default_sender_option = option
         assert option == autd.default_sender_option
+
+
+def test_prepare():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        g = GainGroup(
+            key_map=lambda dev: lambda _tr: "uniform" if dev.idx() == 0 else "null",
+            gain_map={"uniform": Uniform(intensity=Intensity(0x80), phase=Phase(0x90)), "null": Null()},
+        )
+        compiled = autd.prepare(g)
+        assert compiled.inner is g
+        assert compiled.is_valid()
+        for _ in range(3):
+            autd.send(compiled)
+            intensities, phases = autd.link().drives_at(0, Segment.S0, 0)
+            assert np.all(intensities == 0x80)
+            assert np.all(phases == 0x90)
+            intensities, phases = autd.link().drives_at(1, Segment.S0, 0)
+            assert np.all(intensities == 0)
+            assert np.all(phases == 0)
+
+        stm = WithSegment(
+            FociSTM([autd.center() + np.array([0, 0, 150]), autd.center() + np.array([0, 0, 160])], SamplingConfig(0xFFFF)),
+            Segment.S1,
+            transition_mode.Immediate(),
+        ).compile(autd)
+        autd.send((Static(), stm))
+        autd.send(stm)
+        assert autd.link().stm_cycle(0, Segment.S1) == 2
+        assert autd.link().current_stm_segment(0) == Segment.S1
+
+
+def test_prepare_invalidate():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        compiled = autd.prepare(Uniform(intensity=Intensity(0x80), phase=Phase(0x90)))
+        assert compiled.is_valid()
+
+        autd.environment.sound_speed = 350e3
+        assert not compiled.is_valid()
+        autd.send(compiled)
+        assert compiled.is_valid()
+
+        autd.reconfigure(
+            lambda dev: (
+                AUTD3(pos=[0.0, 0.0, 0.0], rot=[1.0, 0.0, 0.0, 0.0]) if dev.idx() == 0 else AUTD3(pos=[1.0, 0.0, 0.0], rot=[1.0, 0.0, 0.0, 0.0])
+            )
+        )
+        assert not compiled.is_valid()
+        autd.send(compiled)
+        assert compiled.is_valid()
+        for dev in autd.geometry():
+            intensities, phases = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.all(intensities == 0x80)
+            assert np.all(phases == 0x90)
+
+        with create_controller() as autd2:
+            assert compiled.compile(autd2) is not compiled
+            assert compiled.compile(autd) is compiled
+            autd2.send(compiled)
+            intensities, _ = autd2.link().drives_at(0, Segment.S0, 0)
+            assert np.all(intensities == 0x80)
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from pyautd3 import AUTD3, Controller, FociSTM, GainSTM, GainSTMOption, Hz, Intensity, Phase, Segment, Silencer, Uniform
+from pyautd3.controller import ControllerGroup
+from pyautd3.driver.firmware.fpga import Drive
+from pyautd3.gain import Custom, Focus, FocusOption, GainGroup
+from pyautd3.gain.holo import GS, EmissionConstraint, GSOption, Pa
+from pyautd3.link.audit import Audit
+from pyautd3.modulation import Static
+
+POSITIONS = [[0.0, 0.0, 0.0], [AUTD3.DEVICE_WIDTH, 0.0, 0.0], [0.0, AUTD3.DEVICE_HEIGHT, 0.0]]
+
+
+def create_group() -> ControllerGroup:
+    return ControllerGroup(
+        [
+            Controller.open([AUTD3(pos=POSITIONS[0])], Audit()),
+            Controller.open([AUTD3(pos=POSITIONS[1]), AUTD3(pos=POSITIONS[2])], Audit()),
+        ],
+    )
+
+
+def drives(group: ControllerGroup, segment: Segment = Segment.S0, idx: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    res = [c.link().drives_at(dev.idx(), segment, idx) for c in group.controllers() for dev in c]  # type: ignore[attr-defined]
+    return np.concatenate([i.ravel() for i, _ in res]), np.concatenate([p.ravel() for _, p in res])
+
+
+def test_controller_group_geometry():
+    with create_group() as group:
+        assert len(group) == 2
+        assert group.num_devices() == 3
+        assert group.num_transducers() == 3 * 249
+        assert group.locate(0) == (0, 0)
+        assert group.locate(2) == (1, 1)
+        assert group.locate(-1) == (1, 1)
+        assert group[2].idx() == 1
+        assert [dev.idx() for dev in group] == [0, 0, 1]
+        assert group.transducer_ranges() == [(0, 249), (249, 747)]
+        assert group.positions().shape == (747, 3)
+        assert group.directions().shape == (747, 3)
+        assert np.array_equal(group.device_indices(), np.repeat([0, 1, 2], 249))
+        with pytest.raises(IndexError):
+            group.locate(3)
+
+    with pytest.raises(ValueError, match="at least one"):
+        ControllerGroup([])
+
+
+def test_controller_group_send_gain():
+    with create_group() as group, Controller.open([AUTD3(pos=p) for p in POSITIONS], Audit()) as single:
+        single.send(Silencer.disable())
+        group.send(Silencer.disable())
+        center = group.center() + np.array([0.0, 0.0, 150.0])
+
+        for gain in [
+            Focus(pos=center, option=FocusOption()),
+            GS(
+                foci=[(center, 5e3 * Pa), (center + np.array([20.0, 0.0, 0.0]), 5e3 * Pa)],
+                option=GSOption(constraint=EmissionConstraint.Uniform(Intensity(0xFF))),
+            ),
+        ]:
+            single.send(gain)
+            group.send((Static(), gain))
+            expect_i, expect_p = single.link().drives(Segment.S0, range(3))
+            intensity, phase = drives(group)
+            assert np.array_equal(intensity, expect_i.ravel())
+            assert np.array_equal(phase, expect_p.ravel())
+
+        phase = np.arange(747) % 256
+        group.send(Custom.from_arrays(phase=phase, intensity=np.full(747, 0x80)))
+        intensity, actual = drives(group)
+        assert np.all(intensity == 0x80)
+        assert np.array_equal(actual, phase)
+
+        with pytest.raises(ValueError, match="does not match"):
+            group.send(Custom.from_arrays(phase=[0], intensity=[0]))
+
+        group.controllers()[1].environment.sound_speed = 300e3
+        with pytest.raises(ValueError, match="same sound speed"):
+            group.send(GS(foci=[(center, 5e3 * Pa)], option=GSOption()))
+        group.send(Focus(pos=center, option=FocusOption()))
+        group.controllers()[1].environment.sound_speed = group.controllers()[0].environment.sound_speed
+        group.send(GS(foci=[(center, 5e3 * Pa)], option=GSOption()))
+
+
+def test_controller_group_world_gains_unsplit():
+    with create_group() as group:
+        center = group.center() + np.array([0.0, 0.0, 150.0])
+        focus = Focus(pos=center, option=FocusOption())
+        assert group._split(focus) == [focus, focus]
+        stm = GainSTM(gains=[focus, Uniform(intensity=Intensity(0x80), phase=Phase(0))], config=1.0 * Hz, option=GainSTMOption())
+        assert group._split(stm) == [stm, stm]
+        group.send((Static(), focus))
+        group.send(stm)
+        assert group._shadow._controller is None
+
+        for gain in [
+            GS(foci=[(center, 5e3 * Pa)], option=GSOption()),
+            GainGroup(lambda _dev: lambda _tr: 0, {0: focus}),
+            Custom(lambda _dev: lambda _tr: Drive(phase=Phase(0), intensity=Intensity(0x80))),
+        ]:
+            shards = group._split(gain)
+            assert all(isinstance(s, Custom) for s in shards)
+            assert shards[0] is not gain
+        shards = group._split(GainSTM(gains=[focus, GS(foci=[(center, 5e3 * Pa)], option=GSOption())], config=1.0 * Hz, option=GainSTMOption()))
+        assert all(isinstance(s, GainSTM) and all(isinstance(g, Custom) for g in s.gains) for s in shards)
+
+
+def test_controller_group_send_stm():
+    with create_group() as group:
+        group.send(Silencer.disable())
+        gains = [Uniform(intensity=Intensity(0x80), phase=Phase(i)) for i in range(2)]
+        group.send(GainSTM(gains=gains, config=1.0 * Hz, option=GainSTMOption()))
+        for i in range(2):
+            intensity, phase = drives(group, idx=i)
+            assert np.all(phase == i)
+
+        group.send(FociSTM(foci=[group.center(), group.center() + np.array([0.0, 0.0, 10.0])], config=1.0 * Hz))
+        for c in group.controllers():
+            assert c.link().stm_cycle(0, Segment.S0) == 2  # type: ignore[attr-defined]
+
+        gains = [Uniform(intensity=Intensity(0x81), phase=Phase(0x82 + i)) for i in range(2)]
+        start = group.send_at(GainSTM(gains=gains, config=1.0 * Hz, option=GainSTMOption()), Segment.S1)
+        assert start is not None
+        for i in range(2):
+            intensity, phase = drives(group, Segment.S1, i)
+            assert np.all(intensity == 0x81)
+            assert np.all(phase == 0x82 + i)
+        for c in group.controllers():
+            assert c.link().stm_loop_count(0, Segment.S1) == 0  # type: ignore[attr-defined]
+
+
+def test_controller_group_send_error():
+    with create_group() as group:
+        group.controllers()[1].link().break_down()  # type: ignore[attr-defined]
+        with pytest.raises(Exception, match="broken"):
+            group.send(Static())
+        group.controllers()[1].link().repair()  # type: ignore[attr-defined]
+        group.send(Static())
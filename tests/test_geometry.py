@@ -203,3 +203,64 @@ def test_transducer_axial_direction():
     with create_controller() as autd:
         for dev in autd.geometry():
             assert np.allclose(dev.axial_direction(), [0.0, 0.0, 1.0])
+
+
+def test_geometry_positions():
+    with create_controller() as autd:
+        positions = autd.positions()
+        assert positions.shape == (autd.num_transducers(), 3)
+        assert positions.dtype == np.float32
+        assert not positions.flags.writeable
+        for dev in autd.geometry():
+            for tr in dev:
+                assert np.allclose(positions[dev.idx() * 249 + tr.idx()], tr.position())
+            assert np.array_equal(dev.positions(), positions[dev.idx() * 249 : (dev.idx() + 1) * 249])
+        assert autd.positions() is positions
+
+
+def test_geometry_directions():
+    with create_controller() as autd:
+        directions = autd.directions()
+        assert directions.shape == (autd.num_transducers(), 3)
+        assert np.allclose(directions, [0.0, 0.0, 1.0])
+
+
+def test_geometry_device_indices():
+    with create_controller() as autd:
+        device_indices = autd.device_indices()
+        assert device_indices.shape == (autd.num_transducers(),)
+        assert np.all(device_indices[:249] == 0)
+        assert np.all(device_indices[249:] == 1)
+
+
+def test_geometry_positions_reconfigure():
+    with create_controller() as autd:
+        positions = autd.positions()
+        directions = autd.directions()
+        autd.reconfigure(lambda dev: AUTD3(pos=[0.0, 0.0, 10.0 * dev.idx()], rot=EulerAngles.XYZ(90 * deg, 0 * deg, 0 * deg)))
+        assert autd.positions() is not positions
+        assert np.allclose(autd.positions()[249], [0.0, 0.0, 10.0])
+        assert autd.directions() is not directions
+        assert np.allclose(autd.directions(), [0.0, -1.0, 0.0])
+
+
+def test_geometry_lazy_construction():
+    with create_controller() as autd:
+        assert all(dev is None for dev in autd._devices)
+        dev = autd[-1]
+        assert dev.idx() == 1
+        assert autd[1] is dev
+        assert autd._devices[0] is None
+
+        assert all(tr is None for tr in dev._transducers)
+        tr = dev[-1]
+        assert tr.idx() == 248
+        assert dev[248] is tr
+        assert tr._tr_ptr is None
+        assert np.allclose(tr.position(), [(AUTD3.NUM_TRANS_X - 1) * AUTD3.TRANS_SPACING, (AUTD3.NUM_TRANS_Y - 1) * AUTD3.TRANS_SPACING, 0.0])
+        assert tr._tr_ptr is not None
+
+        with pytest.raises(IndexError):
+            _ = autd[2]
+        with pytest.raises(IndexError):
+            _ = dev[249]
@@ -0,0 +1,129 @@
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import ReadsFPGAState, Segment, SwapSegmentGain
+from pyautd3.autd_error import AUTDError
+from pyautd3.controller import FPGAMonitor
+from pyautd3.utils import Duration
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.driver.firmware.fpga import FPGAState
+    from pyautd3.link.audit import Audit
+
+
+def test_fpga_monitor_poll():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        monitor = FPGAMonitor(autd, capacity=3)
+        assert monitor.latest() is None
+        assert monitor.latest_raw() is None
+
+        thermal: list[tuple[int, FPGAState | None, FPGAState | None]] = []
+        segments: list[int] = []
+        changes: list[int] = []
+        monitor.on_thermal_assert(lambda dev_idx, prev, cur: thermal.append((dev_idx, prev, cur)))
+        monitor.on_segment_change(lambda dev_idx, _prev, _cur: segments.append(dev_idx))
+        monitor.on_change(lambda dev_idx, _prev, _cur: changes.append(dev_idx))
+
+        monitor.poll()
+        assert monitor.latest() == [None, None]
+
+        autd.send(ReadsFPGAState.from_mask([True, True]))
+        autd.link().assert_thermal_sensor(1)
+        states = monitor.poll()
+        assert states is not None
+        assert not states.flags.writeable
+        latest = monitor.latest()
+        assert latest is not None
+        assert latest[0] is not None
+        assert not latest[0].is_thermal_assert()
+        assert latest[1] is not None
+        assert latest[1].is_thermal_assert()
+        assert [t[0] for t in thermal] == [1]
+        assert thermal[0][1] is None
+        assert changes == [0, 1]
+        assert segments == []
+
+        autd.send(SwapSegmentGain(Segment.S1))
+        monitor.poll()
+        assert segments == [0, 1]
+        assert len(thermal) == 1
+
+        monitor.poll()
+        assert len(monitor) == 3
+        assert monitor.polls == 4
+        timestamps, history = monitor.history()
+        assert history.shape == (3, 2)
+        assert np.all(np.diff(timestamps) >= 0)
+        assert np.array_equal(history[-1], monitor.latest_raw())
+        assert history[0, 1] != -1
+
+        autd.link().break_down()
+        assert monitor.poll() is None
+        assert monitor.errors == 1
+        assert monitor.last_error is not None
+        autd.link().repair()
+
+        with pytest.raises(ValueError, match="capacity"):
+            FPGAMonitor(autd, capacity=0)
+
+
+def test_fpga_monitor_thread():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        asserted: list[int] = []
+        with FPGAMonitor(autd, interval=Duration.from_millis(1)) as monitor:
+            monitor.on_thermal_assert(lambda dev_idx, _prev, _cur: asserted.append(dev_idx))
+            assert monitor.is_running()
+            deadline = time.monotonic() + 5.0
+            while monitor.latest() is None and time.monotonic() < deadline:
+                time.sleep(0.001)
+            autd.link().assert_thermal_sensor(0)
+            while not asserted and time.monotonic() < deadline:
+                time.sleep(0.001)
+        assert not monitor.is_running()
+        assert asserted == [0]
+        latest = monitor.latest()
+        assert latest is not None
+        assert latest[0] is not None
+        assert latest[0].is_thermal_assert()
+
+
+def test_fpga_monitor_controller_closed():
+    autd = create_controller()
+    monitor = FPGAMonitor(autd, interval=Duration.from_millis(1))
+    monitor.start()
+    deadline = time.monotonic() + 5.0
+    while monitor.polls < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    autd.close()
+    assert not monitor.is_running()
+    assert not autd._monitors
+    assert monitor.errors == 0
+
+    assert monitor.poll() is None
+    assert monitor.errors == 1
+    assert str(monitor.last_error) == "Controller is closed"
+    with pytest.raises(AUTDError, match="Controller is closed"):
+        monitor.start()
+    assert not monitor.is_running()
+
+
+def test_fpga_monitor_close_from_callback():
+    autd = create_controller()
+    monitor = FPGAMonitor(autd, interval=Duration.from_millis(1))
+    monitor.on_thermal_assert(lambda _dev_idx, _prev, _cur: autd.close())
+    monitor.start()
+    deadline = time.monotonic() + 5.0
+    while monitor.latest() is None and time.monotonic() < deadline:
+        time.sleep(0.001)
+    autd.link().assert_thermal_sensor(0)
+    while monitor.is_running() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert not monitor.is_running()
+    assert autd._disposed
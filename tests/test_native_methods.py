@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+
+def test_import_is_lazy():
+    code = (
+        "import pyautd3, pyautd3.gain.holo\n"
+        "from pyautd3.native_methods import autd3capi, autd3capi_gain_holo\n"
+        "assert autd3capi.NativeMethods().dll._dll is None\n"
+        "assert autd3capi_gain_holo.NativeMethods().dll._dll is None\n"
+        "assert pyautd3.SamplingConfig.FREQ_4K.divide == 10\n"
+        "assert autd3capi.NativeMethods().dll._dll is not None\n"
+        "assert autd3capi_gain_holo.NativeMethods().dll._dll is None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
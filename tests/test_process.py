@@ -0,0 +1,96 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pyautd3 import AUTD3, Controller, ForceFan, Hz, Segment, Silencer
+from pyautd3.autd_error import AUTDError
+from pyautd3.controller import ControllerProcess
+from pyautd3.link.audit import Audit
+from pyautd3.modulation import Static
+from pyautd3.utils import Duration
+
+
+def _drives(autd: Controller[Audit]) -> tuple[np.ndarray, np.ndarray]:
+    intensity, phase = autd.link().drives(Segment.S0, range(autd.num_devices()))
+    return intensity.ravel(), phase.ravel()
+
+
+def _modulation(autd: Controller[Audit]) -> np.ndarray:
+    return autd.link().modulation_buffer(0, Segment.S0)
+
+
+def _stm(autd: Controller[Audit]) -> tuple[int, int]:
+    return autd.link().stm_cycle(0, Segment.S0), autd.link().stm_freqency_divide(0, Segment.S0)
+
+
+def _break(autd: Controller[Audit]) -> None:
+    autd.link().break_down()
+
+
+def _repair(autd: Controller[Audit]) -> int:
+    autd.link().repair()
+    return autd.num_devices()
+
+
+def _fail(_: Controller[Audit]) -> None:
+    msg = "call failed"
+    raise ValueError(msg)
+
+
+def test_controller_process():
+    with ControllerProcess([AUTD3(), AUTD3()], Audit, slots=2, slot_size=4096) as host:
+        assert host.is_alive()
+        assert host.num_devices() == 2
+        assert host.num_transducers() == 2 * 249
+
+        host.send(Silencer.disable())
+
+        for i in range(5):
+            phase = (np.arange(host.num_transducers()) + i) % 256
+            host.send_drives(phase, np.full(host.num_transducers(), 0x80))
+        host.wait()
+        assert host.pending == 0
+        intensity, phase = host.call(_drives)
+        assert np.all(intensity == 0x80)
+        assert np.array_equal(phase, (np.arange(host.num_transducers()) + 4) % 256)
+
+        buffer = np.arange(100, dtype=np.uint8)
+        host.send_modulation(buffer, 4000.0 * Hz)
+        assert np.array_equal(host.call(_modulation), buffer)
+
+        host.send_foci(np.zeros((10, 3)), 1.0 * Hz, intensity=0xFF)
+        cycle, _ = host.call(_stm)
+        assert cycle == 10
+
+        assert host.stats.count == 8
+        assert host.stats.errors == 0
+
+        with pytest.raises(ValueError, match="exceeds slot_size"):
+            host.send_modulation(np.zeros(8192, dtype=np.uint8), 4000.0 * Hz)
+        with pytest.raises(ValueError, match="must have"):
+            host.send_drives([0], [0])
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            host.send(ForceFan(lambda _: True))
+        assert host.pending == 0
+
+        host.send(Static(intensity=0x80))
+        host.call(_break)
+        seq = host.send(Static())
+        with pytest.raises(AUTDError, match="broken"):
+            host.wait(seq, timeout=Duration.from_secs(10))
+        assert host.stats.errors == 1
+
+        seq = host.send(Static())
+        assert host.call(_repair) == 2
+        assert not host._results
+        with pytest.raises(AUTDError, match="broken"):
+            host.wait(seq, timeout=Duration.from_secs(10))
+        with pytest.raises(ValueError, match="call failed"):
+            host.call(_fail)
+        assert not host._results
+        host.wait(timeout=Duration.from_secs(10))
+
+    assert not host.is_alive()
+    with pytest.raises(AUTDError, match="closed"):
+        host.send(Static())
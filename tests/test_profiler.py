@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyautd3.autd_error import AUTDError, InvalidDatagramTypeError
+from pyautd3.controller import SendProfile, SendProfiler
+from pyautd3.gain import Null
+from pyautd3.modulation import Static
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+def test_profiler_callback():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        profiles: list[SendProfile] = []
+        autd.set_profiler(profiles.append)
+
+        autd.send(Static())
+        autd.send((Static(), Null()))
+        autd.send_async(Null()).result()
+        assert [p.datagram for p in profiles] == ["Static", "Static+Null", "Null"]
+        assert all(p.is_ok() for p in profiles)
+        assert all(p.build_ns >= 0 and p.send_ns > 0 for p in profiles)
+        assert all(p.total_ns() == p.build_ns + p.send_ns for p in profiles)
+
+        autd.link().break_down()
+        with pytest.raises(AUTDError):
+            autd.send(Static())
+        autd.link().repair()
+        assert isinstance(profiles[-1].error, AUTDError)
+        assert not profiles[-1].is_ok()
+
+        with pytest.raises(InvalidDatagramTypeError):
+            autd.send(0)
+        assert isinstance(profiles[-1].error, InvalidDatagramTypeError)
+        assert profiles[-1].send_ns == 0
+
+        autd.set_profiler(None)
+        autd.send(Static())
+        assert len(profiles) == 5
+
+        def failing(_: SendProfile) -> None:
+            raise RuntimeError
+
+        autd.set_profiler(failing)
+        autd.link().break_down()
+        with pytest.raises(AUTDError):
+            autd.send(Static())
+        with pytest.raises(AUTDError):
+            autd.send_async(Static()).result()
+        autd.link().repair()
+        with pytest.raises(InvalidDatagramTypeError):
+            autd.send_async(0)
+        with pytest.raises(RuntimeError):
+            autd.send(Static())
+
+
+def test_profiler_aggregate():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        with autd.profile() as profiler:
+            for _ in range(3):
+                autd.send(Static())
+            autd.send(Null())
+            autd.link().break_down()
+            with pytest.raises(AUTDError):
+                autd.send(Null())
+            autd.link().repair()
+        autd.send(Static())
+
+        total = profiler.total()
+        assert total.count == 5
+        assert total.errors == 1
+        assert total.max_send_ns >= total.mean_send_ns() > 0
+        assert total.max_build_ns >= total.mean_build_ns() >= 0
+        stats = profiler.by_datagram()
+        assert stats["Static"].count == 3
+        assert stats["Null"].count == 2
+        assert stats["Null"].errors == 1
+        last = profiler.last()
+        assert last is not None
+        assert last.datagram == "Null"
+
+        profiler.reset()
+        assert profiler.total().count == 0
+        assert profiler.total().mean_send_ns() == 0.0
+        assert profiler.last() is None
+        assert autd._profiler is None
+
+        nested = SendProfiler()
+        autd.set_profiler(nested)
+        with autd.profile():
+            autd.send(Static())
+        autd.send(Static())
+        assert nested.total().count == 1
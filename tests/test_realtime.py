@@ -0,0 +1,79 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from pyautd3 import AUTD3, Controller, Hz, Nop
+from pyautd3.controller import OverrunPolicy, SenderOption
+from pyautd3.driver.datagram.datagram import Datagram
+from pyautd3.modulation import Static
+from pyautd3.utils import Duration
+
+OPTION = SenderOption(send_interval=None, receive_interval=None)
+
+
+def test_run_at():
+    with Controller.open([AUTD3()], Nop()) as autd:
+        times: list[float] = []
+
+        def fn(t: float) -> Datagram:
+            times.append(t)
+            return Static()
+
+        stats = autd.run_at(1000 * Hz, fn, iterations=20, option=OPTION)
+        assert stats.iterations == 20
+        assert stats.period_ns == 1_000_000
+        assert len(stats.latency_ns) == 20
+        assert len(stats.jitter_ns) == 20
+        assert times[0] == 0.0
+        assert all(b > a for a, b in itertools.pairwise(times))
+        assert stats.elapsed_ns >= 19 * stats.period_ns
+        assert set(stats.latency_percentiles()) == {50.0, 90.0, 99.0, 99.9}
+        assert stats.jitter_percentiles((50.0,))[50.0] >= 0
+        assert stats.rate_hz() > 0
+
+        assert stats.max_latency_ns == stats.latency_ns.max()
+        assert stats.max_jitter_ns == stats.jitter_ns.max()
+
+        stats = autd.run_at(1000 * Hz, fn, iterations=20, option=OPTION, capacity=8)
+        assert stats.iterations == 20
+        assert len(stats.latency_ns) == 8
+        assert len(stats.jitter_ns) == 8
+        assert stats.max_latency_ns >= stats.latency_ns.max()
+        assert stats.max_jitter_ns >= stats.jitter_ns.max()
+        assert set(stats.latency_percentiles()) == {50.0, 90.0, 99.0, 99.9}
+
+        stats = autd.run_at(1000.0, lambda t: Static() if t < 0.005 else None, policy=OverrunPolicy.CatchUp, option=OPTION)
+        assert stats.iterations == 5
+
+        stats = autd.run_at(500.0, lambda _: Static(), duration=Duration.from_millis(20), option=OPTION)
+        assert 1 <= stats.iterations <= 10
+
+        stop = threading.Event()
+        stop.set()
+        assert autd.run_at(1000.0, lambda _: Static(), stop=stop).iterations == 0
+
+        with pytest.raises(ValueError, match="rate"):
+            autd.run_at(0.0, lambda _: Static(), iterations=1)
+        with pytest.raises(ValueError, match="capacity"):
+            autd.run_at(1000.0, lambda _: Static(), iterations=1, capacity=0)
+
+
+def test_run_at_overrun():
+    with Controller.open([AUTD3()], Nop()) as autd:
+
+        def slow(t: float) -> Datagram:
+            if t == 0.0:
+                time.sleep(0.0055)
+            return Static()
+
+        skip = autd.run_at(1000.0, slow, iterations=3, policy=OverrunPolicy.Skip, option=OPTION)
+        assert skip.overruns >= 1
+        assert skip.skipped >= 5
+
+        catch_up = autd.run_at(1000.0, slow, iterations=3, policy=OverrunPolicy.CatchUp, option=OPTION)
+        assert catch_up.overruns >= 1
+        assert catch_up.skipped == 0
+        assert catch_up.jitter_ns[1] > 1_000_000
+        assert catch_up.max_jitter_ns >= catch_up.jitter_ns[1]
@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import Focus, FocusOption, Segment
+from pyautd3.driver.geometry import Geometry
+from pyautd3.gain import Custom
+from pyautd3.simulate import T4010A1_AMPLITUDE, Simulator, grid, sphere, t4010a1
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+def test_t4010a1():
+    theta = np.radians(np.array([0.0, 10.0, 20.0, 30.0, 60.0, 90.0, 120.0, 180.0]))
+    d = t4010a1(np.cos(theta))
+    assert np.allclose(d, [1.0, 1.0, 1.0, 0.891250938, 0.354813389, 0.1778318, 0.354813389, 1.0], atol=1e-6)
+    assert t4010a1(np.cos(theta).astype(np.float32)).dtype == np.float32
+    assert np.all(sphere(np.cos(theta)) == 1.0)
+
+
+def test_simulator_single_transducer():
+    autd: Controller[Audit]
+    with create_controller() as autd, Simulator(autd, dtype=np.float64) as sim:
+        intensity = np.zeros(autd.num_transducers(), dtype=np.uint8)
+        phase = np.zeros(autd.num_transducers(), dtype=np.uint8)
+        intensity[0] = 0xFF
+        phase[0] = 64
+        pos = autd[0][0].position()
+        points = pos + np.array([[0.0, 0.0, 100.0], [0.0, 0.0, 200.0], [100.0, 0.0, 100.0]])
+        p = sim.pressure((intensity, phase), points)
+        r = np.linalg.norm(points - pos, axis=1)
+        assert np.allclose(np.abs(p), T4010A1_AMPLITUDE * t4010a1(np.array([1.0, 1.0, np.cos(np.pi / 4)])) / r)
+        assert np.allclose(np.angle(p), np.angle(np.exp(1j * (autd.environment.wavenumber() * r + np.pi / 2))))
+
+
+def test_simulator_gain():
+    autd: Controller[Audit]
+    with create_controller() as autd, Simulator(autd) as sim:
+        focus = autd.center() + np.array([0.0, 0.0, 150.0])
+        g = Focus(pos=focus, option=FocusOption())
+
+        intensity, phase = sim.drives(g)
+        autd.send(g)
+        for dev in autd.geometry():
+            expected_intensity, expected_phase = autd.link().drives_at(dev.idx(), Segment.S0, 0)
+            assert np.array_equal(intensity[dev.idx() * 249 : (dev.idx() + 1) * 249], expected_intensity)
+            assert np.array_equal(phase[dev.idx() * 249 : (dev.idx() + 1) * 249], expected_phase)
+
+        points = grid(np.linspace(focus[0] - 20.0, focus[0] + 20.0, 21), np.linspace(focus[1] - 20.0, focus[1] + 20.0, 21), focus[2])
+        p = sim.pressure(g, points)
+        assert p.shape == (21, 21, 1)
+        assert p.dtype == np.complex64
+        assert np.unravel_index(np.argmax(np.abs(p)), p.shape) == (10, 10, 0)
+        assert np.allclose(sim.pressure((intensity, phase), points), p)
+
+        transfer = sim.transfer(points)
+        assert transfer.shape == (21, 21, 1, autd.num_transducers())
+        q = T4010A1_AMPLITUDE / 255.0 * intensity * np.exp(1j * 2.0 * np.pi * phase / 256.0)
+        assert np.max(np.abs(transfer @ q - p)) < 1e-4 * np.max(np.abs(p))
+
+        with Simulator(autd, dtype=np.float64, chunk_size=7, num_threads=4) as sim64:
+            p64 = sim64.pressure(g, points)
+            assert p64.dtype == np.complex128
+            assert np.max(np.abs(p64 - p)) < 1e-4 * np.max(np.abs(p64))
+
+
+def test_simulator_invalid():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        geometry = Geometry(autd._geometry_ptr)
+        with pytest.raises(ValueError, match="environment is required"):
+            _ = Simulator(geometry)
+        with Simulator(geometry, autd.environment) as sim:
+            with pytest.raises(ValueError, match="does not match"):
+                sim.pressure((np.zeros(10, dtype=np.uint8), np.zeros(10, dtype=np.uint8)), [[0.0, 0.0, 100.0]])
+            with pytest.raises(ValueError, match="points must have shape"):
+                sim.pressure(Custom.from_arrays(np.zeros(498, dtype=np.uint8), np.zeros(498, dtype=np.uint8)), [0.0, 100.0])
+            with pytest.raises(TypeError):
+                sim.pressure(0, [[0.0, 0.0, 100.0]])
@@ -0,0 +1,60 @@
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pyautd3 import Intensity, Phase, Segment, Uniform, WithSegment, transition_mode
+from pyautd3.modulation import Static
+from pyautd3.utils import Duration
+from tests.test_autd import create_controller
+
+if TYPE_CHECKING:
+    from pyautd3 import Controller
+    from pyautd3.link.audit import Audit
+
+
+def test_stream_coalesce():
+    autd: Controller[Audit]
+    with create_controller() as autd:
+        with autd.stream() as stream:
+            with autd._worker.lock:
+                stream.put(Uniform(intensity=Intensity(0x01), phase=Phase(0x00)))
+                deadline = time.monotonic() + 5.0
+                while not stream._in_flight and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                for i in range(2, 5):
+                    stream.put(Uniform(intensity=Intensity(i), phase=Phase(i)))
+                stream.put(Static(intensity=0x80))
+                stream.put(
+                    WithSegment(
+                        inner=Uniform(intensity=Intensity(0x10), phase=Phase(0x10)),
+                        segment=Segment.S0,
+                        transition_mode=transition_mode.Immediate(),
+                    ),
+                )
+            stream.flush(Duration.from_secs(5))
+
+            stats = stream.stats()
+            assert stats.puts == 6
+            assert stats.dropped == 3
+            assert stats.sent == 3
+            assert stats.errors == 0
+            assert stats.max_latency_ns >= stats.last_latency_ns > 0
+            assert stats.mean_latency_ns() > 0
+
+            intensities, phases = autd.link().drives_at(0, Segment.S0, 0)
+            assert np.all(intensities == 0x10)
+            assert np.all(phases == 0x10)
+            assert np.all(autd.link().modulation_buffer(0, Segment.S0) == 0x80)
+
+            autd.link().break_down()
+            stream.put(Static())
+            with pytest.raises(Exception, match="broken"):
+                stream.flush()
+            autd.link().repair()
+            assert stream.stats().errors == 1
+
+        assert stream.is_closed()
+        with pytest.raises(RuntimeError, match="closed"):
+            stream.put(Static())
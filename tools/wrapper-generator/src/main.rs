@@ -182,6 +182,7 @@ impl PythonWrapperGenerator {
 
         if !functions.is_empty() {
             writeln!(w, "import threading")?;
+            writeln!(w, "from collections.abc import Callable")?;
             writeln!(w, "from pathlib import Path")?;
         }
         if !structs.is_empty() || !unions.is_empty() || !functions.is_empty() {
@@ -270,10 +271,31 @@ class Singleton(type):
                     cls._instances[cls] = super().__call__(*args, **kwargs)
         return cls._instances[cls]
 
-class NativeMethods(metaclass=Singleton):
-    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
-        self.dll = ctypes.CDLL(str(bin_location / f'{{bin_prefix}}{}{{bin_ext}}'))",
-            src
+class _LazyDLL:
+    def __init__(self, path: Path, signatures: Callable[[], dict[str, tuple[list, object]]]) -> None:
+        self._path = path
+        self._signatures = signatures
+        self._dll: ctypes.CDLL | None = None
+        self._table: dict[str, tuple[list, object]] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> tuple[ctypes.CDLL, dict[str, tuple[list, object]]]:
+        if self._dll is None or self._table is None:
+            with self._lock:
+                if self._dll is None or self._table is None:
+                    self._table = self._signatures()
+                    self._dll = ctypes.CDLL(str(self._path))
+        return self._dll, self._table
+
+    def __getattr__(self, name: str):
+        dll, table = self._load()
+        func = getattr(dll, name)
+        func.argtypes, func.restype = table[name]
+        setattr(self, name, func)
+        return func
+
+def _signatures() -> dict[str, tuple[list, object]]:
+    return {{"
         )?;
 
         for f in functions {
@@ -283,15 +305,23 @@ class NativeMethods(metaclass=Singleton):
             }
             writeln!(
                 w,
-                r"
-        self.dll.{}.argtypes = [{}]
-        self.dll.{0}.restype = {}",
+                r#"        "{}": ([{}], {}),"#,
                 f.name,
                 args,
                 f.to_python_def_return()?
             )?;
         }
 
+        writeln!(
+            w,
+            r"    }}
+
+class NativeMethods(metaclass=Singleton):
+    def init_dll(self, bin_location: Path, bin_prefix: str, bin_ext: str) -> None:
+        self.dll = _LazyDLL(bin_location / f'{{bin_prefix}}{}{{bin_ext}}', _signatures)",
+            src
+        )?;
+
         for f in functions {
             writeln!(
                 w,